@@ -14,6 +14,8 @@ from .base import (
     AYONAddon,
     AddonsManager,
     load_addons,
+    is_addons_profiling_enabled,
+    is_addons_lazy_mode_enabled,
 )
 
 from .utils import (
@@ -36,6 +38,8 @@ __all__ = (
     "AYONAddon",
     "AddonsManager",
     "load_addons",
+    "is_addons_profiling_enabled",
+    "is_addons_lazy_mode_enabled",
 
     "ensure_addons_are_process_context_ready",
     "ensure_addons_are_process_ready",
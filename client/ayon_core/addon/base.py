@@ -3,7 +3,9 @@
 import copy
 import os
 import sys
+import json
 import time
+import atexit
 import inspect
 import logging
 import threading
@@ -20,11 +22,13 @@ from ayon_core.lib import (
     Logger,
     is_dev_mode_enabled,
     get_launcher_storage_dir,
+    get_launcher_local_dir,
     is_headless_mode_enabled,
 )
 from ayon_core.settings import get_studio_settings
 
 from .interfaces import (
+    AYONInterface,
     IPluginPaths,
     IHostAddon,
 )
@@ -121,13 +125,84 @@ class ProcessContext:
             print(f"Unknown keys in ProcessContext: {unknown_keys}")
 
 
+AddonDirInfo = collections.namedtuple(
+    "AddonDirInfo",
+    ["name", "version", "dirpath", "is_dev"]
+)
+
+
 class _LoadCache:
     addons_lock = threading.Lock()
     addons_loaded = False
+    all_addons_imported = False
     addon_modules = []
+    # Directories of addons available for import
+    addon_dirs = []
+    # Imported modules by addon name
+    modules_by_addon_name = {}
+    # Time spent on import of addon modules by module name
+    import_times = {}
+
+
+def is_addons_profiling_enabled():
+    """Is profiling of addons start-up enabled.
+
+    Profiling is enabled with 'AYON_ADDONS_PROFILE' environment variable
+    set to '1'. Report of time spent by each addon on start-up is printed
+    at the end of process, and stored as JSON to path from
+    'AYON_ADDONS_PROFILE_OUTPUT' environment variable if is set.
+
+    Returns:
+        bool: Profiling is enabled.
 
+    """
+    return os.getenv("AYON_ADDONS_PROFILE") == "1"
+
+
+def is_addons_lazy_mode_enabled():
+    """Are addons imported and initialized lazily.
+
+    Lazy mode is enabled with 'AYON_ADDONS_LAZY' environment variable
+    set to '1'. In lazy mode addon is imported and initialized only when
+    it is requested from 'AddonsManager', e.g. by name, or when
+    the manager needs addons implementing an interface.
+
+    Returns:
+        bool: Lazy mode is enabled.
+
+    """
+    return os.getenv("AYON_ADDONS_LAZY") == "1"
 
-def load_addons(force=False):
+
+# Manager of which profiling report is output at the end of process
+_profiled_manager = None
+_profiled_manager_lock = threading.Lock()
+
+
+def _register_profiling_report(manager):
+    """Output profiling report of first profiled manager at exit.
+
+    Report is registered only once per process, so managers created later
+    are not kept alive until end of process.
+
+    Args:
+        manager (AddonsManager): Manager of which report is output.
+
+    """
+    global _profiled_manager
+    with _profiled_manager_lock:
+        if _profiled_manager is not None:
+            return
+        _profiled_manager = manager
+    atexit.register(_output_profiling_report)
+
+
+def _output_profiling_report():
+    if _profiled_manager is not None:
+        _profiled_manager._output_profiling_report()
+
+
+def load_addons(force=False, lazy=None):
     """Load AYON addons as python modules.
 
     Modules does not load only classes (like in Interfaces) because there must
@@ -139,14 +214,23 @@ def load_addons(force=False):
     Args:
         force (bool): Force to load addons even if are already loaded.
             This won't update already loaded and used (cached) modules.
+        lazy (Optional[bool]): Only make addons available for import
+            without importing them. Value from
+            'is_addons_lazy_mode_enabled' is used if not passed.
     """
+    if lazy is None:
+        lazy = is_addons_lazy_mode_enabled()
 
-    if _LoadCache.addons_loaded and not force:
+    if (
+        _LoadCache.addons_loaded
+        and not force
+        and (lazy or _LoadCache.all_addons_imported)
+    ):
         return
 
     if not _LoadCache.addons_lock.locked():
         with _LoadCache.addons_lock:
-            _load_addons()
+            _load_addons(force or not _LoadCache.addons_loaded, lazy)
             _LoadCache.addons_loaded = True
     else:
         # If lock is locked wait until is finished
@@ -238,22 +322,25 @@ def _handle_moved_addons(addon_name, milestone_version, log):
     return addon_dir
 
 
-def _load_ayon_addons(log):
-    """Load AYON addons based on information from server.
+def _get_ayon_addons_dirs(log):
+    """Find directories of AYON addons based on information from server.
 
     This function should not trigger downloading of any addons but only use
     what is already available on the machine (at least in first stages of
-    development).
+    development). Found directories are added to 'sys.path'.
 
     Args:
         log (logging.Logger): Logger object.
 
+    Returns:
+        list[AddonDirInfo]: Information about addon directories.
+
     """
-    all_addon_modules = []
+    output = []
     bundle_info = _get_ayon_bundle_data()
     addons_info = _get_ayon_addons_information(bundle_info)
     if not addons_info:
-        return all_addon_modules
+        return output
 
     addons_dir = os.environ.get("AYON_ADDONS_DIR")
     if not addons_dir:
@@ -315,66 +402,304 @@ def _load_ayon_addons(log):
             continue
 
         sys.path.insert(0, addon_dir)
-        addon_modules = []
-        for name in os.listdir(addon_dir):
-            # Ignore of files is implemented to be able to run code from code
-            #   where usually is more files than just the addon
-            # Ignore start and setup scripts
-            if name in ("setup.py", "start.py", "__pycache__"):
-                continue
+        output.append(AddonDirInfo(
+            addon_name, addon_version, addon_dir, use_dev_path
+        ))
+    return output
 
-            path = os.path.join(addon_dir, name)
-            basename, ext = os.path.splitext(name)
-            # Ignore folders/files with dot in name
-            #   - dot names cannot be imported in Python
-            if "." in basename:
-                continue
-            is_dir = os.path.isdir(path)
-            is_py_file = ext.lower() == ".py"
-            if not is_py_file and not is_dir:
-                continue
 
-            try:
-                mod = __import__(basename, fromlist=("",))
-                for attr_name in dir(mod):
-                    attr = getattr(mod, attr_name)
-                    if (
-                        inspect.isclass(attr)
-                        and issubclass(attr, AYONAddon)
-                    ):
-                        addon_modules.append(mod)
-                        break
-
-            except BaseException:
-                log.warning(
-                    "Failed to import \"{}\"".format(basename),
-                    exc_info=True
-                )
+def _import_addon_modules(addon_dir_info, log):
+    """Import python modules of addon.
 
-        if not addon_modules:
-            log.warning("Addon {} {} has no content to import".format(
-                addon_name, addon_version
-            ))
+    Args:
+        addon_dir_info (AddonDirInfo): Addon directory information.
+        log (logging.Logger): Logger object.
+
+    Returns:
+        list[ModuleType]: Modules containing AYON addon classes.
+
+    """
+    addon_name = addon_dir_info.name
+    addon_version = addon_dir_info.version
+    addon_dir = addon_dir_info.dirpath
+    addon_modules = []
+    for name in os.listdir(addon_dir):
+        # Ignore of files is implemented to be able to run code from code
+        #   where usually is more files than just the addon
+        # Ignore start and setup scripts
+        if name in ("setup.py", "start.py", "__pycache__"):
             continue
 
-        if len(addon_modules) > 1:
-            log.warning((
-                "Multiple modules ({}) were found in addon '{}' in dir {}."
-            ).format(
-                ", ".join([m.__name__ for m in addon_modules]),
-                addon_name,
-                addon_dir,
-            ))
-        all_addon_modules.extend(addon_modules)
+        path = os.path.join(addon_dir, name)
+        basename, ext = os.path.splitext(name)
+        # Ignore folders/files with dot in name
+        #   - dot names cannot be imported in Python
+        if "." in basename:
+            continue
+        is_dir = os.path.isdir(path)
+        is_py_file = ext.lower() == ".py"
+        if not is_py_file and not is_dir:
+            continue
+
+        try:
+            import_start = time.time()
+            mod = __import__(basename, fromlist=("",))
+            _LoadCache.import_times[basename] = time.time() - import_start
+            for attr_name in dir(mod):
+                attr = getattr(mod, attr_name)
+                if (
+                    inspect.isclass(attr)
+                    and issubclass(attr, AYONAddon)
+                ):
+                    addon_modules.append(mod)
+                    break
+
+        except BaseException:
+            log.warning(
+                "Failed to import \"{}\"".format(basename),
+                exc_info=True
+            )
 
+    if not addon_modules:
+        log.warning("Addon {} {} has no content to import".format(
+            addon_name, addon_version
+        ))
+        return addon_modules
+
+    if len(addon_modules) > 1:
+        log.warning((
+            "Multiple modules ({}) were found in addon '{}' in dir {}."
+        ).format(
+            ", ".join([m.__name__ for m in addon_modules]),
+            addon_name,
+            addon_dir,
+        ))
+    return addon_modules
+
+
+def _import_addon(addon_dir_info, log):
+    """Import addon modules if were not imported yet.
+
+    Information about addon classes is stored to addons manifest.
+
+    Args:
+        addon_dir_info (AddonDirInfo): Addon directory information.
+        log (logging.Logger): Logger object.
+
+    Returns:
+        list[ModuleType]: Modules containing AYON addon classes.
+
+    """
+    modules = _LoadCache.modules_by_addon_name.get(addon_dir_info.name)
+    if modules is None:
+        modules = _import_addon_modules(addon_dir_info, log)
+        _LoadCache.modules_by_addon_name[addon_dir_info.name] = modules
+        if not addon_dir_info.is_dev:
+            _AddonsManifest.set_classes_info(
+                addon_dir_info, _get_addon_classes_info(modules)
+            )
+    return modules
+
+
+def _load_ayon_addons(log):
+    """Load AYON addons based on information from server.
+
+    This function should not trigger downloading of any addons but only use
+    what is already available on the machine (at least in first stages of
+    development).
+
+    Args:
+        log (logging.Logger): Logger object.
+
+    """
+    all_addon_modules = []
+    for addon_dir_info in _get_ayon_addons_dirs(log):
+        all_addon_modules.extend(_import_addon(addon_dir_info, log))
     return all_addon_modules
 
 
-def _load_addons():
+def _load_addons(reload_dirs=True, lazy=False):
     log = Logger.get_logger("AddonsLoader")
 
+    if reload_dirs:
+        _LoadCache.import_times = {}
+        _LoadCache.modules_by_addon_name = {}
+        _LoadCache.all_addons_imported = False
+        _LoadCache.addon_dirs = _get_ayon_addons_dirs(log)
+
+    if not lazy:
+        for addon_dir_info in _LoadCache.addon_dirs:
+            _import_addon(addon_dir_info, log)
+        _LoadCache.all_addons_imported = True
+
     # Store modules to local cache
-    _LoadCache.addon_modules = _load_ayon_addons(log)
+    _LoadCache.addon_modules = [
+        module
+        for addon_dir_info in _LoadCache.addon_dirs
+        for module in _LoadCache.modules_by_addon_name.get(
+            addon_dir_info.name, []
+        )
+    ]
+
+
+def _get_addon_classes(module, log=None):
+    """Get addon classes available in module.
+
+    Args:
+        module (ModuleType): Addon module.
+        log (Optional[logging.Logger]): Logger used to log abstract
+            classes.
+
+    Returns:
+        list[type[AYONAddon]]: Addon classes.
+
+    """
+    addon_classes = []
+    # Go through globals in `ayon_core.modules`
+    for name in dir(module):
+        modules_item = getattr(module, name, None)
+        # Filter globals that are not classes which inherit from
+        #   AYONAddon
+        if (
+            not inspect.isclass(modules_item)
+            or modules_item is AYONAddon
+            or not issubclass(modules_item, AYONAddon)
+        ):
+            continue
+
+        # Check if class is abstract (Developing purpose)
+        if inspect.isabstract(modules_item):
+            if log is None:
+                continue
+            # Find abstract attributes by convention on `abc` module
+            not_implemented = []
+            for attr_name in dir(modules_item):
+                attr = getattr(modules_item, attr_name, None)
+                abs_method = getattr(
+                    attr, "__isabstractmethod__", None
+                )
+                if attr and abs_method:
+                    not_implemented.append(attr_name)
+
+            # Log missing implementations
+            log.warning((
+                "Skipping abstract Class: {}."
+                " Missing implementations: {}"
+            ).format(name, ", ".join(not_implemented)))
+            continue
+
+        addon_classes.append(modules_item)
+    return addon_classes
+
+
+def _get_addon_classes_info(modules):
+    """Information about addon classes stored to addons manifest.
+
+    Args:
+        modules (list[ModuleType]): Addon modules.
+
+    Returns:
+        list[dict[str, Any]]: Information about addon classes.
+
+    """
+    output = []
+    for module in modules:
+        for addon_cls in _get_addon_classes(module):
+            addon_name = getattr(addon_cls, "name", None)
+            host_name = getattr(addon_cls, "host_name", None)
+            output.append({
+                "class_name": addon_cls.__name__,
+                "addon_name": (
+                    addon_name if isinstance(addon_name, str) else None
+                ),
+                "host_name": (
+                    host_name if isinstance(host_name, str) else None
+                ),
+                "interfaces": [
+                    cls.__name__
+                    for cls in addon_cls.__mro__
+                    if (
+                        issubclass(cls, AYONInterface)
+                        and cls is not AYONInterface
+                        and not issubclass(cls, AYONAddon)
+                    )
+                ],
+            })
+    return output
+
+
+class _AddonsManifest:
+    """Information about addon classes stored on disk.
+
+    Information is used in lazy mode to decide which addons must be
+    imported without importing them. Information is stored per addon
+    name, version and directory and is updated on import of addon.
+    Addons in development mode are not stored as their content may change.
+    """
+    _data = None
+
+    @classmethod
+    def get_classes_info(cls, addon_dir_info):
+        """Information about addon classes.
+
+        Args:
+            addon_dir_info (AddonDirInfo): Addon directory information.
+
+        Returns:
+            Union[list[dict[str, Any]], None]: Information about addon
+                classes or None if addon is unknown.
+
+        """
+        if addon_dir_info.is_dev:
+            return None
+        return cls._get_data().get(cls._get_key(addon_dir_info))
+
+    @classmethod
+    def set_classes_info(cls, addon_dir_info, classes_info):
+        key = cls._get_key(addon_dir_info)
+        data = cls._get_data()
+        if data.get(key) == classes_info:
+            return
+        data[key] = classes_info
+        filepath = cls._get_filepath()
+        try:
+            os.makedirs(os.path.dirname(filepath), exist_ok=True)
+            # Write to temp file first to avoid reading of partial file
+            #   from other processes
+            tmp_path = "{}.{}.tmp".format(filepath, os.getpid())
+            with open(tmp_path, "w") as stream:
+                json.dump(data, stream)
+            os.replace(tmp_path, filepath)
+        except OSError:
+            logging.getLogger("AddonsLoader").debug(
+                "Failed to store addons manifest.", exc_info=True
+            )
+
+    @classmethod
+    def _get_key(cls, addon_dir_info):
+        return "{}|{}|{}".format(
+            addon_dir_info.name,
+            addon_dir_info.version,
+            addon_dir_info.dirpath,
+        )
+
+    @classmethod
+    def _get_filepath(cls):
+        return get_launcher_local_dir("addons_manifest.json")
+
+    @classmethod
+    def _get_data(cls):
+        if cls._data is None:
+            data = {}
+            filepath = cls._get_filepath()
+            if os.path.exists(filepath):
+                try:
+                    with open(filepath, "r") as stream:
+                        data = json.load(stream)
+                except (OSError, ValueError):
+                    pass
+            cls._data = data
+        return cls._data
 
 
 class AYONAddon(ABC):
@@ -589,18 +914,32 @@ class _AddonReportInfo:
 class AddonsManager:
     """Manager of addons that helps to load and prepare them to work.
 
+    In lazy mode addons are imported and initialized only when they are
+    requested. Addons implementing an interface are initialized when
+    the manager needs them, e.g. to collect plugin paths. Information about
+    addon classes is taken from addons manifest stored on previous import,
+    unknown addons are always imported. Enabled addons are connected with
+    addons initialized at the time.
+
     Args:
         settings (Optional[dict[str, Any]]): AYON studio settings.
         initialize (Optional[bool]): Initialize addons on init.
             True by default.
+        lazy (Optional[bool]): Import and initialize addons lazily. Value
+            from 'is_addons_lazy_mode_enabled' is used if not passed.
 
     """
     # Helper attributes for report
     _report_total_key = "Total"
     _log = None
 
-    def __init__(self, settings=None, initialize=True):
+    def __init__(self, settings=None, initialize=True, lazy=None):
+        if lazy is None:
+            lazy = is_addons_lazy_mode_enabled()
         self._settings = settings
+        self._lazy = lazy
+        # Names of addons from server which were already initialized
+        self._processed_addon_names = set()
 
         self._addons = []
         self._addons_by_id = {}
@@ -612,7 +951,11 @@ class AddonsManager:
             self.initialize_addons()
             self.connect_addons()
 
+        if is_addons_profiling_enabled():
+            _register_profiling_report(self)
+
     def __getitem__(self, addon_name):
+        self._ensure_addon_by_name(addon_name)
         return self._addons_by_name[addon_name]
 
     @property
@@ -632,18 +975,22 @@ class AddonsManager:
             Union[AYONAddon, Any]: Addon found by name or `default`.
 
         """
+        self._ensure_addon_by_name(addon_name)
         return self._addons_by_name.get(addon_name, default)
 
     @property
     def addons(self):
+        self._ensure_addons()
         return list(self._addons)
 
     @property
     def addons_by_id(self):
+        self._ensure_addons()
         return dict(self._addons_by_id)
 
     @property
     def addons_by_name(self):
+        self._ensure_addons()
         return dict(self._addons_by_name)
 
     def get_enabled_addon(self, addon_name, default=None):
@@ -672,6 +1019,7 @@ class AddonsManager:
             list[AYONAddon]: Initialized and enabled addons.
 
         """
+        self._ensure_addons()
         return [
             addon
             for addon in self._addons
@@ -679,97 +1027,102 @@ class AddonsManager:
         ]
 
     def initialize_addons(self):
-        """Import and initialize addons."""
+        """Import and initialize addons.
+
+        Addons are only made available for import in lazy mode.
+        """
         # Make sure modules are loaded
-        load_addons()
+        load_addons(lazy=self._lazy)
+        if self._lazy:
+            return
 
         self.log.debug("*** AYON addons initialization.")
+        self._processed_addon_names |= {
+            addon_dir_info.name
+            for addon_dir_info in _LoadCache.addon_dirs
+        }
+        self._initialize_addons_from_modules(_LoadCache.addon_modules)
+
+        for addon_name in sorted(self._addons_by_name.keys()):
+            addon = self._addons_by_name[addon_name]
+            enabled_str = "X" if addon.enabled else " "
+            self.log.debug(
+                f"[{enabled_str}] {addon.name} ({addon.version})"
+            )
 
+    def _get_settings(self):
         # Prepare settings for addons
-        settings = self._settings
-        if settings is None:
-            settings = get_studio_settings()
+        if self._settings is None:
+            self._settings = get_studio_settings()
+        return self._settings
 
-        report = {}
-        time_start = time.time()
-        prev_start_time = time_start
+    def _initialize_addons_from_modules(self, modules):
+        """Initialize addons from addon modules.
 
-        addon_classes = []
-        for module in _LoadCache.addon_modules:
-            # Go through globals in `ayon_core.modules`
-            for name in dir(module):
-                modules_item = getattr(module, name, None)
-                # Filter globals that are not classes which inherit from
-                #   AYONAddon
-                if (
-                    not inspect.isclass(modules_item)
-                    or modules_item is AYONAddon
-                    or not issubclass(modules_item, AYONAddon)
-                ):
-                    continue
+        Args:
+            modules (list[ModuleType]): Addon modules.
 
-                # Check if class is abstract (Developing purpose)
-                if inspect.isabstract(modules_item):
-                    # Find abstract attributes by convention on `abc` module
-                    not_implemented = []
-                    for attr_name in dir(modules_item):
-                        attr = getattr(modules_item, attr_name, None)
-                        abs_method = getattr(
-                            attr, "__isabstractmethod__", None
-                        )
-                        if attr and abs_method:
-                            not_implemented.append(attr_name)
-
-                    # Log missing implementations
-                    self.log.warning((
-                        "Skipping abstract Class: {}."
-                        " Missing implementations: {}"
-                    ).format(name, ", ".join(not_implemented)))
-                    continue
+        Returns:
+            list[AYONAddon]: Initialized addons.
+
+        """
+        settings = self._get_settings()
+
+        addon_classes = []
+        for module in modules:
+            addon_classes.extend(_get_addon_classes(module, self.log))
 
-                addon_classes.append(modules_item)
+        imported_modules = set()
+        for addon_cls in addon_classes:
+            # Count import time of module only to first addon class from it
+            module_name = addon_cls.__module__.split(".")[0]
+            import_time = _LoadCache.import_times.get(module_name)
+            if (
+                import_time is not None
+                and module_name not in imported_modules
+            ):
+                imported_modules.add(module_name)
+                self._add_report_time("Import", addon_cls, import_time)
 
+        addons = []
         for addon_cls in addon_classes:
             name = addon_cls.__name__
+            addon_start = time.time()
             try:
                 addon = addon_cls(self, settings)
                 # Store initialized object
                 self._addons.append(addon)
                 self._addons_by_id[addon.id] = addon
                 self._addons_by_name[addon.name] = addon
-
-                now = time.time()
-                report[addon.__class__.__name__] = now - prev_start_time
-                prev_start_time = now
+                addons.append(addon)
 
             except Exception:
                 self.log.warning(
                     "Initialization of addon '{}' failed.".format(name),
                     exc_info=True
                 )
+                continue
 
-        for addon_name in sorted(self._addons_by_name.keys()):
-            addon = self._addons_by_name[addon_name]
-            enabled_str = "X" if addon.enabled else " "
-            self.log.debug(
-                f"[{enabled_str}] {addon.name} ({addon.version})"
+            self._add_report_time(
+                "Initialization", addon_cls, time.time() - addon_start
             )
-
-        if self._report is not None:
-            report[self._report_total_key] = time.time() - time_start
-            self._report["Initialization"] = report
+        return addons
 
     def connect_addons(self):
         """Trigger connection with other enabled addons.
 
         Addons should handle their interfaces in `connect_with_addons`.
+        In lazy mode are all enabled addons connected again when more
+        addons are initialized.
         """
-        report = {}
-        time_start = time.time()
-        prev_start_time = time_start
-        enabled_addons = self.get_enabled_addons()
+        enabled_addons = [
+            addon
+            for addon in self._addons
+            if addon.enabled
+        ]
         self.log.debug("Has {} enabled addons.".format(len(enabled_addons)))
         for addon in enabled_addons:
+            time_start = time.time()
             try:
                 addon.connect_with_addons(enabled_addons)
 
@@ -779,13 +1132,79 @@ class AddonsManager:
                     exc_info=True
                 )
 
-            now = time.time()
-            report[addon.__class__.__name__] = now - prev_start_time
-            prev_start_time = now
+            self._add_report_time(
+                "Connect modules", addon, time.time() - time_start
+            )
+
+    def _ensure_addons(self, match_func=None):
+        """Import and initialize addons in lazy mode.
+
+        Args:
+            match_func (Optional[Callable[[dict[str, Any]], bool]]): Function
+                deciding from information about addon class from addons
+                manifest if addon should be initialized. All addons are
+                initialized if not passed.
+
+        """
+        if not self._lazy:
+            return
+
+        addon_dir_infos = []
+        for addon_dir_info in _LoadCache.addon_dirs:
+            if addon_dir_info.name in self._processed_addon_names:
+                continue
+            classes_info = _AddonsManifest.get_classes_info(addon_dir_info)
+            if (
+                match_func is None
+                or classes_info is None
+                or any(
+                    match_func(class_info)
+                    for class_info in classes_info
+                )
+            ):
+                addon_dir_infos.append(addon_dir_info)
+
+        if not addon_dir_infos:
+            return
+
+        modules = []
+        for addon_dir_info in addon_dir_infos:
+            self._processed_addon_names.add(addon_dir_info.name)
+            modules.extend(_import_addon(addon_dir_info, self.log))
 
-        if self._report is not None:
-            report[self._report_total_key] = time.time() - time_start
-            self._report["Connect modules"] = report
+        addons = self._initialize_addons_from_modules(modules)
+        if not any(addon.enabled for addon in addons):
+            return
+
+        # Enabled addons did change, addons initialized earlier are
+        #   connected again so they know about the new addons
+        self.connect_addons()
+
+    def _ensure_addon_by_name(self, addon_name):
+        if addon_name in self._addons_by_name:
+            return
+        self._ensure_addons(
+            lambda class_info: class_info["addon_name"] in (addon_name, None)
+        )
+
+    def _get_enabled_addons_by_interface(self, interface):
+        """Enabled addons implementing an interface.
+
+        Args:
+            interface (type[AYONInterface]): Addon interface.
+
+        Returns:
+            list[AYONAddon]: Enabled addons implementing the interface.
+
+        """
+        self._ensure_addons(
+            lambda class_info: interface.__name__ in class_info["interfaces"]
+        )
+        return [
+            addon
+            for addon in self._addons
+            if addon.enabled and isinstance(addon, interface)
+        ]
 
     def collect_global_environments(self):
         """Helper to collect global environment variabled from modules.
@@ -828,11 +1247,12 @@ class AddonsManager:
             "inventory": []
         }
         unknown_keys_by_addon = {}
-        for addon in self.get_enabled_addons():
-            # Skip module that do not inherit from `IPluginPaths`
-            if not isinstance(addon, IPluginPaths):
-                continue
+        for addon in self._get_enabled_addons_by_interface(IPluginPaths):
+            time_start = time.time()
             plugin_paths = addon.get_plugin_paths()
+            self._add_report_time(
+                "Plugin paths", addon, time.time() - time_start
+            )
             for key, value in plugin_paths.items():
                 # Filter unknown keys
                 if key not in output:
@@ -869,12 +1289,9 @@ class AddonsManager:
 
     def _collect_plugin_paths(self, method_name, *args, **kwargs):
         output = []
-        for addon in self.get_enabled_addons():
-            # Skip addon that do not inherit from `IPluginPaths`
-            if not isinstance(addon, IPluginPaths):
-                continue
-
+        for addon in self._get_enabled_addons_by_interface(IPluginPaths):
             method = getattr(addon, method_name)
+            time_start = time.time()
             try:
                 paths = method(*args, **kwargs)
             except Exception:
@@ -886,6 +1303,10 @@ class AddonsManager:
                     exc_info=True
                 )
                 continue
+            finally:
+                self._add_report_time(
+                    "Plugin paths", addon, time.time() - time_start
+                )
 
             if paths:
                 # Convert to list if value is not list
@@ -966,9 +1387,16 @@ class AddonsManager:
             Union[AYONAddon, None]: Found host addon by name or `None`.
         """
 
-        for addon in self.get_enabled_addons():
+        self._ensure_addons(
+            lambda class_info: (
+                "IHostAddon" in class_info["interfaces"]
+                and class_info["host_name"] in (host_name, None)
+            )
+        )
+        for addon in self._addons:
             if (
-                isinstance(addon, IHostAddon)
+                addon.enabled
+                and isinstance(addon, IHostAddon)
                 and addon.host_name == host_name
             ):
                 return addon
@@ -984,10 +1412,85 @@ class AddonsManager:
 
         return {
             addon.host_name
-            for addon in self.get_enabled_addons()
-            if isinstance(addon, IHostAddon)
+            for addon in self._get_enabled_addons_by_interface(IHostAddon)
         }
 
+    def _add_report_time(self, label, addon, time_delta):
+        """Add time spent by addon to report.
+
+        Time is added to already reported time of the addon under the label.
+
+        Args:
+            label (str): Label of processed part.
+            addon (Union[AYONAddon, type[AYONAddon]]): Addon, or addon
+                class, which spent the time.
+            time_delta (float): Time spent in seconds.
+
+        """
+        if self._report is None:
+            return
+        addon_cls = addon if inspect.isclass(addon) else addon.__class__
+        report = self._report.setdefault(label, {})
+        for key in (addon_cls.__name__, self._report_total_key):
+            report[key] = report.get(key, 0) + time_delta
+
+    def get_report_data(self):
+        """Time spent on addons initialization parts as serializable data.
+
+        Returns:
+            dict[str, Any]: Time in seconds spent by each addon in each
+                reported part, and total time of each part.
+
+        """
+        report = self._report or {}
+        addons_data = {}
+        for addon in self._addons:
+            addon_info = _AddonReportInfo.from_addon(addon, report)
+            addons_data[addon_info.name] = {
+                "class_name": addon_info.class_name,
+                "version": addon_info.version,
+                "times": {
+                    label: value
+                    for label, value in (
+                        addon_info.report_value_by_label.items()
+                    )
+                    if value is not None
+                },
+            }
+        return {
+            "addons": addons_data,
+            "totals": {
+                label: reported[self._report_total_key]
+                for label, reported in report.items()
+                if self._report_total_key in reported
+            },
+        }
+
+    def write_report(self, filepath):
+        """Store report of time spent on addons initialization as JSON.
+
+        Args:
+            filepath (str): Path to output JSON file.
+
+        """
+        dirpath = os.path.dirname(filepath)
+        if dirpath:
+            os.makedirs(dirpath, exist_ok=True)
+        with open(filepath, "w") as stream:
+            json.dump(self.get_report_data(), stream, indent=4)
+
+    def _output_profiling_report(self):
+        self.print_report()
+        output_path = os.getenv("AYON_ADDONS_PROFILE_OUTPUT")
+        if output_path:
+            try:
+                self.write_report(output_path)
+            except OSError:
+                self.log.warning(
+                    "Failed to write addons profiling report.",
+                    exc_info=True
+                )
+
     def print_report(self):
         """Print out report of time spent on addons initialization parts.
 
@@ -1025,7 +1528,7 @@ class AddonsManager:
         # Prepare ordered dictionary for columns
         addons_info = [
             _AddonReportInfo.from_addon(addon, self._report)
-            for addon in self.addons
+            for addon in self._addons
             if addon.__class__.__name__ in available_col_names
         ]
         addons_info.sort(key=lambda x: x.name)
@@ -12,7 +12,11 @@ from .local_settings import (
     get_local_site_id,
     get_ayon_username,
 )
-from .ayon_connection import initialize_ayon_connection
+from .ayon_connection import (
+    initialize_ayon_connection,
+    update_server_time,
+    get_server_time,
+)
 from .cache import (
     CacheItem,
     NestedCacheItem,
@@ -59,6 +63,7 @@ from .execute import (
     get_linux_launcher_args,
     execute,
     run_subprocess,
+    run_subprocesses,
     run_detached_process,
     run_ayon_launcher_process,
     path_to_subprocess_arg,
@@ -91,6 +96,7 @@ from .python_module_tools import (
 
 from .profiles_filtering import (
     compile_list_of_regexes,
+    ProfileMatcher,
     filter_profiles
 )
 
@@ -101,6 +107,7 @@ from .transcoding import (
     convert_input_paths_for_ffmpeg,
     get_ffprobe_data,
     get_ffprobe_streams,
+    clear_media_info_cache,
     get_ffmpeg_codec_args,
     get_ffmpeg_format_args,
     convert_ffprobe_fps_value,
@@ -118,6 +125,8 @@ from .path_tools import (
     format_file_size,
     collect_frames,
     create_hard_link,
+    create_reflink,
+    stat_files,
     version_up,
     get_version_from_path,
     get_last_version_from_path,
@@ -146,6 +155,8 @@ __all__ = [
     "get_ayon_username",
 
     "initialize_ayon_connection",
+    "update_server_time",
+    "get_server_time",
 
     "CacheItem",
     "NestedCacheItem",
@@ -157,6 +168,7 @@ __all__ = [
     "get_linux_launcher_args",
     "execute",
     "run_subprocess",
+    "run_subprocesses",
     "run_detached_process",
     "run_ayon_launcher_process",
     "path_to_subprocess_arg",
@@ -200,6 +212,7 @@ __all__ = [
     "convert_input_paths_for_ffmpeg",
     "get_ffprobe_data",
     "get_ffprobe_streams",
+    "clear_media_info_cache",
     "get_ffmpeg_codec_args",
     "get_ffmpeg_format_args",
     "convert_ffprobe_fps_value",
@@ -209,6 +222,7 @@ __all__ = [
 
     "compile_list_of_regexes",
 
+    "ProfileMatcher",
     "filter_profiles",
 
     "prepare_template_data",
@@ -217,6 +231,8 @@ __all__ = [
     "format_file_size",
     "collect_frames",
     "create_hard_link",
+    "create_reflink",
+    "stat_files",
     "version_up",
     "get_version_from_path",
     "get_last_version_from_path",
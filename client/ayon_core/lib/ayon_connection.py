@@ -1,4 +1,8 @@
 import os
+import time
+import logging
+import email.utils
+from datetime import datetime, timezone, timedelta
 
 import semver
 import ayon_api
@@ -6,10 +10,22 @@ import ayon_api
 from .local_settings import get_local_site_id
 
 
+log = logging.getLogger(__name__)
+
+
 class _Cache:
     initialized = False
 
 
+class _ServerTimeCache:
+    base_url = None
+    # Difference of time on server and time on this machine in seconds
+    offset = None
+    updated_at = 0
+    # Clocks do not drift fast, offset is refreshed once in a while
+    lifetime = 3600
+
+
 def _new_get_last_versions(
     self,
     project_name,
@@ -192,3 +208,82 @@ def initialize_ayon_connection(force=False):
         con.set_client_version(version)
     else:
         ayon_api.create_connection(site_id, version)
+
+
+def _get_base_url():
+    try:
+        return ayon_api.get_base_url()
+    except Exception:
+        return None
+
+
+def update_server_time(response):
+    """Update difference of server time from 'Date' header of response.
+
+    Any response from AYON server can be used, so callers which already
+    received a response don't have to ask server for time again.
+
+    Args:
+        response (Any): Response from server with 'headers' attribute.
+
+    Returns:
+        Union[datetime, None]: Time on server when response was created,
+            or None if response does not contain the time.
+
+    """
+    headers = getattr(response, "headers", None)
+    date = headers.get("Date") if headers else None
+    if not date:
+        return None
+    try:
+        server_time = email.utils.parsedate_to_datetime(date)
+    except (TypeError, ValueError):
+        return None
+    if server_time.tzinfo is None:
+        server_time = server_time.replace(tzinfo=timezone.utc)
+
+    now = time.time()
+    _ServerTimeCache.base_url = _get_base_url()
+    _ServerTimeCache.offset = server_time.timestamp() - now
+    _ServerTimeCache.updated_at = now
+    return server_time
+
+
+def get_server_time():
+    """Current time on AYON server.
+
+    Time on this machine may differ from time on server, which matters
+    when comparing with times of server events. Difference of times is
+    cached so server is asked only once in a while. Local time is used
+    if time on server is not available.
+
+    Returns:
+        datetime: Current time on server in UTC.
+
+    """
+    now = time.time()
+    base_url = _get_base_url()
+    if (
+        now - _ServerTimeCache.updated_at > _ServerTimeCache.lifetime
+        or _ServerTimeCache.base_url != base_url
+    ):
+        server_time = None
+        try:
+            server_time = update_server_time(ayon_api.get("users/me"))
+        except Exception:
+            log.debug("Failed to get server time.", exc_info=True)
+
+        if server_time is None:
+            # Don't ask server again until lifetime of cache ends
+            if _ServerTimeCache.base_url != base_url:
+                _ServerTimeCache.offset = None
+            _ServerTimeCache.base_url = base_url
+            _ServerTimeCache.updated_at = now
+
+    offset = _ServerTimeCache.offset
+    if offset is None:
+        offset = 0
+    return (
+        datetime.fromtimestamp(now, timezone.utc)
+        + timedelta(seconds=offset)
+    )
@@ -3,7 +3,9 @@ import sys
 import subprocess
 import platform
 import json
+import logging
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 
 from .log import Logger
 from .vendor_bin_utils import find_executable
@@ -169,6 +171,108 @@ def run_subprocess(*args, **kwargs):
     return full_output
 
 
+class _BufferedLogger:
+    """Logger collecting messages to be logged later.
+
+    Used to keep output of processes running in parallel in order.
+    """
+    def __init__(self):
+        self._records = []
+
+    def debug(self, msg, *args, **kwargs):
+        self._records.append((logging.DEBUG, msg, args, kwargs))
+
+    def info(self, msg, *args, **kwargs):
+        self._records.append((logging.INFO, msg, args, kwargs))
+
+    def warning(self, msg, *args, **kwargs):
+        self._records.append((logging.WARNING, msg, args, kwargs))
+
+    def error(self, msg, *args, **kwargs):
+        self._records.append((logging.ERROR, msg, args, kwargs))
+
+    def flush(self, logger):
+        for level, msg, args, kwargs in self._records:
+            logger.log(level, msg, *args, **kwargs)
+        self._records = []
+
+
+def run_subprocesses(args_list, max_workers=None, logger=None, **kwargs):
+    """Run multiple processes in parallel and wait for them to finish.
+
+    Helper for tools that are executed per file (e.g. per frame of
+    a sequence). Output of processes is logged in order of passed
+    arguments, not in order of finished processes.
+
+    No new process is started once any process fails. Processes that are
+    already running are finished, and then error with all failures
+    is raised.
+
+    Args:
+        args_list (Iterable[Union[list[str], str]]): Arguments of each
+            process.
+        max_workers (Optional[int]): Maximum number of processes running at
+            the same time. Number of CPUs is used if not passed.
+        logger (Optional[logging.Logger]): Logger used for output.
+        **kwargs (Any): Keyword arguments for 'run_subprocess'.
+
+    Returns:
+        list[str]: Output of each process in order of passed arguments.
+
+    Raises:
+        RuntimeError: When any of the processes failed.
+
+    """
+    if logger is None:
+        logger = Logger.get_logger("run_subprocesses")
+
+    args_list = list(args_list)
+    if max_workers is None or max_workers < 1:
+        max_workers = os.cpu_count() or 1
+
+    if max_workers == 1 or len(args_list) < 2:
+        return [
+            run_subprocess(args, logger=logger, **kwargs)
+            for args in args_list
+        ]
+
+    failed = []
+
+    def _run(args, buffered_logger):
+        if failed:
+            return None
+        try:
+            return run_subprocess(args, logger=buffered_logger, **kwargs)
+        except Exception:
+            failed.append(args)
+            raise
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        jobs = []
+        for args in args_list:
+            buffered_logger = _BufferedLogger()
+            future = executor.submit(_run, args, buffered_logger)
+            jobs.append((future, buffered_logger))
+
+        outputs = []
+        errors = []
+        for future, buffered_logger in jobs:
+            try:
+                outputs.append(future.result())
+            except Exception as exc:
+                outputs.append(None)
+                errors.append(str(exc))
+            buffered_logger.flush(logger)
+
+    if errors:
+        raise RuntimeError(
+            "{} of {} processes failed.\n{}".format(
+                len(errors), len(args_list), "\n".join(errors)
+            )
+        )
+    return outputs
+
+
 def clean_envs_for_ayon_process(env=None):
     """Modify environments that may affect ayon-launcher process.
 
@@ -0,0 +1,324 @@
+"""Content hashing of files with persistent local cache.
+
+Content hash, unlike 'source_hash', is based on file content so identical
+files can be detected even if they are stored in different locations or
+have different modification time.
+
+Hashes are cached in local database keyed by file identity (device, inode,
+modification time and size), so content of unchanged files is not read
+again. Files without inode number (some network and FUSE filesystems
+report '0') can't be identified and are not cached.
+"""
+import os
+import hashlib
+import logging
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
+from .local_settings import get_launcher_local_dir
+
+log = logging.getLogger(__name__)
+
+# Size of chunk read from file at once
+HASH_CHUNK_SIZE = 8 * 1024 * 1024
+
+_HASH_FACTORIES = {
+    "blake2b": hashlib.blake2b,
+    "sha256": hashlib.sha256,
+}
+if xxhash is not None:
+    _HASH_FACTORIES["xxh64"] = xxhash.xxh64
+    _HASH_FACTORIES["xxh3_128"] = xxhash.xxh3_128
+
+
+def register_hash_type(hash_type, factory):
+    """Register custom hash algorithm.
+
+    Args:
+        hash_type (str): Name of hash algorithm.
+        factory (Callable[[], Any]): Function returning new hash object
+            with 'update' and 'hexdigest' methods (like 'hashlib' objects).
+
+    """
+    _HASH_FACTORIES[hash_type] = factory
+
+
+def get_available_hash_types():
+    """Available hash algorithms.
+
+    Returns:
+        list[str]: Names of available hash algorithms.
+
+    """
+    return list(_HASH_FACTORIES.keys())
+
+
+def get_default_hash_type():
+    """Fastest available hash algorithm.
+
+    Returns:
+        str: Name of hash algorithm.
+
+    """
+    if "xxh3_128" in _HASH_FACTORIES:
+        return "xxh3_128"
+    return "blake2b"
+
+
+def compute_file_hash(filepath, hash_type=None, chunk_size=None):
+    """Compute hash of file content.
+
+    File is read in chunks so memory usage does not depend on file size.
+
+    Args:
+        filepath (str): Path to file.
+        hash_type (Optional[str]): Hash algorithm. Default algorithm from
+            'get_default_hash_type' is used if not passed.
+        chunk_size (Optional[int]): Size of chunk read at once.
+
+    Returns:
+        str: Hex digest of file content.
+
+    Raises:
+        ValueError: When hash algorithm is not available.
+
+    """
+    if hash_type is None:
+        hash_type = get_default_hash_type()
+    if chunk_size is None:
+        chunk_size = HASH_CHUNK_SIZE
+
+    factory = _HASH_FACTORIES.get(hash_type)
+    if factory is None:
+        raise ValueError(
+            "Hash type '{}' is not available. Available types: {}".format(
+                hash_type, ", ".join(get_available_hash_types())
+            )
+        )
+
+    hash_obj = factory()
+    with open(filepath, "rb") as stream:
+        while True:
+            chunk = stream.read(chunk_size)
+            if not chunk:
+                break
+            hash_obj.update(chunk)
+    return hash_obj.hexdigest()
+
+
+class FileHashCache:
+    """Persistent cache of file content hashes.
+
+    Hashes are stored in sqlite database keyed by hash type and identity
+    of file. Cached hash is used only if device, inode, modification time
+    and size of file did not change. Files with inode number '0' are not
+    cached because they can't be distinguished from each other.
+
+    Args:
+        filepath (Optional[str]): Path to database file. Default location
+            is in launcher local directory.
+
+    """
+    def __init__(self, filepath=None):
+        if filepath is None:
+            filepath = get_launcher_local_dir("file_hash_cache.db")
+        self._filepath = filepath
+        self._lock = threading.Lock()
+        self._connection = None
+
+    @property
+    def filepath(self):
+        return self._filepath
+
+    def get(self, filepath, hash_type, stat_result=None):
+        """Get cached hash of file.
+
+        Args:
+            filepath (str): Path to file.
+            hash_type (str): Hash algorithm.
+            stat_result (Optional[os.stat_result]): Already known stat
+                of the file.
+
+        Returns:
+            Union[str, None]: Cached hash or None if file is not cached or
+                did change.
+
+        """
+        key = self._get_key(filepath, hash_type, stat_result)
+        if key is None:
+            return None
+        with self._lock:
+            connection = self._get_connection()
+            if connection is None:
+                return None
+            row = connection.execute(
+                "SELECT digest FROM file_hashes WHERE hash_type=?"
+                " AND device=? AND inode=? AND mtime_ns=? AND size=?",
+                key
+            ).fetchone()
+        if row is None:
+            return None
+        return row[0]
+
+    def set(self, filepath, hash_type, digest, stat_result=None):
+        """Store hash of file.
+
+        Args:
+            filepath (str): Path to file.
+            hash_type (str): Hash algorithm.
+            digest (str): Hash of file content.
+            stat_result (Optional[os.stat_result]): Stat of the file at the
+                time when hash was computed.
+
+        """
+        key = self._get_key(filepath, hash_type, stat_result)
+        if key is None:
+            return
+        with self._lock:
+            connection = self._get_connection()
+            if connection is None:
+                return
+            try:
+                with connection:
+                    connection.execute(
+                        "INSERT OR REPLACE INTO file_hashes"
+                        " (hash_type, device, inode, mtime_ns, size, digest)"
+                        " VALUES (?, ?, ?, ?, ?, ?)",
+                        key + (digest, )
+                    )
+            except sqlite3.Error:
+                log.debug("Failed to store file hash.", exc_info=True)
+
+    def clear(self):
+        """Remove all cached hashes."""
+        with self._lock:
+            connection = self._get_connection()
+            if connection is not None:
+                with connection:
+                    connection.execute("DELETE FROM file_hashes")
+
+    def _get_key(self, filepath, hash_type, stat_result):
+        if stat_result is None:
+            stat_result = os.stat(filepath)
+        # Filesystem does not provide inode numbers
+        if not stat_result.st_ino:
+            return None
+        return (
+            hash_type,
+            stat_result.st_dev,
+            stat_result.st_ino,
+            stat_result.st_mtime_ns,
+            stat_result.st_size,
+        )
+
+    def _get_connection(self):
+        if self._connection is not None:
+            return self._connection
+
+        try:
+            os.makedirs(os.path.dirname(self._filepath), exist_ok=True)
+            connection = sqlite3.connect(
+                self._filepath, timeout=10, check_same_thread=False
+            )
+            with connection:
+                connection.execute(
+                    "CREATE TABLE IF NOT EXISTS file_hashes ("
+                    " hash_type TEXT, device INTEGER, inode INTEGER,"
+                    " mtime_ns INTEGER, size INTEGER, digest TEXT,"
+                    " PRIMARY KEY (hash_type, device, inode, mtime_ns, size)"
+                    ")"
+                )
+        except (OSError, sqlite3.Error):
+            log.warning(
+                "Failed to open file hash cache '{}'.".format(self._filepath),
+                exc_info=True
+            )
+            return None
+        self._connection = connection
+        return connection
+
+
+_file_hash_cache = None
+
+
+def get_file_hash_cache():
+    """Shared file hash cache of the process.
+
+    Returns:
+        FileHashCache: File hash cache stored in default location.
+
+    """
+    global _file_hash_cache
+    if _file_hash_cache is None:
+        _file_hash_cache = FileHashCache()
+    return _file_hash_cache
+
+
+def get_file_hash(filepath, hash_type=None, cache=None, stat_result=None):
+    """Get hash of file content using cache.
+
+    Args:
+        filepath (str): Path to file.
+        hash_type (Optional[str]): Hash algorithm.
+        cache (Optional[FileHashCache]): Hash cache. Shared process cache
+            is used if not passed.
+        stat_result (Optional[os.stat_result]): Already known stat
+            of the file.
+
+    Returns:
+        str: Hex digest of file content.
+
+    """
+    if hash_type is None:
+        hash_type = get_default_hash_type()
+    if cache is None:
+        cache = get_file_hash_cache()
+    if stat_result is None:
+        stat_result = os.stat(filepath)
+
+    digest = cache.get(filepath, hash_type, stat_result)
+    if digest is None:
+        digest = compute_file_hash(filepath, hash_type)
+        cache.set(filepath, hash_type, digest, stat_result)
+    return digest
+
+
+def get_files_hash(filepaths, hash_type=None, cache=None, max_workers=None):
+    """Get hashes of multiple files using cache.
+
+    Files which are not cached are read in parallel by pool of threads.
+
+    Args:
+        filepaths (Iterable[str]): Paths to files.
+        hash_type (Optional[str]): Hash algorithm.
+        cache (Optional[FileHashCache]): Hash cache. Shared process cache
+            is used if not passed.
+        max_workers (Optional[int]): Maximum number of files hashed at the
+            same time. Number of CPUs is used if not passed.
+
+    Returns:
+        dict[str, str]: Hex digest of file content by filepath.
+
+    """
+    filepaths = list(filepaths)
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+
+    def _get_hash(filepath):
+        return get_file_hash(filepath, hash_type, cache)
+
+    if max_workers < 2 or len(filepaths) < 2:
+        return {
+            filepath: _get_hash(filepath)
+            for filepath in filepaths
+        }
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        digests = executor.map(_get_hash, filepaths)
+        return dict(zip(filepaths, digests))
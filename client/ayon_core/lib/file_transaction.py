@@ -2,8 +2,12 @@ import os
 import logging
 import sys
 import errno
+import threading
+import contextlib
+from concurrent.futures import ThreadPoolExecutor
 
-from ayon_core.lib import create_hard_link
+from ayon_core.lib import create_hard_link, create_reflink, format_file_size
+from ayon_core.lib.file_hash import get_file_hash
 
 # this is needed until speedcopy for linux is fixed
 if sys.platform == "win32":
@@ -22,6 +26,24 @@ class DuplicateDestinationError(ValueError):
     """
 
 
+class FileTransactionError(RuntimeError):
+    """Error raised when one or more file operations failed.
+
+    The error is raised only when files are processed in parallel. All
+    failures of the transaction are available in 'failures' so the caller
+    can report every file that failed, not only the first one.
+
+    Args:
+        message (str): Error message.
+        failures (list[tuple[str, str, Exception]]): Source path, destination
+            path and exception of each failed file operation.
+
+    """
+    def __init__(self, message, failures):
+        super().__init__(message)
+        self.failures = failures
+
+
 class FileTransaction:
     """File transaction with rollback options.
 
@@ -46,14 +68,54 @@ class FileTransaction:
         permissions could be changed, other machines could be moving or writing
         files. A lot can happen.
 
+    Backups and transfers can be processed in parallel by a pool of worker
+    threads when 'max_workers' is higher than 1. This helps mostly when
+    files are transferred to network storage where per-file latency is
+    the bottleneck. Number of concurrent operations on a single volume
+    (device) can be limited with 'max_workers_per_volume'. All backups are
+    finished before any transfer starts, so the rollback works the same way
+    as in serial processing.
+
     Warning:
         Any folders created during the transfer will not be removed.
+
+    Args:
+        log (Optional[logging.Logger]): Logger used for messages.
+        allow_queue_replacements (Optional[bool]): Allow to replace queued
+            transfer to the same destination with a different source.
+        max_workers (Optional[int]): Maximum number of worker threads used
+            to process files. Files are processed serially if value is
+            lower than 2.
+        max_workers_per_volume (Optional[int]): Maximum number of concurrent
+            file operations per destination volume. Not limited if value
+            is lower than 1.
+        skip_identical (Optional[bool]): Leave existing destination files
+            untouched if their content is identical to source file. Content
+            is compared using cached content hashes.
+        incremental (Optional[bool]): Leave existing destination files
+            untouched if they have the same size and modification time
+            (in whole seconds) as source file. Modification time of source
+            is applied to transferred files, so they are recognized as
+            unchanged in next transaction.
+
     """
 
     MODE_COPY = 0
     MODE_HARDLINK = 1
-
-    def __init__(self, log=None, allow_queue_replacements=False):
+    # Copy-on-write copy of file, supported only on some filesystems
+    MODE_REFLINK = 2
+    # Try reflink, then hardlink, then copy
+    MODE_AUTO = 3
+
+    def __init__(
+        self,
+        log=None,
+        allow_queue_replacements=False,
+        max_workers=None,
+        max_workers_per_volume=None,
+        skip_identical=False,
+        incremental=False,
+    ):
         if log is None:
             log = logging.getLogger("FileTransaction")
 
@@ -69,18 +131,44 @@ class FileTransaction:
         # Backup file location mapping to original locations
         self._backup_to_original = {}
 
+        # Destination file paths that were left untouched because they
+        #   are identical to source
+        self._skipped = set()
+        self._skipped_size = 0
+        self._skip_identical = skip_identical
+        self._incremental = incremental
+
         self._allow_queue_replacements = allow_queue_replacements
 
-    def add(self, src, dst, mode=MODE_COPY):
+        self._max_workers = max_workers or 1
+        self._max_workers_per_volume = max_workers_per_volume or 0
+
+        # Lock used when processed in parallel
+        self._lock = threading.Lock()
+        self._volume_semaphores = {}
+        self._volume_id_by_dirpath = {}
+
+    def add(self, src, dst, mode=MODE_COPY, fallback_to_copy=False):
         """Add a new file to transfer queue.
 
+        Link modes are used only if source and destination are on the same
+        volume (device). File is copied if any of link modes fails and
+        'fallback_to_copy' is enabled. Mode 'MODE_AUTO' always falls back
+        to copy.
+
         Args:
             src (str): Source path.
             dst (str): Destination path.
-            mode (MODE_COPY, MODE_HARDLINK): Transfer mode.
+            mode (MODE_COPY, MODE_HARDLINK, MODE_REFLINK, MODE_AUTO):
+                Transfer mode.
+            fallback_to_copy (Optional[bool]): Copy the file if link
+                could not be created.
         """
 
-        opts = {"mode": mode}
+        opts = {
+            "mode": mode,
+            "fallback_to_copy": fallback_to_copy or mode == self.MODE_AUTO,
+        }
 
         src = os.path.normpath(os.path.abspath(src))
         dst = os.path.normpath(os.path.abspath(dst))
@@ -109,42 +197,199 @@ class FileTransaction:
         self._transfers[dst] = (src, opts)
 
     def process(self):
-        # Backup any existing files
-        for dst, (src, _) in self._transfers.items():
-            self.log.debug("Checking file ... {} -> {}".format(src, dst))
-            path_same = self._same_paths(src, dst)
-            if path_same or not os.path.exists(dst):
-                continue
-
-            # Backup original file
-            # todo: add timestamp or uuid to ensure unique
-            backup = dst + ".bak"
+        if self._max_workers > 1:
+            self._process_parallel()
+        else:
+            # Backup any existing files
+            for dst, (src, _) in self._transfers.items():
+                self._backup_file(src, dst)
+
+            # Copy the files to transfer
+            for dst, (src, opts) in self._transfers.items():
+                self._transfer_file(src, dst, opts)
+
+        if self._skipped:
+            self.log.info((
+                "Skipped {} unchanged files ({}), transferred {} files."
+            ).format(
+                len(self._skipped),
+                format_file_size(self._skipped_size),
+                len(self._transferred)
+            ))
+
+    def _process_parallel(self):
+        transfers = [
+            (src, dst, opts)
+            for dst, (src, opts) in self._transfers.items()
+        ]
+        self.log.debug(
+            "Processing {} files using {} workers.".format(
+                len(transfers), self._max_workers))
+
+        # Backup of all files must be finished before any transfer starts
+        self._run_in_pool(
+            "backup",
+            lambda src, dst, _: self._backup_file(src, dst),
+            transfers
+        )
+        self._run_in_pool("transfer", self._transfer_file, transfers)
+
+    def _run_in_pool(self, label, func, transfers):
+        """Run file operation on all transfers in a pool of workers.
+
+        Remaining operations are skipped once any operation fails, and all
+        failures are raised together when the pool is finished.
+
+        Args:
+            label (str): Label of the operation used in messages.
+            func (Callable[[str, str, dict], None]): Function processing
+                one file.
+            transfers (list[tuple[str, str, dict]]): Source path,
+                destination path and transfer options.
+
+        Raises:
+            FileTransactionError: When any of the operations failed.
+
+        """
+        failures = []
+        stop_event = threading.Event()
+
+        def _process(src, dst, opts):
+            if stop_event.is_set():
+                return
+            try:
+                with self._get_volume_semaphore(dst):
+                    func(src, dst, opts)
+            except Exception as exc:
+                stop_event.set()
+                self.log.error(
+                    "Failed to {} file: {} -> {}".format(label, src, dst),
+                    exc_info=True)
+                with self._lock:
+                    failures.append((src, dst, exc))
+
+        with ThreadPoolExecutor(max_workers=self._max_workers) as executor:
+            for src, dst, opts in transfers:
+                executor.submit(_process, src, dst, opts)
+
+        if failures:
+            raise FileTransactionError(
+                "Failed to {} {} file(s):\n{}".format(
+                    label,
+                    len(failures),
+                    "\n".join(
+                        "{} -> {}: {}".format(src, dst, exc)
+                        for src, dst, exc in failures
+                    )
+                ),
+                failures
+            )
+
+    def _backup_file(self, src, dst):
+        self.log.debug("Checking file ... {} -> {}".format(src, dst))
+        path_same = self._same_paths(src, dst)
+        if path_same or not os.path.exists(dst):
+            return
+
+        dst_size = self._get_unchanged_size(src, dst)
+        if dst_size is not None:
+            self.log.debug(
+                "Destination file is identical to source {} -> {}".format(
+                    src, dst))
+            with self._lock:
+                self._skipped.add(dst)
+                self._skipped_size += dst_size
+            return
+
+        # Backup original file
+        # todo: add timestamp or uuid to ensure unique
+        backup = dst + ".bak"
+        self.log.debug(
+            "Backup existing file: {} -> {}".format(dst, backup))
+        os.rename(dst, backup)
+        with self._lock:
             self._backup_to_original[backup] = dst
+
+    def _transfer_file(self, src, dst, opts):
+        path_same = self._same_paths(src, dst)
+        if path_same:
             self.log.debug(
-                "Backup existing file: {} -> {}".format(dst, backup))
-            os.rename(dst, backup)
+                "Source and destination are same files {} -> {}".format(
+                    src, dst))
+            return
 
-        # Copy the files to transfer
-        for dst, (src, opts) in self._transfers.items():
-            path_same = self._same_paths(src, dst)
-            if path_same:
-                self.log.debug(
-                    "Source and destination are same files {} -> {}".format(
-                        src, dst))
-                continue
+        if dst in self._skipped:
+            return
 
-            self._create_folder_for_file(dst)
+        self._create_folder_for_file(dst)
 
-            if opts["mode"] == self.MODE_COPY:
-                self.log.debug("Copying file ... {} -> {}".format(src, dst))
-                copyfile(src, dst)
-            elif opts["mode"] == self.MODE_HARDLINK:
-                self.log.debug("Hardlinking file ... {} -> {}".format(
-                    src, dst))
-                create_hard_link(src, dst)
+        mode = opts["mode"]
+        if mode != self.MODE_COPY:
+            mode = self._link_file(src, dst, opts)
+
+        if mode == self.MODE_COPY:
+            self.log.debug("Copying file ... {} -> {}".format(src, dst))
+            copyfile(src, dst)
+
+        if self._incremental and mode != self.MODE_HARDLINK:
+            # Keep modification time of source to be able to compare
+            #   the files in next transaction
+            src_stat = os.stat(src)
+            os.utime(dst, ns=(src_stat.st_atime_ns, src_stat.st_mtime_ns))
 
+        with self._lock:
             self._transferred.append(dst)
 
+    def _link_file(self, src, dst, opts):
+        """Create hardlink or reflink of source file at destination.
+
+        Args:
+            src (str): Source path.
+            dst (str): Destination path.
+            opts (dict[str, Any]): Transfer options.
+
+        Returns:
+            int: 'MODE_COPY' if file still has to be copied, otherwise
+                mode which was used to create the link.
+
+        """
+        mode = opts["mode"]
+        fallback_to_copy = opts["fallback_to_copy"]
+        if fallback_to_copy:
+            src_volume_id = self._get_volume_id(os.path.dirname(src))
+            dst_volume_id = self._get_volume_id(os.path.dirname(dst))
+            if src_volume_id != dst_volume_id:
+                self.log.debug(
+                    "Source and destination are on different volumes,"
+                    " link can't be created {} -> {}".format(src, dst))
+                return self.MODE_COPY
+
+        if mode == self.MODE_AUTO:
+            link_modes = [self.MODE_REFLINK, self.MODE_HARDLINK]
+        else:
+            link_modes = [mode]
+
+        for link_mode in link_modes:
+            try:
+                if link_mode == self.MODE_REFLINK:
+                    self.log.debug("Reflinking file ... {} -> {}".format(
+                        src, dst))
+                    create_reflink(src, dst)
+                else:
+                    self.log.debug("Hardlinking file ... {} -> {}".format(
+                        src, dst))
+                    create_hard_link(src, dst)
+                return link_mode
+
+            except OSError:
+                if not fallback_to_copy:
+                    raise
+                self.log.debug(
+                    "Failed to create link {} -> {}".format(src, dst),
+                    exc_info=True)
+
+        return self.MODE_COPY
+
     def finalize(self):
         # Delete any backed up files
         for backup in self._backup_to_original.keys():
@@ -197,6 +442,49 @@ class FileTransaction:
         """Return the backup file paths"""
         return list(self._backup_to_original.keys())
 
+    @property
+    def skipped(self):
+        """Return destination paths left untouched as identical to source"""
+        return list(self._skipped)
+
+    @property
+    def skipped_size(self):
+        """Return size in bytes of files left untouched"""
+        return self._skipped_size
+
+    def _get_unchanged_size(self, src, dst):
+        """Compare source and existing destination file.
+
+        Args:
+            src (str): Source path.
+            dst (str): Destination path.
+
+        Returns:
+            Union[int, None]: Size of destination file if it is identical
+                to source, None otherwise.
+
+        """
+        if not self._incremental and not self._skip_identical:
+            return None
+
+        src_stat = os.stat(src)
+        dst_stat = os.stat(dst)
+        if src_stat.st_size != dst_stat.st_size:
+            return None
+
+        if (
+            self._incremental
+            and int(src_stat.st_mtime) == int(dst_stat.st_mtime)
+        ):
+            return dst_stat.st_size
+
+        if self._skip_identical:
+            src_hash = get_file_hash(src, stat_result=src_stat)
+            dst_hash = get_file_hash(dst, stat_result=dst_stat)
+            if src_hash == dst_hash:
+                return dst_stat.st_size
+        return None
+
     def _create_folder_for_file(self, path):
         dirname = os.path.dirname(path)
         try:
@@ -206,6 +494,61 @@ class FileTransaction:
                 self.log.critical("An unexpected error occurred.")
                 raise e
 
+    def _get_volume_semaphore(self, path):
+        """Semaphore limiting concurrent operations on volume of the path.
+
+        Args:
+            path (str): Destination path.
+
+        Returns:
+            Union[threading.Semaphore, contextlib.nullcontext]: Context
+                manager which limits concurrency.
+
+        """
+        if self._max_workers_per_volume < 1:
+            return contextlib.nullcontext()
+
+        volume_id = self._get_volume_id(os.path.dirname(path))
+        with self._lock:
+            semaphore = self._volume_semaphores.get(volume_id)
+            if semaphore is None:
+                semaphore = threading.Semaphore(self._max_workers_per_volume)
+                self._volume_semaphores[volume_id] = semaphore
+        return semaphore
+
+    def _get_volume_id(self, dirpath):
+        """Device id of the closest existing folder of the path.
+
+        Args:
+            dirpath (str): Folder path which may not exist yet.
+
+        Returns:
+            Union[int, str]: Device id or path of the folder if device could
+                not be found.
+
+        """
+        with self._lock:
+            volume_id = self._volume_id_by_dirpath.get(dirpath)
+        if volume_id is not None:
+            return volume_id
+
+        volume_id = dirpath
+        current_path = dirpath
+        while current_path:
+            try:
+                volume_id = os.stat(current_path).st_dev
+                break
+            except OSError:
+                pass
+            parent_path = os.path.dirname(current_path)
+            if parent_path == current_path:
+                break
+            current_path = parent_path
+
+        with self._lock:
+            self._volume_id_by_dirpath[dirpath] = volume_id
+        return volume_id
+
     def _same_paths(self, src, dst):
         # handles same paths but with C:/project vs c:/project
         if os.path.exists(src) and os.path.exists(dst):
@@ -3,6 +3,7 @@ import re
 import copy
 import numbers
 import warnings
+import threading
 from string import Formatter
 import typing
 from typing import List, Dict, Any, Set
@@ -12,6 +13,8 @@ if typing.TYPE_CHECKING:
 
 SUB_DICT_PATTERN = re.compile(r"([^\[\]]+)")
 OPTIONAL_PATTERN = re.compile(r"(<.*?[^{0]*>)[^0-9]*?")
+# Maximum number of parsed templates cached by template string
+_PARSED_TEMPLATES_CACHE_LIMIT = 1024
 
 
 class TemplateUnsolved(Exception):
@@ -52,6 +55,31 @@ class StringTemplate:
             )
 
         self._template: str = template
+        self._parts, self._compiled = self._get_parsed_template(template)
+
+    def _get_parsed_template(self, template: str):
+        """Parsed and compiled template parts cached by template string.
+
+        Parts are not modified on format so they can be shared between
+        template objects.
+        """
+        with _parsed_templates_lock:
+            parsed = _parsed_templates_cache.get(template)
+        if parsed is not None:
+            return parsed
+
+        parts = self._parse_parts(template)
+        parsed = (parts, _CompiledTemplate.from_parts(parts))
+        with _parsed_templates_lock:
+            cache = _parsed_templates_cache
+            if len(cache) >= _PARSED_TEMPLATES_CACHE_LIMIT:
+                cache.pop(next(iter(cache)))
+            cache[template] = parsed
+        return parsed
+
+    def _parse_parts(
+        self, template: str
+    ) -> List["Union[str, OptionalPart, FormattingPart]"]:
         parts = []
         formatter = Formatter()
 
@@ -82,9 +110,7 @@ class StringTemplate:
             if substr:
                 new_parts.append(substr)
 
-        self._parts: List["Union[str, OptionalPart, FormattingPart]"] = (
-            self.find_optional_parts(new_parts)
-        )
+        return self.find_optional_parts(new_parts)
 
     def __str__(self) -> str:
         return self.template
@@ -117,6 +143,12 @@ class StringTemplate:
                 data needed or missing for filling template.
 
         """
+        # Use fast path when all keys are available with valid values
+        if self._compiled is not None:
+            result = self._compiled.format(data, self.template)
+            if result is not None:
+                return result
+
         result = TemplatePartResult()
         for part in self._parts:
             if isinstance(part, str):
@@ -714,3 +746,191 @@ class OptionalPart:
         if new_result.solved:
             result.add_output(new_result)
         return result
+
+
+class _KeyStep:
+    """Compiled formatting key of '_CompiledTemplate'.
+
+    Args:
+        part (FormattingPart): Formatting part.
+        reuse_idx (Union[int, None]): Index of previous step with the same
+            key which output is used instead of formatting.
+
+    """
+    def __init__(self, part: FormattingPart, reuse_idx: "Union[int, None]"):
+        self.part = part
+        self.reuse_idx = reuse_idx
+        self.used_key = part._template_base
+        self.keys = tuple(SUB_DICT_PATTERN.findall(part._field_name))
+        self.format_spec = part._format_spec[1:]
+        self.conversion = part._conversion[1:]
+
+    @classmethod
+    def is_compilable(cls, part: FormattingPart) -> bool:
+        """Can the part be formatted without 'str.format'.
+
+        Keys which need special handling (list indexes, attributes,
+        nested format specs or invalid keys) are formatted only by
+        'StringTemplate' parts.
+        """
+        field_name = part._field_name
+        keys = SUB_DICT_PATTERN.findall(field_name)
+        return (
+            bool(keys)
+            and part.validate_key_is_matched(part._template_base)
+            and "." not in field_name
+            and not any(key.isdigit() for key in keys)
+            and "{" not in part._format_spec
+            and part._conversion[1:] in ("", "r", "s", "a")
+        )
+
+    def get_value(self, data: Dict[str, Any]) -> Any:
+        """Get valid value from data or '_MISSING' if not available."""
+        value = data
+        for key in self.keys:
+            if not hasattr(value, "items") or key not in value:
+                return _MISSING
+            value = value.get(key)
+
+        if not FormattingPart.validate_value_type(value):
+            return _MISSING
+        return value
+
+    def format_value(self, value: Any) -> str:
+        if self.format_spec:
+            # Conversion after format spec is part of format spec
+            #   in 'FormattingPart'
+            return format(value, self.format_spec + self.part._conversion)
+        if self.conversion == "r":
+            value = repr(value)
+        elif self.conversion == "s":
+            value = str(value)
+        elif self.conversion == "a":
+            value = ascii(value)
+        return format(value, "")
+
+
+class _CompiledTemplate:
+    """Template parts compiled to literal and key steps.
+
+    Optional parts are flattened, all keys of the template are filled so
+    optional parts are always part of the output. Result is the same as
+    from 'StringTemplate.format' when all keys are available with valid
+    values, otherwise 'None' is returned to use full formatting.
+
+    Args:
+        steps (list[Union[str, _KeyStep]]): Literal and key steps.
+
+    """
+    def __init__(self, steps: List["Union[str, _KeyStep]"]):
+        self._steps = steps
+
+    @classmethod
+    def from_parts(
+        cls, parts: List["Union[str, OptionalPart, FormattingPart]"]
+    ) -> "Union[_CompiledTemplate, None]":
+        """Compile template parts.
+
+        Returns:
+            Union[_CompiledTemplate, None]: Compiled template or None if
+                template contains keys that can't be compiled.
+
+        """
+        steps = []
+        if not cls._compile_parts(parts, steps, {}):
+            return None
+        return cls(steps)
+
+    @classmethod
+    def _compile_parts(cls, parts, steps, step_idx_by_field):
+        for part in parts:
+            if isinstance(part, str):
+                steps.append(part)
+
+            elif isinstance(part, OptionalPart):
+                # Optional part has own scope of used values which is
+                #   merged to parent scope when it is solved
+                optional_idx_by_field = {}
+                if not cls._compile_parts(
+                    part.parts, steps, optional_idx_by_field
+                ):
+                    return False
+                step_idx_by_field.update(optional_idx_by_field)
+
+            else:
+                if not _KeyStep.is_compilable(part):
+                    return False
+                # Key without format spec and conversion reuses output of
+                #   previous key with the same field in the scope
+                reuse_idx = step_idx_by_field.get(part._template_base)
+                if reuse_idx is None:
+                    step_idx_by_field[part._field_name] = len(steps)
+                steps.append(_KeyStep(part, reuse_idx))
+        return True
+
+    def format(
+        self, data: Dict[str, Any], template: str
+    ) -> "Union[TemplateResult, None]":
+        """Format template with data.
+
+        Args:
+            data (dict[str, Any]): Data to be filled into template.
+            template (str): Template string stored to result.
+
+        Returns:
+            Union[TemplateResult, None]: Result or None if any key is not
+                available or has invalid value.
+
+        """
+        output = []
+        used_values = {}
+        step_used_values = {}
+        for idx, step in enumerate(self._steps):
+            if isinstance(step, str):
+                output.append(step)
+                continue
+
+            if step.reuse_idx is not None:
+                used_value = step_used_values[step.reuse_idx]
+                if not isinstance(used_value, str):
+                    return None
+                output.append(used_value)
+                continue
+
+            value = step.get_value(data)
+            if value is _MISSING:
+                return None
+
+            formatted_value = step.format_value(value)
+            used_value = formatted_value
+            if isinstance(value, numbers.Number):
+                used_value = value
+            step_used_values[idx] = used_value
+            used_values[step.used_key] = (step.keys, used_value)
+            output.append(formatted_value)
+
+        # Split used values to subdicts like 'TemplatePartResult'
+        clean_used_values = {}
+        for keys, value in used_values.values():
+            if isinstance(value, FormatObject):
+                value = str(value)
+            sub_data = clean_used_values
+            for key in keys[:-1]:
+                if key not in sub_data:
+                    sub_data[key] = {}
+                sub_data = sub_data[key]
+            sub_data[keys[-1]] = value
+
+        return TemplateResult(
+            "".join(output),
+            template,
+            True,
+            clean_used_values,
+            set(),
+            {}
+        )
+
+
+_MISSING = object()
+_parsed_templates_cache = {}
+_parsed_templates_lock = threading.Lock()
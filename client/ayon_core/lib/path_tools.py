@@ -1,11 +1,18 @@
 import os
 import re
+import sys
+import errno
 import logging
+import collections
+from concurrent.futures import ThreadPoolExecutor
 
 import clique
 
 log = logging.getLogger(__name__)
 
+# Linux 'ioctl' request code to clone a file ('FICLONE' from 'linux/fs.h')
+_FICLONE = 0x40049409
+
 
 def format_file_size(file_size, suffix=None):
     """Returns formatted string with size in appropriate unit.
@@ -40,6 +47,127 @@ def create_hard_link(src_path, dst_path):
     os.link(src_path, dst_path)
 
 
+def create_reflink(src_path, dst_path):
+    """Create copy-on-write copy (reflink) of file.
+
+    Reflink shares data blocks of the source file until any of the files
+    is modified, so the copy is created almost immediately. It is supported
+    only on Linux on filesystems with copy-on-write support (e.g. btrfs,
+    XFS), and both paths must be on the same filesystem.
+
+    Args:
+        src_path(str): Full path to a file which is used as source for
+            reflink.
+        dst_path(str): Full path to a file where a copy of source will be
+            created.
+
+    Raises:
+        OSError: When reflink is not supported by platform or filesystem.
+    """
+    if not sys.platform.startswith("linux"):
+        raise OSError(
+            errno.EOPNOTSUPP,
+            "Reflinks are not supported on this platform",
+            src_path
+        )
+
+    import fcntl
+
+    with open(src_path, "rb") as src_stream:
+        with open(dst_path, "wb") as dst_stream:
+            try:
+                fcntl.ioctl(
+                    dst_stream.fileno(), _FICLONE, src_stream.fileno()
+                )
+            except OSError as exc:
+                clone_error = exc
+            else:
+                return
+
+    # Remove empty destination file created before the failed clone
+    os.remove(dst_path)
+    raise clone_error
+
+
+def _stat_files_in_dir(dirpath, filenames):
+    """Stat files from single directory.
+
+    Directory is listed with 'os.scandir' when more than one file is
+    requested. On Windows the stat is received with the listing, so there
+    is no separate request per file. On other platforms 'DirEntry.stat'
+    still calls 'stat' for each file, only files which are not in
+    the directory are not requested.
+
+    Args:
+        dirpath (str): Directory path.
+        filenames (set[str]): Filenames in the directory.
+
+    Returns:
+        dict[str, os.stat_result]: Stat result by filepath.
+    """
+    output = {}
+    if len(filenames) > 1:
+        remaining = set(filenames)
+        try:
+            with os.scandir(dirpath) as scan_iter:
+                for entry in scan_iter:
+                    if entry.name in remaining:
+                        remaining.discard(entry.name)
+                        output[os.path.join(dirpath, entry.name)] = (
+                            entry.stat()
+                        )
+        except OSError:
+            remaining = set(filenames)
+        filenames = remaining
+
+    # Stat files that were not found during directory listing
+    for filename in filenames:
+        filepath = os.path.join(dirpath, filename)
+        output[filepath] = os.stat(filepath)
+    return output
+
+
+def stat_files(filepaths, max_workers=None):
+    """Stat multiple files with minimum requests to filesystem.
+
+    Files are grouped by directory and each directory is processed once.
+    Directories can be processed in parallel which helps on network storage
+    where each request has significant latency.
+
+    Args:
+        filepaths (Iterable[str]): Paths to files.
+        max_workers (Optional[int]): Maximum number of directories processed
+            at the same time. Directories are processed serially if value
+            is lower than 2.
+
+    Returns:
+        dict[str, os.stat_result]: Stat result by normalized filepath.
+
+    Raises:
+        OSError: When any of the files does not exist.
+    """
+    filenames_by_dirpath = collections.defaultdict(set)
+    for filepath in filepaths:
+        filepath = os.path.normpath(filepath)
+        dirpath, filename = os.path.split(filepath)
+        filenames_by_dirpath[dirpath].add(filename)
+
+    output = {}
+    if not max_workers or max_workers < 2 or len(filenames_by_dirpath) < 2:
+        for dirpath, filenames in filenames_by_dirpath.items():
+            output.update(_stat_files_in_dir(dirpath, filenames))
+        return output
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(_stat_files_in_dir, dirpath, filenames)
+            for dirpath, filenames in filenames_by_dirpath.items()
+        ]
+        for future in futures:
+            output.update(future.result())
+    return output
+
+
 def collect_frames(files):
     """Returns dict of source path and its frame, if from sequence
 
@@ -1,8 +1,16 @@
 import re
+import copy
 import logging
+import threading
+from types import MappingProxyType
 
 log = logging.getLogger(__name__)
 
+# Characters which make profile value a regex instead of exact value
+_REGEX_CHARS = set(".^$*+?{}[]\\|()")
+# Maximum number of matchers cached by 'filter_profiles'
+_MATCHERS_CACHE_LIMIT = 128
+
 
 def compile_list_of_regexes(in_list):
     """Convert strings in entered list to compiled regex objects."""
@@ -116,6 +124,316 @@ def validate_value_by_regexes(value, in_list):
     return -1
 
 
+class _ProfileKeyFilter:
+    """Compiled filter of one profile key.
+
+    Args:
+        in_list (Any): Value of the key in profile.
+
+    """
+    def __init__(self, in_list):
+        if not in_list:
+            in_list = []
+        elif not isinstance(in_list, (list, tuple, set)):
+            in_list = [in_list]
+
+        self.in_list = in_list
+        # Profile does not filter by the key
+        self.is_any = not in_list or "*" in in_list
+        self.exact_values = set()
+        self.regexes = []
+        if self.is_any:
+            return
+
+        regex_items = []
+        for item in in_list:
+            if isinstance(item, str) and not _REGEX_CHARS.intersection(item):
+                if item:
+                    self.exact_values.add(item)
+            else:
+                regex_items.append(item)
+        self.regexes = compile_list_of_regexes(regex_items)
+
+    def validate(self, value):
+        """Validate value like 'validate_value_by_regexes'.
+
+        Returns:
+            int: '0' when profile does not filter by the key, '1' when
+                value matches and '-1' when value does not match.
+
+        """
+        if self.is_any:
+            return 0
+        if not value:
+            return -1
+        if value in self.exact_values:
+            return 1
+        for regex in self.regexes:
+            if regex.fullmatch(value):
+                return 1
+        return -1
+
+
+class ProfileMatcher:
+    """Compiled profiles for repeated filtering by key values.
+
+    Profile values are compiled once per key when they're needed. When
+    the matcher is used repeatedly, profiles with exact values of a key are
+    indexed by the value. Results are memoized per key values.
+
+    Matching gives the same result as 'filter_profiles'.
+
+    Note:
+        Profiles must not be modified after the matcher is created.
+
+    Args:
+        profiles_data (Iterable[dict[str, Any]]): Profile definitions.
+        keys_order (Optional[Iterable[str]]): Order of keys which matters
+            only when multiple profiles have same score.
+        logger (Optional[logging.Logger]): Logger used for debug messages.
+
+    """
+    def __init__(self, profiles_data, keys_order=None, logger=None):
+        self._profiles = tuple(profiles_data or [])
+        self._keys_order = tuple(keys_order or [])
+        self._logger = logger or log
+        self._lock = threading.Lock()
+        self._filters_by_key = {}
+        self._index_by_key = {}
+        self._results = {}
+        # Exact values are indexed only when matcher is used repeatedly
+        self._use_index = False
+
+    @property
+    def profiles(self):
+        return self._profiles
+
+    @property
+    def keys_order(self):
+        return self._keys_order
+
+    def match(self, key_values, logger=None):
+        """Find the most matching profile for key values.
+
+        Args:
+            key_values (dict[str, Any]): Mapping of Key <-> Value. Key is
+                checked if is available in profile and if Value is matching
+                it's values.
+            logger (Optional[logging.Logger]): Logger used instead of
+                matcher's logger.
+
+        Returns:
+            Union[dict[str, Any], None]: Most matching profile or None if
+                none of profiles match.
+
+        """
+        if logger is None:
+            logger = self._logger
+        if not self._profiles:
+            return None
+
+        keys_order = list(self._keys_order)
+        # Make all keys from `key_values` are passed
+        for key in key_values.keys():
+            if key not in keys_order:
+                keys_order.append(key)
+
+        items = tuple((key, key_values[key]) for key in keys_order)
+
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
+        log_parts = None
+        if debug_enabled:
+            log_parts = " | ".join([
+                "{}: \"{}\"".format(*item)
+                for item in key_values.items()
+            ])
+            logger.debug(
+                "Looking for matching profile for: {}".format(log_parts)
+            )
+
+        try:
+            hash(items)
+        except TypeError:
+            items_hashable = False
+        else:
+            items_hashable = True
+
+        with self._lock:
+            if items_hashable and items in self._results:
+                profile_idx = self._results[items]
+            else:
+                profile_idx = self._find_profile_idx(
+                    items, logger, log_parts
+                )
+                self._use_index = True
+                if items_hashable:
+                    self._results[items] = profile_idx
+
+        if profile_idx is None:
+            return None
+
+        profile = self._profiles[profile_idx]
+        if debug_enabled:
+            logger.debug(
+                "Profile selected: {}".format(profile)
+            )
+        return profile
+
+    def _get_key_filter(self, key, profile_idx):
+        filters = self._filters_by_key.get(key)
+        if filters is None:
+            filters = [None] * len(self._profiles)
+            self._filters_by_key[key] = filters
+
+        key_filter = filters[profile_idx]
+        if key_filter is None:
+            key_filter = _ProfileKeyFilter(
+                self._profiles[profile_idx].get(key)
+            )
+            filters[profile_idx] = key_filter
+        return key_filter
+
+    def _get_exact_matches(self, key, value):
+        """Indexes of profiles which have the value as exact value of key.
+
+        Returns:
+            set[int]: Indexes of profiles.
+
+        """
+        if not self._use_index:
+            return ()
+
+        index = self._index_by_key.get(key)
+        if index is None:
+            index = {}
+            for profile_idx in range(len(self._profiles)):
+                key_filter = self._get_key_filter(key, profile_idx)
+                for exact_value in key_filter.exact_values:
+                    index.setdefault(exact_value, set()).add(profile_idx)
+            self._index_by_key[key] = index
+
+        try:
+            return index.get(value, ())
+        except TypeError:
+            return ()
+
+    def _find_profile_idx(self, items, logger, log_parts):
+        debug_enabled = log_parts is not None
+        points = [0] * len(self._profiles)
+        scores_by_profile = [[] for _ in self._profiles]
+        for key, value in items:
+            exact_matches = self._get_exact_matches(key, value)
+            for profile_idx, profile_points in enumerate(points):
+                if profile_points < 0:
+                    continue
+                if profile_idx in exact_matches:
+                    match = 1
+                else:
+                    key_filter = self._get_key_filter(key, profile_idx)
+                    match = key_filter.validate(value)
+                if match == -1:
+                    if debug_enabled:
+                        profile_value = (
+                            self._profiles[profile_idx].get(key) or []
+                        )
+                        logger.debug(
+                            "\"{}\" not found in \"{}\": {}".format(
+                                value, key, profile_value
+                            )
+                        )
+                    points[profile_idx] = -1
+                    continue
+                points[profile_idx] += match
+                scores_by_profile[profile_idx].append(bool(match))
+
+        highest_profile_points = max(points)
+        if highest_profile_points < 0:
+            if debug_enabled:
+                logger.debug(
+                    "None of profiles match your setup. {}".format(log_parts)
+                )
+            return None
+
+        matching_profiles = [
+            (profile_idx, scores_by_profile[profile_idx])
+            for profile_idx, profile_points in enumerate(points)
+            if profile_points == highest_profile_points
+        ]
+        if len(matching_profiles) > 1 and debug_enabled:
+            logger.debug(
+                "More than one profile match your setup. {}".format(log_parts)
+            )
+
+        return _profile_exclusion(matching_profiles, logger)
+
+
+_matchers_cache = {}
+_matchers_cache_lock = threading.Lock()
+
+
+def _is_read_only_profiles(profiles_data):
+    return isinstance(profiles_data, tuple) and all(
+        isinstance(profile, MappingProxyType)
+        for profile in profiles_data
+    )
+
+
+def _get_profile_matcher(profiles_data, keys_order):
+    """Get cached profile matcher for profiles.
+
+    Matchers are cached by profiles object when the same object is used
+    repeatedly. Mutable profiles are compared with a copy made when
+    the matcher was created, so matcher is created again when the profiles
+    were modified. Read-only profiles, e.g. from read-only settings, can't
+    change and are not compared.
+    """
+    read_only = _is_read_only_profiles(profiles_data)
+    key = (id(profiles_data), keys_order)
+    with _matchers_cache_lock:
+        cached = _matchers_cache.get(key)
+
+    # Cache item keeps reference to profiles so id can't be reused
+    if cached is not None and cached[0] is profiles_data:
+        _, matcher, profiles_copy = cached
+        if matcher is not None and (
+            read_only
+            or (
+                profiles_copy == profiles_data
+                and all(
+                    profile is matcher_profile
+                    for profile, matcher_profile in zip(
+                        profiles_data, matcher.profiles
+                    )
+                )
+            )
+        ):
+            return matcher
+    elif not read_only:
+        # Copy of mutable profiles is made only when the profiles are
+        #   used repeatedly
+        _set_cached_matcher(key, (profiles_data, None, None))
+        return ProfileMatcher(profiles_data, keys_order)
+
+    profiles_copy = None
+    if not read_only:
+        try:
+            profiles_copy = copy.deepcopy(profiles_data)
+        except Exception:
+            return ProfileMatcher(profiles_data, keys_order)
+
+    matcher = ProfileMatcher(profiles_data, keys_order)
+    _set_cached_matcher(key, (profiles_data, matcher, profiles_copy))
+    return matcher
+
+
+def _set_cached_matcher(key, item):
+    with _matchers_cache_lock:
+        _matchers_cache.pop(key, None)
+        if len(_matchers_cache) >= _MATCHERS_CACHE_LIMIT:
+            _matchers_cache.pop(next(iter(_matchers_cache)))
+        _matchers_cache[key] = item
+
+
 def filter_profiles(profiles_data, key_values, keys_order=None, logger=None):
     """ Filter profiles by entered key -> values.
 
@@ -134,6 +452,10 @@ def filter_profiles(profiles_data, key_values, keys_order=None, logger=None):
     profiles with same score then first in order is used (order of profiles
     matter).
 
+    Function is a wrapper over 'ProfileMatcher'. Matchers are cached per
+    profiles object until the profiles are modified, so repeated calls
+    with the same profiles reuse compiled profiles.
+
     Args:
         profiles_data (list): Profile definitions as dictionaries.
         key_values (dict): Mapping of Key <-> Value. Key is checked if is
@@ -149,79 +471,6 @@ def filter_profiles(profiles_data, key_values, keys_order=None, logger=None):
     if not profiles_data:
         return None
 
-    if not logger:
-        logger = log
-
-    if not keys_order:
-        keys_order = tuple(key_values.keys())
-    else:
-        _keys_order = list(keys_order)
-        # Make all keys from `key_values` are passed
-        for key in key_values.keys():
-            if key not in _keys_order:
-                _keys_order.append(key)
-        keys_order = tuple(_keys_order)
-
-    log_parts = " | ".join([
-        "{}: \"{}\"".format(*item)
-        for item in key_values.items()
-    ])
-
-    logger.debug(
-        "Looking for matching profile for: {}".format(log_parts)
-    )
-
-    matching_profiles = None
-    highest_profile_points = -1
-    # Each profile get 1 point for each matching filter. Profile with most
-    # points is returned. For cases when more than one profile will match
-    # are also stored ordered lists of matching values.
-    for profile in profiles_data:
-        profile_points = 0
-        profile_scores = []
-
-        for key in keys_order:
-            value = key_values[key]
-            match = validate_value_by_regexes(value, profile.get(key))
-            if match == -1:
-                profile_value = profile.get(key) or []
-                logger.debug(
-                    "\"{}\" not found in \"{}\": {}".format(value, key,
-                                                            profile_value)
-                )
-                profile_points = -1
-                break
-
-            profile_points += match
-            profile_scores.append(bool(match))
-
-        if (
-            profile_points < 0
-            or profile_points < highest_profile_points
-        ):
-            continue
-
-        if profile_points > highest_profile_points:
-            matching_profiles = []
-            highest_profile_points = profile_points
-
-        if profile_points == highest_profile_points:
-            matching_profiles.append((profile, profile_scores))
-
-    if not matching_profiles:
-        logger.debug(
-            "None of profiles match your setup. {}".format(log_parts)
-        )
-        return None
-
-    if len(matching_profiles) > 1:
-        logger.debug(
-            "More than one profile match your setup. {}".format(log_parts)
-        )
-
-    profile = _profile_exclusion(matching_profiles, logger)
-    if profile:
-        logger.debug(
-            "Profile selected: {}".format(profile)
-        )
-    return profile
+    keys_order = tuple(keys_order or [])
+    matcher = _get_profile_matcher(profiles_data, keys_order)
+    return matcher.match(key_values, logger)
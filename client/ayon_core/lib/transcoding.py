@@ -1,7 +1,11 @@
 import os
 import re
+import copy
+import math
+import hashlib
 import logging
 import json
+import threading
 import collections
 import tempfile
 import subprocess
@@ -10,7 +14,9 @@ from typing import Optional
 
 import xml.etree.ElementTree
 
-from .execute import run_subprocess
+import clique
+
+from .execute import run_subprocess, run_subprocesses
 from .vendor_bin_utils import (
     get_ffmpeg_tool_args,
     get_oiio_tool_args,
@@ -79,11 +85,185 @@ def get_transcode_temp_directory():
     )
 
 
+class _MediaInfoCache:
+    """Process wide cache of media information loaded by tools.
+
+    Information is cached by path, modification time and size of the file,
+    so changed file is loaded again. The least recently used items are
+    removed when cache reaches maximum size.
+
+    Raw output of tools is also stored to directory defined by
+    'AYON_MEDIA_INFO_CACHE_DIR' environment variable if is set, so
+    the information can be shared across processes.
+
+    Args:
+        max_items (int): Maximum number of items in memory.
+
+    """
+    def __init__(self, max_items):
+        self._max_items = max_items
+        self._items = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_key(self, kind, filepath, *options):
+        """Key of cache item.
+
+        Args:
+            kind (str): Kind of information (e.g. tool name).
+            filepath (str): Path to file.
+            *options (Any): Additional options affecting the output.
+
+        Returns:
+            Union[tuple, None]: Key or None if file does not exist, e.g.
+                when path is frame range pattern.
+
+        """
+        try:
+            stat_result = os.stat(filepath)
+        except (OSError, ValueError):
+            return None
+        return (
+            kind,
+            os.path.normcase(os.path.abspath(filepath)),
+            stat_result.st_mtime_ns,
+            stat_result.st_size,
+            options,
+        )
+
+    def get(self, key):
+        with self._lock:
+            value = self._items.get(key)
+            if value is not None:
+                self._items.move_to_end(key)
+        return value
+
+    def set(self, key, value):
+        with self._lock:
+            self._items[key] = value
+            self._items.move_to_end(key)
+            while len(self._items) > self._max_items:
+                self._items.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
+
+    def get_raw_output(self, key):
+        """Get raw tool output stored on disk.
+
+        Args:
+            key (tuple): Key of cache item.
+
+        Returns:
+            Union[str, None]: Raw output of tool or None if not stored.
+
+        """
+        filepath = self._get_raw_output_path(key)
+        if not filepath or not os.path.exists(filepath):
+            return None
+        try:
+            with open(filepath, "r", encoding="utf-8") as stream:
+                return stream.read()
+        except OSError:
+            return None
+
+    def set_raw_output(self, key, output):
+        """Store raw tool output on disk.
+
+        Args:
+            key (tuple): Key of cache item.
+            output (str): Raw output of tool.
+
+        """
+        filepath = self._get_raw_output_path(key)
+        if not filepath:
+            return
+        try:
+            os.makedirs(os.path.dirname(filepath), exist_ok=True)
+            # Write to temp file first to avoid reading of partial file
+            #   from other processes
+            tmp_path = "{}.{}.tmp".format(filepath, os.getpid())
+            with open(tmp_path, "w", encoding="utf-8") as stream:
+                stream.write(output)
+            os.replace(tmp_path, filepath)
+        except OSError:
+            pass
+
+    def _get_raw_output_path(self, key):
+        cache_dir = os.getenv("AYON_MEDIA_INFO_CACHE_DIR")
+        if not cache_dir:
+            return None
+        key_hash = hashlib.sha1(repr(key).encode("utf-8")).hexdigest()
+        return os.path.join(cache_dir, key[0], key_hash)
+
+
+# Maximum number of media information cached in memory
+MEDIA_INFO_CACHE_SIZE = 512
+_media_info_cache = _MediaInfoCache(MEDIA_INFO_CACHE_SIZE)
+
+
+def clear_media_info_cache():
+    """Clear in-memory cache of media information.
+
+    Cache is used by 'get_oiio_info_for_input' and 'get_ffprobe_data'.
+    """
+    _media_info_cache.clear()
+
+
+def _get_cached_media_info(kind, filepath, options, load_func, parse_func):
+    """Get media information using process wide cache.
+
+    Args:
+        kind (str): Kind of information.
+        filepath (str): Path to file.
+        options (tuple): Options affecting the output.
+        load_func (Callable[[], str]): Function which runs tool and returns
+            raw output.
+        parse_func (Callable[[str], Any]): Function parsing raw output.
+
+    Returns:
+        Any: Copy of parsed information.
+
+    """
+    key = _media_info_cache.get_key(kind, filepath, *options)
+    if key is None:
+        return parse_func(load_func())
+
+    value = _media_info_cache.get(key)
+    if value is None:
+        output = _media_info_cache.get_raw_output(key)
+        if output is None:
+            output = load_func()
+            value = parse_func(output)
+            _media_info_cache.set_raw_output(key, output)
+        else:
+            value = parse_func(output)
+        _media_info_cache.set(key, value)
+
+    # Return copy so the cached value can't be modified
+    return copy.deepcopy(value)
+
+
 def get_oiio_info_for_input(filepath, logger=None, subimages=False):
     """Call oiiotool to get information about input and return stdout.
 
     Stdout should contain xml format string.
+
+    Output is cached by path, modification time and size of the file,
+    so each file is processed by oiiotool only once.
     """
+    return _get_cached_media_info(
+        "oiiotool",
+        filepath,
+        (subimages, ),
+        lambda: _run_oiio_info_for_input(filepath, logger, subimages),
+        lambda output: _parse_oiio_info_output(
+            output, filepath, logger, subimages
+        ),
+    )
+
+
+def _run_oiio_info_for_input(filepath, logger, subimages):
     args = get_oiio_tool_args(
         "oiiotool",
         "--info",
@@ -94,7 +274,10 @@ def get_oiio_info_for_input(filepath, logger=None, subimages=False):
 
     args.extend(["-i:infoformat=xml", filepath])
 
-    output = run_subprocess(args, logger=logger)
+    return run_subprocess(args, logger=logger)
+
+
+def _parse_oiio_info_output(output, filepath, logger, subimages):
     output = output.replace("\r\n", "\n")
 
     xml_started = False
@@ -657,10 +840,81 @@ def convert_for_ffmpeg(
     run_subprocess(oiio_cmd, logger=logger)
 
 
+def get_oiio_frame_sequence_paths(filepaths, frames_per_chunk=None):
+    """Group paths of image sequence to oiiotool frame range paths.
+
+    Contiguous frames of a sequence are replaced by single path with frame
+    range (e.g. 'img.1001-1100@@@@.exr') so the whole range can be processed
+    by single oiiotool process. Frame sequence with gaps is split to
+    multiple contiguous ranges. Files which are not part of a sequence, or
+    can't be expressed with frame range, are returned as they are.
+
+    Args:
+        filepaths (Iterable[str]): Paths to files.
+        frames_per_chunk (Optional[int]): Maximum number of frames in single
+            frame range. Range is not split if not passed.
+
+    Returns:
+        list[str]: Frame range paths and paths of other files.
+
+    """
+    filepaths = list(filepaths)
+    frame_collections, remainders = clique.assemble(
+        filepaths,
+        patterns=[clique.PATTERNS["frames"]],
+        assume_padded_when_ambiguous=True
+    )
+    output = list(remainders)
+    for collection in frame_collections:
+        # Frame range characters in filename would be handled by oiiotool
+        if any(
+            char in part
+            for part in (collection.head, collection.tail)
+            for char in "#@"
+        ):
+            output.extend(collection)
+            continue
+
+        for sub_collection in collection.separate():
+            indexes = list(sub_collection.indexes)
+            padding = sub_collection.padding
+            if not padding:
+                # Unpadded frames can be used only if have same length
+                index_lengths = {len(str(index)) for index in indexes}
+                if len(index_lengths) != 1:
+                    output.extend(sub_collection)
+                    continue
+                padding = index_lengths.pop()
+
+            if len(indexes) == 1 or any(index < 0 for index in indexes):
+                output.extend(sub_collection)
+                continue
+
+            chunk_size = frames_per_chunk or len(indexes)
+            for idx in range(0, len(indexes), chunk_size):
+                chunk = indexes[idx:idx + chunk_size]
+                if len(chunk) == 1:
+                    output.append("{}{}{}".format(
+                        sub_collection.head,
+                        str(chunk[0]).zfill(padding),
+                        sub_collection.tail
+                    ))
+                    continue
+                output.append("{}{}-{}{}{}".format(
+                    sub_collection.head,
+                    chunk[0],
+                    chunk[-1],
+                    "@" * padding,
+                    sub_collection.tail
+                ))
+    return output
+
+
 def convert_input_paths_for_ffmpeg(
     input_paths,
     output_dir,
-    logger=None
+    logger=None,
+    max_workers=None,
 ):
     """Convert source file to format supported in ffmpeg.
 
@@ -673,12 +927,17 @@ def convert_input_paths_for_ffmpeg(
     - This way it can handle gaps and can keep input filenames without handling
         frame template
 
+    Contiguous frames of a sequence are converted by single oiiotool process
+    per chunk of frames instead of one process per file.
+
     Args:
         input_paths (str): Paths that should be converted. It is expected that
             contains single file or image sequence of same type.
         output_dir (str): Path to directory where output will be rendered.
             Must not be same as input's directory.
         logger (logging.Logger): Logger used for logging.
+        max_workers (Optional[int]): Maximum number of conversion processes
+            running at the same time. Number of CPUs is used if not passed.
 
     Raises:
         ValueError: If input filepath has extension not supported by function.
@@ -707,6 +966,48 @@ def convert_input_paths_for_ffmpeg(
     # Collect channels to export
     input_arg, channels_arg = get_oiio_input_and_channel_args(input_info)
 
+    # Attributes are same for all inputs
+    erase_attrib_args = []
+    for attr_name, attr_value in input_info["attribs"].items():
+        if not isinstance(attr_value, str):
+            continue
+
+        # Remove attributes that have string value longer than allowed
+        #   length for ffmpeg or when containing prohibited symbols
+        erase_reason = "Missing reason"
+        erase_attribute = False
+        if len(attr_value) > MAX_FFMPEG_STRING_LEN:
+            erase_reason = "has too long value ({} chars).".format(
+                len(attr_value)
+            )
+            erase_attribute = True
+
+        if not erase_attribute:
+            for char in NOT_ALLOWED_FFMPEG_CHARS:
+                if char in attr_value:
+                    erase_attribute = True
+                    erase_reason = (
+                        "contains unsupported character \"{}\"."
+                    ).format(char)
+                    break
+
+        if erase_attribute:
+            # Set attribute to empty string
+            logger.info((
+                "Removed attribute \"{}\" from metadata because {}."
+            ).format(attr_name, erase_reason))
+            erase_attrib_args.extend(["--eraseattrib", attr_name])
+
+    # Convert contiguous frames of sequence with single process, frame
+    #   ranges are split to chunks to be able to use multiple processes
+    if max_workers is None or max_workers < 1:
+        max_workers = os.cpu_count() or 1
+    frames_per_chunk = int(math.ceil(len(input_paths) / max_workers))
+    input_paths = get_oiio_frame_sequence_paths(
+        input_paths, frames_per_chunk
+    )
+
+    oiio_cmds = []
     for input_path in input_paths:
         # Prepare subprocess arguments
         oiio_cmd = get_oiio_tool_args(
@@ -726,36 +1027,7 @@ def convert_input_paths_for_ffmpeg(
             # Use first subimage
             "--subimage", "0"
         ])
-
-        for attr_name, attr_value in input_info["attribs"].items():
-            if not isinstance(attr_value, str):
-                continue
-
-            # Remove attributes that have string value longer than allowed
-            #   length for ffmpeg or when containing prohibited symbols
-            erase_reason = "Missing reason"
-            erase_attribute = False
-            if len(attr_value) > MAX_FFMPEG_STRING_LEN:
-                erase_reason = "has too long value ({} chars).".format(
-                    len(attr_value)
-                )
-                erase_attribute = True
-
-            if not erase_attribute:
-                for char in NOT_ALLOWED_FFMPEG_CHARS:
-                    if char in attr_value:
-                        erase_attribute = True
-                        erase_reason = (
-                            "contains unsupported character \"{}\"."
-                        ).format(char)
-                        break
-
-            if erase_attribute:
-                # Set attribute to empty string
-                logger.info((
-                    "Removed attribute \"{}\" from metadata because {}."
-                ).format(attr_name, erase_reason))
-                oiio_cmd.extend(["--eraseattrib", attr_name])
+        oiio_cmd.extend(erase_attrib_args)
 
         # Add last argument - path to output
         base_filename = os.path.basename(input_path)
@@ -765,17 +1037,32 @@ def convert_input_paths_for_ffmpeg(
         ])
 
         logger.debug("Conversion command: {}".format(" ".join(oiio_cmd)))
-        run_subprocess(oiio_cmd, logger=logger)
+        oiio_cmds.append(oiio_cmd)
+
+    run_subprocesses(oiio_cmds, max_workers=max_workers, logger=logger)
 
 
 # FFMPEG functions
 def get_ffprobe_data(path_to_file, logger=None):
     """Load data about entered filepath via ffprobe.
 
+    Output is cached by path, modification time and size of the file,
+    so each file is processed by ffprobe only once.
+
     Args:
         path_to_file (str): absolute path
         logger (logging.Logger): injected logger, if empty new is created
     """
+    return _get_cached_media_info(
+        "ffprobe",
+        path_to_file,
+        (),
+        lambda: _run_ffprobe(path_to_file, logger),
+        json.loads,
+    )
+
+
+def _run_ffprobe(path_to_file, logger):
     if not logger:
         logger = logging.getLogger(__name__)
     logger.debug(
@@ -812,17 +1099,16 @@ def get_ffprobe_data(path_to_file, logger=None):
     popen = subprocess.Popen(args, **kwargs)
 
     popen_stdout, popen_stderr = popen.communicate()
+    popen_stdout = popen_stdout.decode("utf-8")
     if popen_stdout:
-        logger.debug("FFprobe stdout:\n{}".format(
-            popen_stdout.decode("utf-8")
-        ))
+        logger.debug("FFprobe stdout:\n{}".format(popen_stdout))
 
     if popen_stderr:
         logger.warning("FFprobe stderr:\n{}".format(
             popen_stderr.decode("utf-8")
         ))
 
-    return json.loads(popen_stdout)
+    return popen_stdout
 
 
 def get_ffprobe_streams(path_to_file, logger=None):
@@ -1135,7 +1421,70 @@ def convert_colorspace(
     if logger is None:
         logger = logging.getLogger(__name__)
 
-    input_info = get_oiio_info_for_input(input_path, logger=logger)
+    oiio_cmd = get_convert_colorspace_args(
+        input_path,
+        output_path,
+        config_path,
+        source_colorspace,
+        target_colorspace,
+        view,
+        display,
+        additional_command_args,
+        logger=logger,
+    )
+
+    logger.debug("Conversion command: {}".format(" ".join(oiio_cmd)))
+    run_subprocess(oiio_cmd, logger=logger)
+
+
+def get_convert_colorspace_args(
+    input_path,
+    output_path,
+    config_path,
+    source_colorspace,
+    target_colorspace=None,
+    view=None,
+    display=None,
+    additional_command_args=None,
+    input_info=None,
+    logger=None,
+):
+    """Prepare oiiotool arguments to convert file to another color space.
+
+    Arguments can be used to run multiple conversions in parallel
+    with 'run_subprocesses'. See 'convert_colorspace' for description
+    of arguments.
+
+    Args:
+        input_path (str): Path that should be converted.
+        output_path (str): Path to output filename.
+        config_path (str): path to OCIO config file
+        source_colorspace (str): ocio valid color space of source files
+        target_colorspace (str): ocio valid target color space
+        view (str): name for viewer space (ocio valid)
+        display (str): name for display-referred reference space (ocio valid)
+        additional_command_args (list): arguments for oiiotool
+        input_info (Optional[dict[str, Any]]): Information about input from
+            'get_oiio_info_for_input'. Loaded from 'input_path' if not
+            passed, pass it to avoid loading of the same information for
+            each file of a sequence.
+        logger (logging.Logger): Logger used for logging.
+
+    Returns:
+        list[str]: Arguments for oiiotool process.
+
+    Raises:
+        ValueError: if misconfigured
+    """
+    if all([target_colorspace, view, display]):
+        raise ValueError("Colorspace and both screen and display"
+                         " cannot be set together."
+                         "Choose colorspace or screen and display")
+    if not target_colorspace and not all([view, display]):
+        raise ValueError("Both screen and display must be set.")
+
+    if input_info is None:
+        input_info = get_oiio_info_for_input(input_path, logger=logger)
 
     # Collect channels to export
     input_arg, channels_arg = get_oiio_input_and_channel_args(input_info)
@@ -1155,13 +1504,6 @@ def convert_colorspace(
         "--ch", channels_arg
     ])
 
-    if all([target_colorspace, view, display]):
-        raise ValueError("Colorspace and both screen and display"
-                         " cannot be set together."
-                         "Choose colorspace or screen and display")
-    if not target_colorspace and not all([view, display]):
-        raise ValueError("Both screen and display must be set.")
-
     if additional_command_args:
         oiio_cmd.extend(additional_command_args)
 
@@ -1174,9 +1516,7 @@ def convert_colorspace(
         oiio_cmd.extend(["--ociodisplay:subimages=0", display, view])
 
     oiio_cmd.extend(["-o", output_path])
-
-    logger.debug("Conversion command: {}".format(" ".join(oiio_cmd)))
-    run_subprocess(oiio_cmd, logger=logger)
+    return oiio_cmd
 
 
 def split_cmd_args(in_args):
@@ -68,20 +68,34 @@ class TrackChangesItem:
     }
     ```
 
+    Values are copied only once. Sub-items share values with their parent
+    item, and unchanged values are shared between old and new value. Copy
+    can be skipped with 'copy_values' if passed values are not changed
+    by anyone after the object is created.
+
     Args:
         old_value (Any): Old value.
         new_value (Any): New value.
+        copy_values (Optional[bool]): Create deep copy of passed values.
     """
 
-    def __init__(self, old_value, new_value):
+    def __init__(self, old_value, new_value, copy_values=True):
         self._changed = old_value != new_value
         # Resolve if value is '_EMPTY_VALUE' after comparison of the values
         if old_value is _EMPTY_VALUE:
             old_value = None
         if new_value is _EMPTY_VALUE:
             new_value = None
-        self._old_value = copy.deepcopy(old_value)
-        self._new_value = copy.deepcopy(new_value)
+
+        if copy_values:
+            old_value = copy.deepcopy(old_value)
+            # Values are equal so one copy can be used for both
+            if self._changed:
+                new_value = copy.deepcopy(new_value)
+            else:
+                new_value = old_value
+        self._old_value = old_value
+        self._new_value = new_value
 
         self._old_is_dict = isinstance(old_value, dict)
         self._new_is_dict = isinstance(new_value, dict)
@@ -170,15 +184,15 @@ class TrackChangesItem:
         if not self.is_dict:
             return output
 
-        old_value = self.old_value
-        new_value = self.new_value
+        old_value = self._old_value
+        new_value = self._new_value
         for key in self.changed_keys:
             _old = None
             _new = None
             if self._old_is_dict:
-                _old = old_value.get(key)
+                _old = copy.deepcopy(old_value.get(key))
             if self._new_is_dict:
-                _new = new_value.get(key)
+                _new = copy.deepcopy(new_value.get(key))
             output[key] = (_old, _new)
         return output
 
@@ -274,14 +288,15 @@ class TrackChangesItem:
         sub_items = {}
         changed_keys = set()
 
+        # Sub-items share values with this item, so values are not copied
         old_keys = self.old_keys
         new_keys = self.new_keys
-        new_value = self.new_value
-        old_value = self.old_value
+        new_value = self._new_value
+        old_value = self._old_value
         if self._old_is_dict and self._new_is_dict:
             for key in self.available_keys:
                 item = TrackChangesItem(
-                    old_value.get(key), new_value.get(key)
+                    old_value.get(key), new_value.get(key), False
                 )
                 sub_items[key] = item
                 if item.changed or key not in old_keys or key not in new_keys:
@@ -295,7 +310,7 @@ class TrackChangesItem:
                 # NOTE Use '_EMPTY_VALUE' because old value could be 'None'
                 #   which would result in "unchanged" item
                 sub_items[key] = TrackChangesItem(
-                    old_value.get(key), _EMPTY_VALUE
+                    old_value.get(key), _EMPTY_VALUE, False
                 )
 
         elif self._new_is_dict:
@@ -306,7 +321,7 @@ class TrackChangesItem:
                 # NOTE Use '_EMPTY_VALUE' because new value could be 'None'
                 #   which would result in "unchanged" item
                 sub_items[key] = TrackChangesItem(
-                    _EMPTY_VALUE, new_value.get(key)
+                    _EMPTY_VALUE, new_value.get(key), False
                 )
 
         self._sub_items = sub_items
@@ -29,6 +29,7 @@ from ayon_core.lib.events import QueuedEventSystem
 from ayon_core.lib.attribute_definitions import get_default_values
 from ayon_core.host import IPublishHost, IWorkfileHost
 from ayon_core.pipeline import Anatomy
+from ayon_core.pipeline.entities_cache import get_entities_cache
 from ayon_core.pipeline.plugin_discover import DiscoverResult
 
 from .exceptions import (
@@ -210,6 +211,9 @@ class CreateContext:
 
         # Instances by their ID
         self._instances_by_id = {}
+        # Creator and revision of instances of last collection by creator
+        #   identifier
+        self._instances_revisions = {}
 
         self.creator_discover_result = None
         self.convertor_discover_result = None
@@ -511,20 +515,37 @@ class CreateContext:
             self._log = logging.getLogger(self.__class__.__name__)
         return self._log
 
-    def reset(self, discover_publish_plugins=True):
+    def reset(self, discover_publish_plugins=True, incremental=False):
         """Reset context with all plugins and instances.
 
         All changes will be lost if were not saved explicitely.
+
+        Incremental reset keeps discovered plugins and collects again only
+        instances of creators with changed revision of instances (see
+        'reset_instances'). Full reset is done if plugins were not
+        discovered yet or if current project did change.
+
+        Args:
+            discover_publish_plugins (Optional[bool]): Discover publish
+                plugins.
+            incremental (Optional[bool]): Keep plugins and collect again
+                only changed instances.
+
         """
+        project_name = self._current_project_name
 
         self.reset_preparation()
 
         self.reset_current_context()
-        self.reset_plugins(discover_publish_plugins)
+        incremental = self.can_reset_incrementally(project_name, incremental)
+        if incremental:
+            self.reregister_plugins_callbacks()
+        else:
+            self.reset_plugins(discover_publish_plugins)
         self.reset_context_data()
 
         with self.bulk_add_instances():
-            self.reset_instances()
+            self.reset_instances(incremental)
             self.find_convertor_items()
             self.execute_autocreators()
 
@@ -622,6 +643,35 @@ class CreateContext:
         self._current_project_anatomy = None
         self._current_project_settings = None
 
+    def can_reset_incrementally(self, project_name, incremental=True):
+        """Can plugins be kept on reset.
+
+        Args:
+            project_name (Union[str, None]): Current project name before
+                reset of current context.
+            incremental (Optional[bool]): Incremental reset was requested.
+
+        Returns:
+            bool: Plugins can be kept and instances collected incrementally.
+
+        """
+        return (
+            incremental
+            and bool(self.creators)
+            and project_name == self._current_project_name
+        )
+
+    def reregister_plugins_callbacks(self):
+        """Register callbacks of kept plugins after 'reset_preparation'.
+
+        Callbacks are cleared in 'reset_preparation' and registered again
+        when plugins are discovered. Incremental reset keeps plugins so they
+        have to register the callbacks again.
+        """
+        self._register_publish_plugins_callbacks(self.plugins_with_defs)
+        for creator in self.creators.values():
+            creator.register_callbacks()
+
     def reset_plugins(self, discover_publish_plugins=True):
         """Reload plugins.
 
@@ -664,6 +714,14 @@ class CreateContext:
                 if plugin not in plugins_by_targets
             ]
 
+        self._register_publish_plugins_callbacks(plugins_with_defs)
+
+        self.publish_plugins_mismatch_targets = plugins_mismatch_targets
+        self.publish_discover_result = discover_result
+        self.publish_plugins = plugins_by_targets
+        self.plugins_with_defs = plugins_with_defs
+
+    def _register_publish_plugins_callbacks(self, plugins_with_defs):
         # Register create context callbacks
         for plugin in plugins_with_defs:
             if not inspect.ismethod(plugin.register_create_context_callbacks):
@@ -682,11 +740,6 @@ class CreateContext:
                     exc_info=True
                 )
 
-        self.publish_plugins_mismatch_targets = plugins_mismatch_targets
-        self.publish_discover_result = discover_result
-        self.publish_plugins = plugins_by_targets
-        self.plugins_with_defs = plugins_with_defs
-
     def _reset_creator_plugins(self):
         # Prepare settings
         project_settings = self.get_current_project_settings()
@@ -1382,21 +1435,53 @@ class CreateContext:
             },
         )
 
-    def reset_instances(self):
-        """Reload instances"""
-        self._instances_by_id = collections.OrderedDict()
+    def reset_instances(self, incremental=False):
+        """Reload instances.
+
+        Incremental reset collects again only instances of creators which
+        have changed revision of instances (see
+        'BaseCreator.get_instances_revision'). Instances of other creators
+        are kept as they are.
+
+        Args:
+            incremental (Optional[bool]): Collect only instances of creators
+                with changed revision.
+
+        """
+        creators = self.sorted_creators
+        if not incremental:
+            self._instances_by_id = collections.OrderedDict()
+            self._instances_revisions = {}
+
+        else:
+            all_identifiers = {creator.identifier for creator in creators}
+            creators = self._get_creators_to_recollect(creators)
+            kept_identifiers = all_identifiers - {
+                creator.identifier for creator in creators
+            }
+            # Remove instances of recollected creators and of creators
+            #   which are not available anymore
+            for instance_id, instance in tuple(self._instances_by_id.items()):
+                if instance.creator_identifier not in kept_identifiers:
+                    self._instances_by_id.pop(instance_id)
 
         # Collect instances
         error_message = "Collection of instances for creator {} failed. {}"
         failed_info = []
-        for creator in self.sorted_creators:
+        for creator in creators:
             label = creator.label
             identifier = creator.identifier
             failed = False
             add_traceback = False
             exc_info = None
+            self._instances_revisions.pop(identifier, None)
             try:
+                revision = creator.get_instances_revision()
                 creator.collect_instances()
+                if revision is not None:
+                    self._instances_revisions[identifier] = (
+                        creator, revision
+                    )
 
             except CreatorError:
                 failed = True
@@ -1419,9 +1504,68 @@ class CreateContext:
                     )
                 )
 
+        self._prefetch_instances_entities()
+
         if failed_info:
             raise CreatorsCollectionFailed(failed_info)
 
+    def _prefetch_instances_entities(self):
+        """Query folders and tasks of all instances at once.
+
+        Folders and tasks are stored to shared entities cache, so
+        validation of instances context does not query them one by one.
+        """
+        folder_paths = {
+            instance.get("folderPath")
+            for instance in self._instances_by_id.values()
+            if not instance.has_promised_context
+        }
+        # Skip invalid folder paths (folder name or empty path)
+        folder_paths = {
+            folder_path
+            for folder_path in folder_paths
+            if folder_path and "/" in folder_path
+        }
+        if folder_paths:
+            get_entities_cache().prefetch_folder_paths(
+                self.project_name, folder_paths
+            )
+
+    def _get_creators_to_recollect(self, creators):
+        """Creators which have changed revision of instances.
+
+        Args:
+            creators (List[BaseCreator]): Available creators.
+
+        Returns:
+            List[BaseCreator]: Creators which should collect instances.
+
+        """
+        output = []
+        for creator in creators:
+            last_creator, last_revision = self._instances_revisions.get(
+                creator.identifier, (None, None)
+            )
+            # Creator plugins were reset
+            if last_creator is not creator or last_revision is None:
+                output.append(creator)
+                continue
+
+            try:
+                revision = creator.get_instances_revision()
+            except Exception:
+                self.log.warning(
+                    "Failed to get revision of instances of creator {}".format(
+                        creator.identifier
+                    ),
+                    exc_info=True
+                )
+                revision = None
+
+            if revision is None or revision != last_revision:
+                output.append(creator)
+        return output
+
     def find_convertor_items(self):
         """Go through convertor plugins to look for items to convert.
 
@@ -1498,20 +1642,15 @@ class CreateContext:
         if not remainder_paths:
             return output
 
-        found_paths = set()
-        for folder_entity in ayon_api.get_folders(
-            self.project_name,
-            folder_paths=remainder_paths,
-        ):
-            folder_path = folder_entity["path"]
-            found_paths.add(folder_path)
+        entities_cache = get_entities_cache()
+        folder_entities_by_path = entities_cache.get_folder_entities_by_path(
+            self.project_name, remainder_paths
+        )
+        # Cache also empty folder entities
+        for folder_path, folder_entity in folder_entities_by_path.items():
             output[folder_path] = folder_entity
             self._folder_entities_by_path[folder_path] = folder_entity
 
-        # Cache empty folder entities
-        for path in remainder_paths - found_paths:
-            self._folder_entities_by_path[path] = None
-
         return output
 
     def get_task_entities(
@@ -1520,7 +1659,8 @@ class CreateContext:
     ) -> Dict[str, Dict[str, Optional[Dict[str, Any]]]]:
         """Get task entities by folder path and task name.
 
-        Entities are cached until reset.
+        Entities are cached until reset. Entities are queried using shared
+        entities cache, so they may be already available from other tools.
 
         Args:
             task_names_by_folder_paths (Dict[str, Set[str]]): Task names by
@@ -1586,14 +1726,12 @@ class CreateContext:
         if not folder_path_by_id:
             return output
 
-        task_entities_by_parent_id = collections.defaultdict(list)
-        for task_entity in ayon_api.get_tasks(
-            self.project_name,
-            folder_ids=folder_path_by_id.keys()
-        ):
-            folder_id = task_entity["folderId"]
-            task_entities_by_parent_id[folder_id].append(task_entity)
-
+        entities_cache = get_entities_cache()
+        task_entities_by_parent_id = (
+            entities_cache.get_task_entities_by_folder_id(
+                self.project_name, folder_path_by_id.keys()
+            )
+        )
         for folder_id, task_entities in task_entities_by_parent_id.items():
             folder_path = folder_path_by_id[folder_id]
             task_ids = set()
@@ -468,6 +468,24 @@ class BaseCreator(ABC):
 
         pass
 
+    def get_instances_revision(self):
+        """Revision of creator instances in host.
+
+        Used for incremental reset of instances in 'CreateContext'.
+        Instances of creator are collected again only if revision changed
+        since last collection.
+
+        The value should be cheap to get and must change when instances of
+        the creator could change in host, e.g. scene modification counter,
+        number of nodes or modification time of workfile.
+
+        Returns:
+            Optional[Hashable]: Revision of instances. Instances are always
+                collected again when 'None' is returned.
+
+        """
+        return None
+
     @abstractmethod
     def update_instances(self, update_list):
         """Store changes of existing instances so they can be recollected.
@@ -17,6 +17,32 @@ from ayon_core.pipeline import (
 from .exceptions import ImmutableKeyError
 from .changes import TrackChangesItem
 
+_MISSING = object()
+
+
+def _share_unchanged_values(origin_data, new_data):
+    """Create copy of data sharing unchanged values with origin data.
+
+    Origin data are never modified in place, only replaced, so values that
+    did not change can be shared instead of copying them. Only changed
+    values are copied.
+
+    Args:
+        origin_data (Dict[str, Any]): Origin data.
+        new_data (Dict[str, Any]): Current data.
+
+    Returns:
+        Dict[str, Any]: Copy of current data.
+    """
+    output = collections.OrderedDict()
+    for key, value in new_data.items():
+        orig_value = origin_data.get(key, _MISSING)
+        if orig_value is not _MISSING and orig_value == value:
+            output[key] = orig_value
+        else:
+            output[key] = copy.deepcopy(value)
+    return output
+
 
 class ConvertorItem:
     """Item representing convertor plugin.
@@ -183,7 +209,9 @@ class AttributeValues:
         self._data = {}
 
     def mark_as_stored(self):
-        self._origin_data = copy.deepcopy(self._data)
+        self._origin_data = _share_unchanged_values(
+            self._origin_data, self._data
+        )
 
     @property
     def attr_defs(self):
@@ -311,7 +339,9 @@ class PublishAttributes:
         return output
 
     def mark_as_stored(self):
-        self._origin_data = copy.deepcopy(self.data_to_store())
+        self._origin_data = _share_unchanged_values(
+            self._origin_data, self.data_to_store()
+        )
 
     def data_to_store(self):
         """Convert attribute values to "data to store"."""
@@ -464,6 +494,10 @@ class CreatedInstance:
         # Data that can be used for lifetime of object
         self._transient_data = {}
 
+        # Keys changed since data were stored
+        # - 'None' means that all keys must be compared to origin data
+        self._dirty_keys = None
+
         # Create a copy of passed data to avoid changing them on the fly
         data = copy.deepcopy(data or {})
 
@@ -533,6 +567,14 @@ class CreatedInstance:
             creator_attr_defs, creator_values
         )
 
+        # Keys which differ from origin data after initialization
+        origin_data = self._get_origin_data()
+        self._dirty_keys = {
+            key
+            for key, value in self.data_to_store().items()
+            if origin_data.get(key, _MISSING) != value
+        }
+
     def __str__(self):
         return (
             "<CreatedInstance {product[name]}"
@@ -562,6 +604,7 @@ class CreatedInstance:
             return
 
         self._data[key] = value
+        self._mark_key_dirty(key)
         self._create_context.instance_values_changed(
             self.id, {key: value}
         )
@@ -579,6 +622,7 @@ class CreatedInstance:
         if has_key:
             if key in self.__required_keys:
                 self._data[key] = self.__required_keys[key]
+            self._mark_key_dirty(key)
             self._create_context.instance_values_changed(
                 self.id, {key: None}
             )
@@ -675,9 +719,31 @@ class CreatedInstance:
         return self._transient_data
 
     def changes(self):
-        """Calculate and return changes."""
+        """Calculate and return changes.
 
-        return TrackChangesItem(self.origin_data, self.data_to_store())
+        Only keys changed since last store, and keys with mutable values
+        which could be changed in place, are compared to origin data.
+        Unchanged values are shared with origin data instead of copying.
+        """
+        origin_data = self._get_origin_data()
+        new_data = self.data_to_store()
+        dirty_keys = self._dirty_keys
+        output = collections.OrderedDict()
+        for key, value in new_data.items():
+            orig_value = origin_data.get(key, _MISSING)
+            if (
+                orig_value is not _MISSING
+                and dirty_keys is not None
+                and key not in dirty_keys
+                and not isinstance(value, (dict, list, set, tuple))
+            ):
+                output[key] = orig_value
+            elif orig_value is not _MISSING and orig_value == value:
+                output[key] = orig_value
+            else:
+                output[key] = copy.deepcopy(value)
+
+        return TrackChangesItem(origin_data, output, False)
 
     def mark_as_stored(self):
         """Should be called when instance data are stored.
@@ -685,18 +751,30 @@ class CreatedInstance:
         Origin data are replaced by current data so changes are cleared.
         """
 
-        orig_keys = set(self._orig_data.keys())
-        for key, value in self._data.items():
-            orig_keys.discard(key)
-            if key in ("creator_attributes", "publish_attributes"):
-                continue
-            self._orig_data[key] = copy.deepcopy(value)
-
-        for key in orig_keys:
-            self._orig_data.pop(key)
+        data = collections.OrderedDict(
+            (key, value)
+            for key, value in self._data.items()
+            if key not in ("creator_attributes", "publish_attributes")
+        )
+        self._orig_data = _share_unchanged_values(self._orig_data, data)
 
         self.creator_attributes.mark_as_stored()
         self.publish_attributes.mark_as_stored()
+        self._dirty_keys = set()
+
+    def _get_origin_data(self):
+        """Origin data without copying values.
+
+        Returned data must not be modified.
+        """
+        output = collections.OrderedDict(self._orig_data)
+        output["creator_attributes"] = self.creator_attributes._origin_data
+        output["publish_attributes"] = self.publish_attributes._origin_data
+        return output
+
+    def _mark_key_dirty(self, key):
+        if self._dirty_keys is not None:
+            self._dirty_keys.add(key)
 
     @property
     def creator_attributes(self):
@@ -797,8 +875,7 @@ class CreatedInstance:
                 instance of for which the instance belong.
         """
 
-        instance_data = copy.deepcopy(instance_data)
-
+        # Data are copied in '__init__'
         product_type = instance_data.get("productType")
         if product_type is None:
             product_type = instance_data.get("family")
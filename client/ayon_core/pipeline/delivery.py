@@ -1,15 +1,22 @@
 """Functions useful for delivery of published representations."""
 import os
 import copy
+import json
+import time
+import uuid
 import shutil
 import glob
+import logging
+import threading
 import collections
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Dict, Any, Iterable
 
 import clique
 import ayon_api
 
-from ayon_core.lib import create_hard_link
+from ayon_core.lib import create_hard_link, get_launcher_local_dir
+from ayon_core.lib.events import QueuedEventSystem
 
 from .template_data import (
     get_general_template_data,
@@ -18,22 +25,105 @@ from .template_data import (
 )
 
 
-def _copy_file(src_path, dst_path):
+def _is_file_delivered(src_path, dst_path):
+    """Check if file was already delivered.
+
+    File is delivered if destination has the same size as source and is
+    not older than source, or if it is hardlink of source.
+
+    Args:
+        src_path (str): Path to source file.
+        dst_path (str): Path to delivered file.
+
+    Returns:
+        bool: File is already delivered.
+
+    """
+    try:
+        dst_stat = os.stat(dst_path)
+    except OSError:
+        return False
+    src_stat = os.stat(src_path)
+    if os.path.samestat(src_stat, dst_stat):
+        return True
+    return (
+        src_stat.st_size == dst_stat.st_size
+        and dst_stat.st_mtime_ns >= src_stat.st_mtime_ns
+    )
+
+
+def _copy_file(src_path, dst_path, overwrite=False):
     """Hardlink file if possible(to save space), copy if not.
 
+    Existing destination files are skipped. With 'overwrite' enabled only
+    already delivered files are skipped and outdated files are replaced.
+    File is copied to temporary file first so interrupted copy does not
+    leave partial file at destination.
+
     Because of using hardlinks should not be function used in other parts
     of pipeline.
+
+    Args:
+        src_path (str): Path to source file.
+        dst_path (str): Path where file is delivered.
+        overwrite (Optional[bool]): Replace destination file if it has
+            different size or is older than source.
+
+    Returns:
+        bool: File was copied, 'False' if was skipped.
+
     """
+    if not overwrite:
+        if os.path.exists(dst_path):
+            return False
+
+    elif _is_file_delivered(src_path, dst_path):
+        return False
+
+    elif os.path.lexists(dst_path):
+        os.remove(dst_path)
 
-    if os.path.exists(dst_path):
-        return
     try:
         create_hard_link(
             src_path,
             dst_path
         )
     except OSError:
-        shutil.copyfile(src_path, dst_path)
+        tmp_path = "{}.{}.tmp".format(dst_path, uuid.uuid4().hex[:8])
+        try:
+            shutil.copyfile(src_path, tmp_path)
+            os.replace(tmp_path, dst_path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+    return True
+
+
+def _copy_files(src_dst_pairs, max_workers=None, overwrite=False):
+    """Copy multiple files in parallel.
+
+    Args:
+        src_dst_pairs (list[tuple[str, str]]): Source and destination paths.
+        max_workers (Optional[int]): Maximum number of files copied at
+            the same time.
+        overwrite (Optional[bool]): Replace outdated destination files.
+
+    """
+    if max_workers is None:
+        max_workers = DeliveryJob.default_max_workers
+
+    if len(src_dst_pairs) < 2 or max_workers < 2:
+        for src_path, dst_path in src_dst_pairs:
+            _copy_file(src_path, dst_path, overwrite)
+        return
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(_copy_file, src_path, dst_path, overwrite)
+            for src_path, dst_path in src_dst_pairs
+        ]
+        for future in futures:
+            future.result()
 
 
 def get_format_dict(anatomy, location_path):
@@ -123,6 +213,43 @@ def check_destination_path(
     return report_items
 
 
+def get_delivery_file_path(
+    anatomy,
+    template_name,
+    anatomy_data,
+    format_dict
+):
+    """Get path where a file is delivered.
+
+    Args:
+        anatomy (Anatomy): Project anatomy.
+        template_name (str): User selected delivery template name.
+        anatomy_data (dict): Data from representation to fill anatomy with.
+        format_dict (dict): Root dictionary with names and values.
+
+    Returns:
+        str: Normalized delivery path.
+
+    Raises:
+        TemplateUnsolved: When delivery template can't be filled.
+
+    """
+    if format_dict:
+        anatomy_data = copy.copy(anatomy_data)
+        anatomy_data["root"] = format_dict["root"]
+    template_obj = anatomy.get_template_item(
+        "delivery", template_name, "path"
+    )
+    delivery_path = template_obj.format_strict(anatomy_data)
+
+    # Backwards compatibility when extension contained `.`
+    delivery_path = delivery_path.replace("..", ".")
+    # Make sure path is valid for all platforms
+    delivery_path = os.path.normpath(delivery_path.replace("\\", "/"))
+    # Remove newlines from the end of the string to avoid OSError during copy
+    return delivery_path.rstrip()
+
+
 def deliver_single_file(
     src_path,
     repre,
@@ -131,7 +258,8 @@ def deliver_single_file(
     anatomy_data,
     format_dict,
     report_items,
-    log
+    log,
+    overwrite=False
 ):
     """Copy single file to calculated path based on template
 
@@ -145,6 +273,8 @@ def deliver_single_file(
         format_dict (dict): root dictionary with names and values
         report_items (collections.defaultdict): to return error messages
         log (logging.Logger): for log printing
+        overwrite (bool): replace existing file if it has different size
+            or is older than source, existing files are skipped by default
 
     Returns:
         (collections.defaultdict, int)
@@ -158,27 +288,15 @@ def deliver_single_file(
         report_items["Source file was not found"].append(msg)
         return report_items, 0
 
-    if format_dict:
-        anatomy_data = copy.deepcopy(anatomy_data)
-        anatomy_data["root"] = format_dict["root"]
-    template_obj = anatomy.get_template_item(
-        "delivery", template_name, "path"
+    delivery_path = get_delivery_file_path(
+        anatomy, template_name, anatomy_data, format_dict
     )
-    delivery_path = template_obj.format_strict(anatomy_data)
-
-    # Backwards compatibility when extension contained `.`
-    delivery_path = delivery_path.replace("..", ".")
-    # Make sure path is valid for all platforms
-    delivery_path = os.path.normpath(delivery_path.replace("\\", "/"))
-    # Remove newlines from the end of the string to avoid OSError during copy
-    delivery_path = delivery_path.rstrip()
 
     delivery_folder = os.path.dirname(delivery_path)
-    if not os.path.exists(delivery_folder):
-        os.makedirs(delivery_folder)
+    os.makedirs(delivery_folder, exist_ok=True)
 
     log.debug("Copying single: {} -> {}".format(src_path, delivery_path))
-    _copy_file(src_path, delivery_path)
+    _copy_file(src_path, delivery_path, overwrite)
 
     return report_items, 1
 
@@ -193,7 +311,8 @@ def deliver_sequence(
     report_items,
     log,
     has_renumbered_frame=False,
-    new_frame_start=0
+    new_frame_start=0,
+    overwrite=False
 ):
     """ For Pype2(mainly - works in 3 too) where representation might not
         contain files.
@@ -213,6 +332,11 @@ def deliver_sequence(
         format_dict (dict): root dictionary with names and values
         report_items (collections.defaultdict): to return error messages
         log (logging.Logger): for log printing
+        has_renumbered_frame (bool): frames are renumbered
+        new_frame_start (int): first frame of renumbered frames
+        overwrite (bool): replace existing files if they have different
+            size or are older than source, existing files are skipped
+            by default
 
     Returns:
         (collections.defaultdict, int)
@@ -303,12 +427,11 @@ def deliver_sequence(
         padding=dst_padding
     )
 
-    if not os.path.exists(delivery_folder):
-        os.makedirs(delivery_folder)
+    os.makedirs(delivery_folder, exist_ok=True)
 
     src_head = src_collection.head
     src_tail = src_collection.tail
-    uploaded = 0
+    src_dst_pairs = []
     first_frame = min(src_collection.indexes)
     for index in src_collection.indexes:
         src_padding = src_collection.format("{padding}") % index
@@ -331,11 +454,342 @@ def deliver_sequence(
         dst_padding = dst_collection.format("{padding}") % dst_index
         dst = "{}{}{}".format(dst_head, dst_padding, dst_tail)
         log.debug("Copying single: {} -> {}".format(src, dst))
-        _copy_file(src, dst)
+        src_dst_pairs.append((src, dst))
+
+    _copy_files(src_dst_pairs, overwrite=overwrite)
+
+    return report_items, len(src_dst_pairs)
+
 
-        uploaded += 1
+class DeliveryFileItem:
+    """File of delivery job.
 
-    return report_items, uploaded
+    Args:
+        src_path (str): Path to source file.
+        dst_path (str): Path where file is delivered.
+        repre_id (Optional[str]): Id of delivered representation.
+        status (Optional[str]): Delivery status of the file.
+        error (Optional[str]): Reason why delivery failed.
+
+    """
+    pending_status = "pending"
+    copied_status = "copied"
+    skipped_status = "skipped"
+    failed_status = "failed"
+
+    def __init__(
+        self, src_path, dst_path, repre_id=None, status=None, error=None
+    ):
+        if status is None:
+            status = self.pending_status
+        self.src_path = src_path
+        self.dst_path = dst_path
+        self.repre_id = repre_id
+        self.status = status
+        self.error = error
+
+    @property
+    def finished(self):
+        return self.status in (self.copied_status, self.skipped_status)
+
+    def to_data(self):
+        return {
+            "src_path": self.src_path,
+            "dst_path": self.dst_path,
+            "repre_id": self.repre_id,
+            "status": self.status,
+            "error": self.error,
+        }
+
+    @classmethod
+    def from_data(cls, data):
+        return cls(**data)
+
+
+class DeliveryJob:
+    """Delivery of files processed by pool of workers.
+
+    Job state is stored to manifest on disk during delivery so delivery
+    can be resumed after failure, or interruption, using the same job id.
+    Files which were already delivered, based on size and modification
+    time, are skipped. Existing destination files are never replaced unless
+    'overwrite' is enabled, then only outdated files are replaced.
+
+    Progress is reported with events emitted from thread which called
+    'run'. Use event system with 'auto_execute' disabled and process
+    events in main thread to update UI from job running in other thread.
+
+    Topics:
+        "delivery.job.started": Job started. Data contain "job_id" and
+            "total".
+        "delivery.job.progress": Progress of job. Data contain "job_id",
+            "total", "copied", "skipped" and "failed".
+        "delivery.job.finished": Job finished. Data contain same keys as
+            progress event and "stopped".
+
+    Args:
+        job_id (Optional[str]): Job id. New id is created if not passed.
+        max_workers (Optional[int]): Maximum number of files copied at
+            the same time.
+        event_system (Optional[QueuedEventSystem]): Event system used to
+            emit progress events.
+        overwrite (Optional[bool]): Replace outdated destination files.
+
+    """
+    default_max_workers = 8
+    # Minimum time between progress events and manifest writes
+    progress_interval = 0.1
+    manifest_interval = 2.0
+
+    def __init__(
+        self, job_id=None, max_workers=None, event_system=None, overwrite=False
+    ):
+        if job_id is None:
+            job_id = uuid.uuid4().hex
+        if max_workers is None:
+            max_workers = self.default_max_workers
+        if event_system is None:
+            event_system = QueuedEventSystem()
+        self._job_id = job_id
+        self._max_workers = max_workers
+        self._event_system = event_system
+        self._overwrite = overwrite
+        # Items by source and destination path
+        self._items_by_key = {}
+        self._stop_event = threading.Event()
+        self._log = None
+
+    @property
+    def log(self):
+        if self._log is None:
+            self._log = logging.getLogger(self.__class__.__name__)
+        return self._log
+
+    @property
+    def id(self):
+        return self._job_id
+
+    @property
+    def items(self):
+        return list(self._items_by_key.values())
+
+    @property
+    def manifest_path(self):
+        return self.get_manifest_path(self._job_id)
+
+    @staticmethod
+    def get_manifest_path(job_id):
+        return get_launcher_local_dir("delivery_jobs", f"{job_id}.json")
+
+    @classmethod
+    def get_unfinished_job_ids(cls):
+        """Ids of jobs which were not finished.
+
+        Returns:
+            list[str]: Ids of jobs which can be resumed.
+
+        """
+        dirpath = get_launcher_local_dir("delivery_jobs")
+        if not os.path.isdir(dirpath):
+            return []
+        return [
+            os.path.splitext(filename)[0]
+            for filename in os.listdir(dirpath)
+            if filename.endswith(".json")
+        ]
+
+    @classmethod
+    def load(
+        cls, job_id, max_workers=None, event_system=None, overwrite=False
+    ):
+        """Load job from manifest to resume delivery.
+
+        Args:
+            job_id (str): Job id.
+            max_workers (Optional[int]): Maximum number of files copied at
+                the same time.
+            event_system (Optional[QueuedEventSystem]): Event system used
+                to emit progress events.
+            overwrite (Optional[bool]): Replace outdated destination files.
+
+        Returns:
+            Union[DeliveryJob, None]: Job or None if manifest of the job
+                does not exist.
+
+        """
+        job = cls(job_id, max_workers, event_system, overwrite)
+        filepath = job.manifest_path
+        if not os.path.exists(filepath):
+            return None
+        try:
+            with open(filepath, "r") as stream:
+                data = json.load(stream)
+        except (OSError, ValueError):
+            job.log.warning(
+                "Failed to read delivery manifest '{}'.".format(filepath),
+                exc_info=True
+            )
+            return None
+
+        for item_data in data["items"]:
+            item = DeliveryFileItem.from_data(item_data)
+            job._items_by_key[(item.src_path, item.dst_path)] = item
+        return job
+
+    def add_event_callback(self, topic, callback):
+        return self._event_system.add_callback(topic, callback)
+
+    def add_file(self, src_path, dst_path, repre_id=None):
+        """Add file to deliver.
+
+        Files which are already in the job (e.g. loaded from manifest) are
+        not added again.
+
+        Args:
+            src_path (str): Path to source file.
+            dst_path (str): Path where file is delivered.
+            repre_id (Optional[str]): Id of delivered representation.
+
+        """
+        key = (src_path, dst_path)
+        if key not in self._items_by_key:
+            self._items_by_key[key] = DeliveryFileItem(
+                src_path, dst_path, repre_id
+            )
+
+    def stop(self):
+        """Stop delivery, files in progress are finished."""
+        self._stop_event.set()
+
+    def run(self):
+        """Deliver files of the job.
+
+        Manifest is removed when all files are delivered, otherwise job
+        can be resumed with 'DeliveryJob.load'.
+
+        Returns:
+            dict[str, list[str]]: Report of happened errors. Key is message
+                title value is detailed information.
+
+        """
+        self._stop_event.clear()
+        report_items = collections.defaultdict(list)
+        items = [
+            item
+            for item in self._items_by_key.values()
+            if not item.finished
+        ]
+        self._emit_event(
+            "delivery.job.started",
+            {"total": len(self._items_by_key)}
+        )
+        self._save_manifest()
+
+        last_progress = last_save = time.time()
+        with ThreadPoolExecutor(max_workers=self._max_workers) as executor:
+            futures = {
+                executor.submit(self._process_item, item): item
+                for item in items
+            }
+            for future in as_completed(futures):
+                item = futures[future]
+                if item.status == DeliveryFileItem.failed_status:
+                    report_items["Failed to deliver file"].append(
+                        "{} -> {}<br>{}".format(
+                            item.src_path, item.dst_path, item.error
+                        )
+                    )
+
+                now = time.time()
+                if now - last_progress > self.progress_interval:
+                    last_progress = now
+                    self._emit_event(
+                        "delivery.job.progress", self._get_counts()
+                    )
+                if now - last_save > self.manifest_interval:
+                    last_save = now
+                    self._save_manifest()
+
+        stopped = self._stop_event.is_set()
+        if stopped or report_items:
+            self._save_manifest()
+        else:
+            self._remove_manifest()
+
+        data = self._get_counts()
+        data["stopped"] = stopped
+        self._emit_event("delivery.job.finished", data)
+        return report_items
+
+    def _process_item(self, item):
+        if self._stop_event.is_set():
+            return
+
+        if not os.path.exists(item.src_path):
+            item.status = DeliveryFileItem.failed_status
+            item.error = "Source file was not found"
+            return
+
+        try:
+            os.makedirs(os.path.dirname(item.dst_path), exist_ok=True)
+            self.log.debug("Copying single: {} -> {}".format(
+                item.src_path, item.dst_path
+            ))
+            if _copy_file(item.src_path, item.dst_path, self._overwrite):
+                item.status = DeliveryFileItem.copied_status
+            else:
+                item.status = DeliveryFileItem.skipped_status
+            item.error = None
+
+        except Exception as exc:
+            self.log.warning(
+                "Failed to deliver file '{}'.".format(item.src_path),
+                exc_info=True
+            )
+            item.status = DeliveryFileItem.failed_status
+            item.error = str(exc)
+
+    def _get_counts(self):
+        counts = collections.Counter(
+            item.status for item in self._items_by_key.values()
+        )
+        return {
+            "total": len(self._items_by_key),
+            "copied": counts[DeliveryFileItem.copied_status],
+            "skipped": counts[DeliveryFileItem.skipped_status],
+            "failed": counts[DeliveryFileItem.failed_status],
+        }
+
+    def _emit_event(self, topic, data):
+        data["job_id"] = self._job_id
+        self._event_system.emit(topic, data, "delivery.job")
+
+    def _save_manifest(self):
+        filepath = self.manifest_path
+        data = {
+            "job_id": self._job_id,
+            "items": [
+                item.to_data()
+                for item in self._items_by_key.values()
+            ],
+        }
+        try:
+            os.makedirs(os.path.dirname(filepath), exist_ok=True)
+            # Write to temp file first to avoid partial manifest
+            tmp_path = "{}.{}.tmp".format(filepath, os.getpid())
+            with open(tmp_path, "w") as stream:
+                json.dump(data, stream)
+            os.replace(tmp_path, filepath)
+        except OSError:
+            self.log.warning(
+                "Failed to store delivery manifest '{}'.".format(filepath),
+                exc_info=True
+            )
+
+    def _remove_manifest(self):
+        filepath = self.manifest_path
+        if os.path.exists(filepath):
+            os.remove(filepath)
 
 
 def _merge_data(data, new_data):
@@ -0,0 +1,373 @@
+"""Process-wide cache of folder and task entities.
+
+Multiple tools living in one process (Publisher, Loader, Workfiles, Scene
+Inventory) and 'CreateContext' ask server for the same folders and tasks.
+The cache is shared between them so each entity is queried only once
+during its lifetime.
+
+Cache is invalidated after lifetime of cached item is over or when
+'entities.changed' event is emitted using global event system
+('ayon_core.lib.emit_event'). Event data can contain
+'project_name' to invalidate only one project. Items with expired
+lifetime are removed from cache once per lifetime so the cache does not
+grow in long-living processes.
+
+Note:
+    Cached entities are shared between all callers and must not be
+        modified.
+
+    Entities which were not found are not cached so newly created entities
+        are available right away.
+"""
+import time
+import threading
+import collections
+
+import ayon_api
+
+from ayon_core.lib import NestedCacheItem, register_event_callback
+
+ENTITIES_CHANGED_TOPIC = "entities.changed"
+
+
+class EntitiesCache:
+    """Cache of folder and task entities per project.
+
+    Args:
+        lifetime (Optional[int]): Lifetime of cached entities in seconds.
+
+    """
+    lifetime = 60
+
+    def __init__(self, lifetime=None):
+        if lifetime is None:
+            lifetime = self.lifetime
+        self._lifetime = lifetime
+        self._lock = threading.RLock()
+        self._folders_by_id = NestedCacheItem(levels=2, lifetime=lifetime)
+        self._folder_ids_by_path = NestedCacheItem(
+            levels=2, lifetime=lifetime)
+        self._tasks_by_id = NestedCacheItem(levels=2, lifetime=lifetime)
+        self._task_ids_by_folder_id = NestedCacheItem(
+            levels=2, lifetime=lifetime)
+        self._last_prune = time.time()
+        self._hits = 0
+        self._misses = 0
+
+    def get_stats(self):
+        """Statistics of cache usage.
+
+        Returns:
+            dict[str, int]: Number of entities found in cache ('hits') and
+                number of entities which had to be queried ('misses').
+
+        """
+        with self._lock:
+            return {"hits": self._hits, "misses": self._misses}
+
+    def reset_stats(self):
+        """Reset hit and miss counters."""
+        with self._lock:
+            self._hits = 0
+            self._misses = 0
+
+    def invalidate(self, project_name=None):
+        """Invalidate cached entities.
+
+        Args:
+            project_name (Optional[str]): Invalidate only entities of
+                the project. All projects are invalidated if not passed.
+
+        """
+        with self._lock:
+            for cache in self._get_caches():
+                if project_name is None:
+                    cache.reset()
+                else:
+                    cache.clear_key(project_name)
+
+    def get_folder_entities_by_path(self, project_name, folder_paths):
+        """Get folder entities by paths.
+
+        All folders missing in cache are queried at once.
+
+        Args:
+            project_name (str): Project name.
+            folder_paths (Iterable[str]): Folder paths.
+
+        Returns:
+            dict[str, Union[dict[str, Any], None]]: Folder entities by path.
+
+        """
+        output = {}
+        missing_paths = set()
+        hits = 0
+        with self._lock:
+            self._prune()
+            ids_cache = self._folder_ids_by_path[project_name]
+            for folder_path in set(folder_paths):
+                output[folder_path] = None
+                if not folder_path:
+                    continue
+                folder_entity = None
+                cache = ids_cache[folder_path]
+                if cache.is_valid:
+                    folder_entity = self._get_cached_folder(
+                        project_name, cache.get_data()
+                    )
+                if folder_entity is None:
+                    missing_paths.add(folder_path)
+                else:
+                    output[folder_path] = folder_entity
+                    hits += 1
+            self._count(hits, len(missing_paths))
+
+        if missing_paths:
+            for folder_entity in self._query_folders(
+                project_name, folder_paths=missing_paths
+            ):
+                output[folder_entity["path"]] = folder_entity
+        return output
+
+    def get_folder_entities_by_id(self, project_name, folder_ids):
+        """Get folder entities by ids.
+
+        All folders missing in cache are queried at once.
+
+        Args:
+            project_name (str): Project name.
+            folder_ids (Iterable[str]): Folder ids.
+
+        Returns:
+            dict[str, Union[dict[str, Any], None]]: Folder entities by id.
+
+        """
+        output = {}
+        missing_ids = set()
+        hits = 0
+        with self._lock:
+            self._prune()
+            for folder_id in set(folder_ids):
+                output[folder_id] = None
+                if not folder_id:
+                    continue
+                folder_entity = self._get_cached_folder(
+                    project_name, folder_id
+                )
+                if folder_entity is None:
+                    missing_ids.add(folder_id)
+                else:
+                    output[folder_id] = folder_entity
+                    hits += 1
+            self._count(hits, len(missing_ids))
+
+        if missing_ids:
+            for folder_entity in self._query_folders(
+                project_name, folder_ids=missing_ids
+            ):
+                output[folder_entity["id"]] = folder_entity
+        return output
+
+    def get_task_entities_by_id(self, project_name, task_ids):
+        """Get task entities by ids.
+
+        All tasks missing in cache are queried at once.
+
+        Args:
+            project_name (str): Project name.
+            task_ids (Iterable[str]): Task ids.
+
+        Returns:
+            dict[str, Union[dict[str, Any], None]]: Task entities by id.
+
+        """
+        output = {}
+        missing_ids = set()
+        hits = 0
+        with self._lock:
+            self._prune()
+            tasks_cache = self._tasks_by_id[project_name]
+            for task_id in set(task_ids):
+                output[task_id] = None
+                if not task_id:
+                    continue
+                cache = tasks_cache[task_id]
+                if cache.is_valid:
+                    output[task_id] = cache.get_data()
+                    hits += 1
+                else:
+                    missing_ids.add(task_id)
+            self._count(hits, len(missing_ids))
+
+        if missing_ids:
+            tasks = list(
+                ayon_api.get_tasks(project_name, task_ids=missing_ids)
+            )
+            with self._lock:
+                # Pruning could remove the project cache in the meantime
+                tasks_cache = self._tasks_by_id[project_name]
+                for task_entity in tasks:
+                    task_id = task_entity["id"]
+                    tasks_cache[task_id].update_data(task_entity)
+                    output[task_id] = task_entity
+        return output
+
+    def get_task_entities_by_folder_id(self, project_name, folder_ids):
+        """Get all task entities under folders.
+
+        Tasks of all folders missing in cache are queried at once.
+
+        Args:
+            project_name (str): Project name.
+            folder_ids (Iterable[str]): Folder ids.
+
+        Returns:
+            dict[str, list[dict[str, Any]]]: Task entities by folder id.
+
+        """
+        output = {}
+        missing_ids = set()
+        hits = 0
+        with self._lock:
+            self._prune()
+            ids_cache = self._task_ids_by_folder_id[project_name]
+            tasks_cache = self._tasks_by_id[project_name]
+            for folder_id in set(folder_ids):
+                output[folder_id] = []
+                if not folder_id:
+                    continue
+                cache = ids_cache[folder_id]
+                task_entities = None
+                if cache.is_valid:
+                    task_entities = []
+                    for task_id in cache.get_data():
+                        task_cache = tasks_cache[task_id]
+                        if not task_cache.is_valid:
+                            task_entities = None
+                            break
+                        task_entities.append(task_cache.get_data())
+
+                if task_entities is None:
+                    missing_ids.add(folder_id)
+                else:
+                    output[folder_id] = task_entities
+                    hits += 1
+            self._count(hits, len(missing_ids))
+
+        if not missing_ids:
+            return output
+
+        task_entities_by_folder_id = collections.defaultdict(list)
+        for task_entity in ayon_api.get_tasks(
+            project_name, folder_ids=missing_ids
+        ):
+            folder_id = task_entity["folderId"]
+            task_entities_by_folder_id[folder_id].append(task_entity)
+
+        with self._lock:
+            # Pruning could remove the project caches in the meantime
+            ids_cache = self._task_ids_by_folder_id[project_name]
+            tasks_cache = self._tasks_by_id[project_name]
+            for folder_id in missing_ids:
+                task_entities = task_entities_by_folder_id[folder_id]
+                for task_entity in task_entities:
+                    tasks_cache[task_entity["id"]].update_data(task_entity)
+                ids_cache[folder_id].update_data([
+                    task_entity["id"]
+                    for task_entity in task_entities
+                ])
+                output[folder_id] = task_entities
+        return output
+
+    def prefetch_folder_paths(self, project_name, folder_paths, tasks=True):
+        """Prefetch folders, and optionally their tasks, to cache.
+
+        Helper to fill cache with one query per entity type before
+            entities are requested one by one.
+
+        Args:
+            project_name (str): Project name.
+            folder_paths (Iterable[str]): Folder paths.
+            tasks (Optional[bool]): Prefetch also tasks of the folders.
+
+        """
+        folder_entities_by_path = self.get_folder_entities_by_path(
+            project_name, folder_paths
+        )
+        if not tasks:
+            return
+        self.get_task_entities_by_folder_id(
+            project_name,
+            {
+                folder_entity["id"]
+                for folder_entity in folder_entities_by_path.values()
+                if folder_entity is not None
+            }
+        )
+
+    def _get_caches(self):
+        return (
+            self._folders_by_id,
+            self._folder_ids_by_path,
+            self._tasks_by_id,
+            self._task_ids_by_folder_id,
+        )
+
+    def _count(self, hits, misses):
+        self._hits += hits
+        self._misses += misses
+
+    def _prune(self):
+        """Remove expired items from cache.
+
+        Expired items are not used, but they would stay in memory until
+            the same entity is requested again.
+        """
+        now = time.time()
+        if (now - self._last_prune) < self._lifetime:
+            return
+        self._last_prune = now
+        for cache in self._get_caches():
+            cache.clear_invalid()
+
+    def _get_cached_folder(self, project_name, folder_id):
+        cache = self._folders_by_id[project_name][folder_id]
+        if cache.is_valid:
+            return cache.get_data()
+        return None
+
+    def _query_folders(self, project_name, **kwargs):
+        folder_entities = list(ayon_api.get_folders(project_name, **kwargs))
+        with self._lock:
+            folders_cache = self._folders_by_id[project_name]
+            ids_cache = self._folder_ids_by_path[project_name]
+            for folder_entity in folder_entities:
+                folder_id = folder_entity["id"]
+                folders_cache[folder_id].update_data(folder_entity)
+                ids_cache[folder_entity["path"]].update_data(folder_id)
+        return folder_entities
+
+
+_entities_cache = None
+_entities_cache_lock = threading.Lock()
+
+
+def _on_entities_changed(event):
+    _entities_cache.invalidate(event.data.get("project_name"))
+
+
+def get_entities_cache():
+    """Entities cache shared in the process.
+
+    Returns:
+        EntitiesCache: Shared entities cache.
+
+    """
+    global _entities_cache
+    with _entities_cache_lock:
+        if _entities_cache is None:
+            _entities_cache = EntitiesCache()
+            register_event_callback(
+                ENTITIES_CHANGED_TOPIC, _on_entities_changed
+            )
+    return _entities_cache
@@ -20,6 +20,7 @@ from .utils import (
     load_container,
     remove_container,
     update_container,
+    update_containers,
     switch_container,
 
     get_loader_identifier,
@@ -75,6 +76,7 @@ __all__ = (
     "load_container",
     "remove_container",
     "update_container",
+    "update_containers",
     "switch_container",
 
     "get_loader_identifier",
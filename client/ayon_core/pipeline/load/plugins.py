@@ -28,6 +28,7 @@ class LoaderPlugin(list):
     extensions = {"*"}
     order = 0
     is_multiple_contexts_compatible = False
+    is_multiple_update_compatible = False
     enabled = True
 
     options = []
@@ -202,6 +203,26 @@ class LoaderPlugin(list):
         raise NotImplementedError("Loader.update() must be "
                                   "implemented by subclass")
 
+    def update_multiple(self, containers_contexts):
+        """Update multiple containers at once.
+
+        Used instead of 'update' by 'update_containers' when
+        'is_multiple_update_compatible' is enabled, so loader can update
+        all containers in one go.
+
+        Args:
+            containers_contexts (list[tuple[dict, dict]]): Containers with
+                contexts of representations to update them to.
+
+        Returns:
+            list[Any]: Result of update for each container.
+
+        """
+        return [
+            self.update(container, context)
+            for container, context in containers_contexts
+        ]
+
     def remove(self, container):
         """Remove a container
 
@@ -1,18 +1,24 @@
 import os
+import time
 import uuid
 import platform
 import logging
 import inspect
 import collections
 import numbers
+from datetime import timedelta
 from typing import Optional, Union, Any
 
 import ayon_api
+from ayon_api.graphql import GraphQlQuery
+from ayon_api.exceptions import GraphQlQueryFailed
 
 from ayon_core.host import ILoadHost
 from ayon_core.lib import (
     StringTemplate,
     TemplateUnsolved,
+    get_server_time,
+    update_server_time,
 )
 from ayon_core.pipeline import (
     Anatomy,
@@ -24,6 +30,10 @@ ContainersFilterResult = collections.namedtuple(
     "ContainersFilterResult",
     ["latest", "outdated", "not_found", "invalid"]
 )
+ContainerUpdateResult = collections.namedtuple(
+    "ContainerUpdateResult",
+    ["container", "result", "error"]
+)
 
 
 class HeroVersionType(object):
@@ -462,101 +472,337 @@ def remove_container(container):
 
 def update_container(container, version=-1):
     """Update a container"""
+    result = update_containers([container], version)[0]
+    if result.error is not None:
+        raise result.error
+    return result.result
+
+
+def update_containers(containers, version=-1):
+    """Update multiple containers.
+
+    Entities needed for update of all containers are queried at once per
+    entity type, instead of one by one for each container. Loaders with
+    'is_multiple_update_compatible' enabled update all their containers
+    in one call of 'update_multiple'.
+
+    Update of a container does not stop update of other containers when it
+    fails, the error is available in the result instead.
+
+    Args:
+        containers (Iterable[dict[str, Any]]): Containers to update.
+        version (Union[int, HeroVersionType, list]): Version to update
+            to. Value -1 means latest version and 'HeroVersionType' means
+            hero version. Can be a list with version for each container.
+
+    Returns:
+        list[ContainerUpdateResult]: Result of update for each container
+            in the same order as containers.
+
+    """
     from ayon_core.pipeline import get_current_project_name
+    from .plugins import discover_loader_plugins
 
-    # Compute the different version from 'representation'
-    project_name = container.get("project_name")
-    if project_name is None:
-        project_name = get_current_project_name()
-    repre_id = container["representation"]
-    if not _is_valid_representation_id(repre_id):
-        raise ValueError(
-            f"Got container with invalid representation id '{repre_id}'"
+    containers = list(containers)
+    if isinstance(version, (list, tuple)):
+        versions = list(version)
+        if len(versions) != len(containers):
+            raise ValueError(
+                "Number of versions {} does not match number of"
+                " containers {}".format(len(versions), len(containers))
+            )
+    else:
+        versions = [version] * len(containers)
+
+    items_by_project_name = collections.defaultdict(list)
+    items = []
+    current_project_name = None
+    for container, item_version in zip(containers, versions):
+        item = _ContainerUpdateItem(container, item_version)
+        items.append(item)
+        project_name = container.get("project_name")
+        if project_name is None:
+            if current_project_name is None:
+                current_project_name = get_current_project_name()
+            project_name = current_project_name
+        items_by_project_name[project_name].append(item)
+
+    loaders_by_identifier = {}
+    if items:
+        # Discover loaders only once, it is expensive
+        for loader in discover_loader_plugins():
+            identifier = get_loader_identifier(loader)
+            loaders_by_identifier.setdefault(identifier, loader)
+
+    for project_name, project_items in items_by_project_name.items():
+        _fill_containers_update_contexts(
+            project_name, project_items, loaders_by_identifier
         )
-    current_representation = ayon_api.get_representation_by_id(
-        project_name, repre_id
-    )
 
-    assert current_representation is not None, "This is a bug"
+    items_by_loader = collections.defaultdict(list)
+    for item in items:
+        if item.error is not None:
+            continue
+        path = get_representation_path_from_context(item.context)
+        if not path or not os.path.exists(path):
+            item.error = ValueError("Path {} doesn't exist".format(path))
+            continue
+        items_by_loader[item.loader].append(item)
+
+    for loader, loader_items in items_by_loader.items():
+        if loader.is_multiple_update_compatible:
+            try:
+                results = loader().update_multiple([
+                    (item.container, item.context)
+                    for item in loader_items
+                ])
+                for item, result in zip(loader_items, results):
+                    item.result = result
+            except Exception as exc:
+                for item in loader_items:
+                    item.error = exc
+            continue
 
-    current_version_id = current_representation["versionId"]
-    current_version = ayon_api.get_version_by_id(
-        project_name, current_version_id, fields={"productId"}
-    )
-    if isinstance(version, HeroVersionType):
-        new_version = ayon_api.get_hero_version_by_product_id(
-            project_name, current_version["productId"]
+        for item in loader_items:
+            try:
+                item.result = loader().update(item.container, item.context)
+            except Exception as exc:
+                item.error = exc
+
+    return [
+        ContainerUpdateResult(item.container, item.result, item.error)
+        for item in items
+    ]
+
+
+class _ContainerUpdateItem:
+    """Helper to store state of container during update."""
+    def __init__(self, container, version):
+        self.container = container
+        self.version = version
+        self.representation = None
+        self.product_id = None
+        self.context = None
+        self.loader = None
+        self.result = None
+        self.error = None
+
+
+def _fill_containers_update_contexts(
+    project_name, items, loaders_by_identifier
+):
+    """Find representation contexts to which containers are updated.
+
+    Args:
+        project_name (str): Project name of containers.
+        items (list[_ContainerUpdateItem]): Containers to update.
+        loaders_by_identifier (dict[str, type[LoaderPlugin]]): Available
+            loaders by identifier.
+
+    """
+    for item in items:
+        repre_id = item.container["representation"]
+        if not _is_valid_representation_id(repre_id):
+            item.error = ValueError(
+                f"Got container with invalid representation id '{repre_id}'"
+            )
+
+    repre_ids = {
+        item.container["representation"]
+        for item in items
+        if item.error is None
+    }
+    repres_by_id = {}
+    if repre_ids:
+        repres_by_id = {
+            repre_entity["id"]: repre_entity
+            for repre_entity in ayon_api.get_representations(
+                project_name, representation_ids=repre_ids, active=None
+            )
+        }
+
+    for item in items:
+        if item.error is not None:
+            continue
+        repre_entity = repres_by_id.get(item.container["representation"])
+        if repre_entity is None:
+            item.error = AssertionError("This is a bug")
+        item.representation = repre_entity
+
+    version_ids = {
+        item.representation["versionId"]
+        for item in items
+        if item.error is None
+    }
+    if not version_ids:
+        return
+
+    product_ids_by_version_id = {
+        version_entity["id"]: version_entity["productId"]
+        for version_entity in ayon_api.get_versions(
+            project_name,
+            version_ids=version_ids,
+            active=None,
+            fields={"id", "productId"}
         )
-    elif version == -1:
-        new_version = ayon_api.get_last_version_by_product_id(
-            project_name, current_version["productId"]
+    }
+
+    hero_product_ids = set()
+    last_product_ids = set()
+    named_product_ids = set()
+    version_names = set()
+    for item in items:
+        if item.error is not None:
+            continue
+        product_id = product_ids_by_version_id.get(
+            item.representation["versionId"]
         )
+        if product_id is None:
+            item.error = ValueError("Failed to find current version")
+            continue
+        item.product_id = product_id
+        if isinstance(item.version, HeroVersionType):
+            hero_product_ids.add(product_id)
+        elif item.version == -1:
+            last_product_ids.add(product_id)
+        else:
+            named_product_ids.add(product_id)
+            version_names.add(item.version)
+
+    hero_versions_by_product_id = {}
+    if hero_product_ids:
+        hero_versions_by_product_id = {
+            version_entity["productId"]: version_entity
+            for version_entity in ayon_api.get_hero_versions(
+                project_name, product_ids=hero_product_ids
+            )
+        }
 
-    else:
-        new_version = ayon_api.get_version_by_name(
-            project_name, version, current_version["productId"]
+    last_versions_by_product_id = {}
+    if last_product_ids:
+        last_versions_by_product_id = ayon_api.get_last_versions(
+            project_name, product_ids=last_product_ids
         )
 
-    if new_version is None:
-        raise ValueError("Failed to find matching version")
+    versions_by_name = {}
+    if named_product_ids:
+        versions_by_name = {
+            (version_entity["productId"], version_entity["version"]): (
+                version_entity
+            )
+            for version_entity in ayon_api.get_versions(
+                project_name,
+                product_ids=named_product_ids,
+                versions=version_names,
+                active=None,
+            )
+        }
 
-    product_entity = ayon_api.get_product_by_id(
-        project_name, current_version["productId"]
-    )
-    folder_entity = ayon_api.get_folder_by_id(
-        project_name, product_entity["folderId"]
-    )
+    new_versions_by_item = {}
+    for item in items:
+        if item.error is not None:
+            continue
+        if isinstance(item.version, HeroVersionType):
+            new_version = hero_versions_by_product_id.get(item.product_id)
+        elif item.version == -1:
+            new_version = last_versions_by_product_id.get(item.product_id)
+        else:
+            new_version = versions_by_name.get(
+                (item.product_id, item.version)
+            )
 
-    # Run update on the Loader for this container
-    Loader = _get_container_loader(container)
-    if not Loader:
-        raise LoaderNotFoundError(
-            "Can't update container because loader '{}' was not found."
-            .format(container.get("loader"))
+        if new_version is None:
+            item.error = ValueError("Failed to find matching version")
+            continue
+        new_versions_by_item[item] = new_version
+
+    product_ids = {item.product_id for item in new_versions_by_item}
+    if not product_ids:
+        return
+
+    products_by_id = {
+        product_entity["id"]: product_entity
+        for product_entity in ayon_api.get_products(
+            project_name, product_ids=product_ids, active=None
+        )
+    }
+    folders_by_id = {
+        folder_entity["id"]: folder_entity
+        for folder_entity in ayon_api.get_folders(
+            project_name,
+            folder_ids={
+                product_entity["folderId"]
+                for product_entity in products_by_id.values()
+            },
+            active=None,
         )
+    }
 
-    repre_name = current_representation["name"]
-    new_representation = ayon_api.get_representation_by_name(
-        project_name, repre_name, new_version["id"]
-    )
-    if new_representation is None:
-        # The representation name is not found in the new version.
-        # Allow updating to a 'matching' representation if the loader
-        # has defined compatible update conversions
-        repre_name_aliases = Loader.get_representation_name_aliases(repre_name)
-        if repre_name_aliases:
-            representations = ayon_api.get_representations(
-                project_name,
-                representation_names=repre_name_aliases,
-                version_ids=[new_version["id"]])
-            representations_by_name = {
-                repre["name"]: repre for repre in representations
-            }
-            for name in repre_name_aliases:
-                if name in representations_by_name:
-                    new_representation = representations_by_name[name]
-                    break
+    # Representation names with aliases allowed by loader for each
+    #   new version
+    repre_names_by_item = {}
+    repre_names_by_version_id = collections.defaultdict(set)
+    for item, new_version in new_versions_by_item.items():
+        loader = loaders_by_identifier.get(item.container["loader"])
+        if not loader:
+            item.error = LoaderNotFoundError(
+                "Can't update container because loader '{}' was not found."
+                .format(item.container.get("loader"))
+            )
+            continue
+        item.loader = loader
+        repre_name = item.representation["name"]
+        repre_names = [repre_name]
+        repre_names.extend(
+            loader.get_representation_name_aliases(repre_name) or []
+        )
+        repre_names_by_item[item] = repre_names
+        repre_names_by_version_id[new_version["id"]].update(repre_names)
+
+    if not repre_names_by_item:
+        return
 
+    repres_by_version_id = collections.defaultdict(dict)
+    for repre_entity in ayon_api.get_representations(
+        project_name,
+        names_by_version_ids=repre_names_by_version_id,
+        active=None,
+    ):
+        version_id = repre_entity["versionId"]
+        repres_by_version_id[version_id][repre_entity["name"]] = repre_entity
+
+    project_entity = ayon_api.get_project(project_name)
+    for item, repre_names in repre_names_by_item.items():
+        new_version = new_versions_by_item[item]
+        repres_by_name = repres_by_version_id[new_version["id"]]
+        new_representation = next(
+            (
+                repres_by_name[repre_name]
+                for repre_name in repre_names
+                if repre_name in repres_by_name
+            ),
+            None
+        )
         if new_representation is None:
-            raise ValueError(
+            item.error = ValueError(
                 "Representation '{}' wasn't found on requested version".format(
-                    repre_name
+                    repre_names[0]
                 )
             )
+            continue
 
-    project_entity = ayon_api.get_project(project_name)
-    context = {
-        "project": project_entity,
-        "folder": folder_entity,
-        "product": product_entity,
-        "version": new_version,
-        "representation": new_representation,
-    }
-    path = get_representation_path_from_context(context)
-    if not path or not os.path.exists(path):
-        raise ValueError("Path {} doesn't exist".format(path))
+        product_entity = products_by_id.get(item.product_id)
+        if product_entity is None:
+            item.error = ValueError("Failed to find product")
+            continue
 
-    return Loader().update(container, context)
+        item.context = {
+            "project": project_entity,
+            "folder": folders_by_id.get(product_entity["folderId"]),
+            "product": product_entity,
+            "version": new_version,
+            "representation": new_representation,
+        }
 
 
 def switch_container(container, representation, loader_plugin=None):
@@ -932,6 +1178,9 @@ def get_outdated_containers(host=None, project_name=None):
     Currently registered host and project in global session are used if
     arguments are not passed.
 
+    Versions info of representations is cached, so repeated checks of
+    unchanged scene do not query server until a version is created.
+
     Args:
         host (ModuleType): Host implementation with 'ls' function available.
         project_name (str): Name of project in which context we are.
@@ -948,7 +1197,9 @@ def get_outdated_containers(host=None, project_name=None):
         containers = host.get_containers()
     else:
         containers = host.ls()
-    return filter_containers(containers, project_name).outdated
+    return filter_containers(
+        containers, project_name, use_cache=True
+    ).outdated
 
 
 def _is_valid_representation_id(repre_id: Any) -> bool:
@@ -961,74 +1212,147 @@ def _is_valid_representation_id(repre_id: Any) -> bool:
     return True
 
 
-def filter_containers(containers, project_name):
-    """Filter containers and split them into 4 categories.
+def _representations_versions_graphql_query():
+    query = GraphQlQuery("RepresentationsVersionsQuery")
+
+    project_name_var = query.add_variable("projectName", "String!")
+    repre_ids_var = query.add_variable("representationIds", "[String!]")
+
+    project_field = query.add_field("project")
+    project_field.set_filter("name", project_name_var)
+
+    repres_field = project_field.add_field_with_edges("representations")
+    repres_field.add_field("id")
+    repres_field.add_field("active")
+    repres_field.set_filter("ids", repre_ids_var)
+    version_field = repres_field.add_field("version")
+    version_field.add_field("id")
+    version_field.add_field("version")
+    version_field.add_field("active")
+    product_field = version_field.add_field("product")
+    product_field.add_field("id")
+    last_version_field = product_field.add_field("latestVersion")
+    last_version_field.add_field("id")
+    last_version_field.add_field("active")
+    return query
 
-    Categories are 'latest', 'outdated', 'invalid' and 'not_found'.
-    The 'lastest' containers are from last version, 'outdated' are not,
-    'invalid' are invalid containers (invalid content) and 'not_found' has
-    some missing entity in database.
+
+class _ServerTimeConnection:
+    """Connection which stores server time from GraphQl responses.
 
     Args:
-        containers (Iterable[dict]): List of containers referenced into scene.
-        project_name (str): Name of project in which context shoud look for
-            versions.
+        con (ayon_api.ServerAPI): Connection to server.
+
+    """
+    def __init__(self, con):
+        self._con = con
+
+    def __getattr__(self, name):
+        return getattr(self._con, name)
+
+    def query_graphql(self, *args, **kwargs):
+        response = self._con.query_graphql(*args, **kwargs)
+        update_server_time(response.data)
+        return response
+
+
+def _query_representations_versions_info(project_name, repre_ids):
+    """Query version of representations and if the version is outdated.
+
+    Representations, their versions and last versions of products are
+    queried in one GraphQL query. Separated queries are used on servers
+    which do not support the query. Inactive representations and versions
+    are handled as missing, same as in separated queries.
+
+    Args:
+        project_name (str): Project name.
+        repre_ids (Iterable[str]): Representation ids.
 
     Returns:
-        ContainersFilterResult: Named tuple with 'latest', 'outdated',
-            'invalid' and 'not_found' containers.
+        dict[str, tuple[Union[str, None], bool]]: Version id and outdated
+            state by representation id. Missing representations are not
+            in output. Version id is None if version is missing.
+
     """
+    query = _representations_versions_graphql_query()
+    query.set_variable_value("projectName", project_name)
+    query.set_variable_value("representationIds", list(repre_ids))
+    try:
+        parsed_data = query.query(
+            _ServerTimeConnection(ayon_api.get_server_api_connection())
+        )
+    except GraphQlQueryFailed:
+        log.debug(
+            "Failed to query representations versions with one query.",
+            exc_info=True
+        )
+        return _query_representations_versions_info_separated(
+            project_name, repre_ids
+        )
 
-    # Make sure containers is list that won't change
-    containers = list(containers)
+    output = {}
+    for repre in parsed_data["project"]["representations"]:
+        if not repre["active"]:
+            continue
+        version = repre["version"]
+        if not version or not version["active"]:
+            output[repre["id"]] = (None, False)
+            continue
 
-    outdated_containers = []
-    uptodate_containers = []
-    not_found_containers = []
-    invalid_containers = []
-    output = ContainersFilterResult(
-        uptodate_containers,
-        outdated_containers,
-        not_found_containers,
-        invalid_containers
-    )
-    # Query representation docs to get it's version ids
-    repre_ids = {
-        container["representation"]
-        for container in containers
-        if _is_valid_representation_id(container["representation"])
-    }
-    if not repre_ids:
-        if containers:
-            invalid_containers.extend(containers)
-        return output
+        version_id = version["id"]
+        is_outdated = False
+        # Hero versions are considered as latest
+        if version["version"] >= 0:
+            last_version = (version["product"] or {}).get("latestVersion")
+            # Inactive last version is not used, like in 'get_last_versions'
+            is_outdated = (
+                last_version is not None
+                and last_version["active"]
+                and last_version["id"] != version_id
+            )
+        output[repre["id"]] = (version_id, is_outdated)
+    return output
+
+
+def _query_representations_versions_info_separated(project_name, repre_ids):
+    """Query version of representations and if the version is outdated.
+
+    Fallback of '_query_representations_versions_info' using separated
+    queries for representations, versions and last versions. Only active
+    entities are used.
+
+    Args:
+        project_name (str): Project name.
+        repre_ids (Iterable[str]): Representation ids.
+
+    Returns:
+        dict[str, tuple[Union[str, None], bool]]: Version id and outdated
+            state by representation id.
 
+    """
     repre_entities = ayon_api.get_representations(
         project_name,
         representation_ids=repre_ids,
+        active=True,
         fields={"id", "versionId"}
     )
-    # Store representations by stringified representation id
-    repre_entities_by_id = {}
-    repre_entities_by_version_id = collections.defaultdict(list)
-    for repre_entity in repre_entities:
-        repre_id = repre_entity["id"]
-        version_id = repre_entity["versionId"]
-        repre_entities_by_id[repre_id] = repre_entity
-        repre_entities_by_version_id[version_id].append(repre_entity)
+    version_id_by_repre_id = {
+        repre_entity["id"]: repre_entity["versionId"]
+        for repre_entity in repre_entities
+    }
 
     # Query version docs to get it's product ids
     # - also query hero version to be able identify if representation
     #   belongs to existing version
     version_entities = ayon_api.get_versions(
         project_name,
-        version_ids=repre_entities_by_version_id.keys(),
+        version_ids=set(version_id_by_repre_id.values()),
         hero=True,
+        active=True,
         fields={"id", "productId", "version"}
     )
     verisons_by_id = {}
     versions_by_product_id = collections.defaultdict(list)
-    hero_version_ids = set()
     for version_entity in version_entities:
         version_id = version_entity["id"]
         # Store versions by their ids
@@ -1036,7 +1360,6 @@ def filter_containers(containers, project_name):
         # There's no need to query products for hero versions
         #   - they are considered as latest?
         if version_entity["version"] < 0:
-            hero_version_ids.add(version_id)
             continue
         product_id = version_entity["productId"]
         versions_by_product_id[product_id].append(version_entity)
@@ -1044,18 +1367,167 @@ def filter_containers(containers, project_name):
     last_versions = ayon_api.get_last_versions(
         project_name,
         versions_by_product_id.keys(),
+        active=True,
         fields={"id"}
     )
     # Figure out which versions are outdated
     outdated_version_ids = set()
     for product_id, last_version_entity in last_versions.items():
+        if last_version_entity is None:
+            continue
         for version_entity in versions_by_product_id[product_id]:
             version_id = version_entity["id"]
-            if version_id in hero_version_ids:
-                continue
             if version_id != last_version_entity["id"]:
                 outdated_version_ids.add(version_id)
 
+    output = {}
+    for repre_id, version_id in version_id_by_repre_id.items():
+        if version_id not in verisons_by_id:
+            version_id = None
+        output[repre_id] = (version_id, version_id in outdated_version_ids)
+    return output
+
+
+class _RepresentationsVersionsInfoCache:
+    """Cache of versions info of representations used in scene.
+
+    Hosts check outdated containers repeatedly, even if nothing changed.
+    Versions info is cached for the set of representation ids and is
+    invalidated when a version is created, deleted, or its active state
+    or status did change on server. Server events are checked at most once
+    in 'events_check_interval' seconds.
+
+    Events are compared with time on server when versions were queried,
+    so different time on this machine does not matter. Server time is
+    updated from response of the query.
+    """
+    events_check_interval = 10
+    invalidation_topics = {
+        "entity.version.created",
+        "entity.version.deleted",
+        "entity.version.active_changed",
+        "entity.version.status_changed",
+    }
+    # Margin for delay between server response and the query
+    time_margin = 10
+
+    def __init__(self):
+        self._items_by_project_name = {}
+
+    def reset(self):
+        self._items_by_project_name = {}
+
+    def get_info(self, project_name, repre_ids):
+        """Get versions info of representations.
+
+        Args:
+            project_name (str): Project name.
+            repre_ids (Iterable[str]): Representation ids.
+
+        Returns:
+            dict[str, tuple[Union[str, None], bool]]: Version id and
+                outdated state by representation id.
+
+        """
+        repre_ids = frozenset(repre_ids)
+        item = self._items_by_project_name.get(project_name)
+        if (
+            item is not None
+            and item["repre_ids"] == repre_ids
+            and self._is_valid(project_name, item)
+        ):
+            return item["info"]
+
+        info = _query_representations_versions_info(project_name, repre_ids)
+        # Use older time to not miss events created during query
+        queried_at = get_server_time() - timedelta(seconds=self.time_margin)
+        self._items_by_project_name[project_name] = {
+            "repre_ids": repre_ids,
+            "info": info,
+            "queried_at": queried_at.isoformat(),
+            "checked": time.time(),
+        }
+        return info
+
+    def _is_valid(self, project_name, item):
+        if (time.time() - item["checked"]) < self.events_check_interval:
+            return True
+
+        try:
+            events = ayon_api.get_events(
+                topics=self.invalidation_topics,
+                project_names=[project_name],
+                newer_than=item["queried_at"],
+                fields={"id"},
+                limit=1,
+            )
+            is_valid = next(iter(events), None) is None
+        except Exception:
+            log.debug("Failed to check version events.", exc_info=True)
+            return False
+
+        if is_valid:
+            item["checked"] = time.time()
+        return is_valid
+
+
+_repre_versions_info_cache = _RepresentationsVersionsInfoCache()
+
+
+def filter_containers(containers, project_name, use_cache=False):
+    """Filter containers and split them into 4 categories.
+
+    Categories are 'latest', 'outdated', 'invalid' and 'not_found'.
+    The 'lastest' containers are from last version, 'outdated' are not,
+    'invalid' are invalid containers (invalid content) and 'not_found' has
+    some missing entity in database.
+
+    Args:
+        containers (Iterable[dict]): List of containers referenced into scene.
+        project_name (str): Name of project in which context shoud look for
+            versions.
+        use_cache (Optional[bool]): Use cached versions info if the same
+            representations were already checked and no version was created
+            since then.
+
+    Returns:
+        ContainersFilterResult: Named tuple with 'latest', 'outdated',
+            'invalid' and 'not_found' containers.
+    """
+
+    # Make sure containers is list that won't change
+    containers = list(containers)
+
+    outdated_containers = []
+    uptodate_containers = []
+    not_found_containers = []
+    invalid_containers = []
+    output = ContainersFilterResult(
+        uptodate_containers,
+        outdated_containers,
+        not_found_containers,
+        invalid_containers
+    )
+    # Query representation docs to get it's version ids
+    repre_ids = {
+        container["representation"]
+        for container in containers
+        if _is_valid_representation_id(container["representation"])
+    }
+    if not repre_ids:
+        if containers:
+            invalid_containers.extend(containers)
+        return output
+
+    if use_cache:
+        versions_info_by_repre_id = _repre_versions_info_cache.get_info(
+            project_name, repre_ids
+        )
+    else:
+        versions_info_by_repre_id = _query_representations_versions_info(
+            project_name, repre_ids
+        )
+
     # Based on all collected data figure out which containers are outdated
     #   - log out if there are missing representation or version documents
     for container in containers:
@@ -1065,8 +1537,8 @@ def filter_containers(containers, project_name):
             invalid_containers.append(container)
             continue
 
-        repre_entity = repre_entities_by_id.get(repre_id)
-        if not repre_entity:
+        versions_info = versions_info_by_repre_id.get(repre_id)
+        if not versions_info:
             log.debug((
                 "Container '{}' has an invalid representation."
                 " It is missing in the database."
@@ -1074,11 +1546,11 @@ def filter_containers(containers, project_name):
             not_found_containers.append(container)
             continue
 
-        version_id = repre_entity["versionId"]
-        if version_id in outdated_version_ids:
+        version_id, is_outdated = versions_info
+        if is_outdated:
             outdated_containers.append(container)
 
-        elif version_id not in verisons_by_id:
+        elif version_id is None:
             log.debug((
                 "Representation on container '{}' has an invalid version."
                 " It is missing in the database."
@@ -1,16 +1,273 @@
 import os
+import sys
+import json
+import types
 import inspect
+import threading
 import traceback
+import importlib.machinery
 
-from ayon_core.lib import Logger
-from ayon_core.lib.python_module_tools import (
-    modules_from_path,
-    classes_from_module,
-)
+from ayon_core.lib import Logger, get_launcher_local_dir
+from ayon_core.lib.python_module_tools import classes_from_module
 
 log = Logger.get_logger(__name__)
 
 
+def is_plugins_cache_enabled():
+    """Is compiled code of plugin files reused on discovery.
+
+    Cache can be disabled with 'AYON_PLUGINS_CACHE_DISABLED' environment
+    variable set to '1'.
+
+    Returns:
+        bool: Plugins cache is enabled.
+
+    """
+    return os.getenv("AYON_PLUGINS_CACHE_DISABLED") != "1"
+
+
+def is_plugins_manifest_enabled():
+    """Are plugin files without plugins skipped using manifest.
+
+    Manifest mode is enabled with 'AYON_PLUGINS_MANIFEST' environment
+    variable set to '1'. Manifest stores which plugin classes each file
+    did define when it was imported. Unchanged files which did not define
+    any plugin of discovered type are not imported at all.
+
+    Returns:
+        bool: Plugins manifest mode is enabled.
+
+    """
+    return os.getenv("AYON_PLUGINS_MANIFEST") == "1"
+
+
+def _get_superclass_key(superclass):
+    return "{}.{}".format(superclass.__module__, superclass.__qualname__)
+
+
+class PluginModulesCache:
+    """Cache of compiled plugin files.
+
+    Compiled code of plugin files is reused by following discoveries until
+    the plugin file is modified. Files are identified by path, modification
+    time and size. Listing of directory is reused until the directory is
+    modified.
+
+    Module is executed again on each discovery, so each discovery returns
+    new plugin classes. Settings applied to classes from one discovery
+    don't affect classes from other discoveries.
+
+    Files which failed to import are not cached and are imported again
+    on next discovery.
+
+    Args:
+        enabled (Optional[bool]): Reuse compiled code. Value from
+            'is_plugins_cache_enabled' is used if not passed.
+        use_manifest (Optional[bool]): Skip files without plugins using
+            manifest stored on disk. Value from
+            'is_plugins_manifest_enabled' is used if not passed.
+
+    """
+    def __init__(self, enabled=None, use_manifest=None):
+        if enabled is None:
+            enabled = is_plugins_cache_enabled()
+        if use_manifest is None:
+            use_manifest = is_plugins_manifest_enabled()
+        self._enabled = enabled
+        self._use_manifest = use_manifest
+        self._lock = threading.RLock()
+        self._code_by_path = {}
+        self._filenames_by_dirpath = {}
+        self._manifest = None
+        self._manifest_changed = False
+
+    def clear(self):
+        """Clear cached code."""
+        with self._lock:
+            self._code_by_path.clear()
+            self._filenames_by_dirpath.clear()
+
+    def get_modules(self, dirpath, superclass=None):
+        """Get modules of python files in a directory.
+
+        Files starting with underscore are skipped. Modules are always
+        executed, only compiled code is reused.
+
+        Args:
+            dirpath (str): Path to directory with python files.
+            superclass (Optional[type]): Discovered plugin type used to
+                skip files without plugins in manifest mode.
+
+        Returns:
+            tuple[list[tuple[str, ModuleType]], list[tuple[str, Any]]]:
+                Imported modules with their filepath and filepaths of files
+                which crashed on import with exception information.
+
+        """
+        modules = []
+        crashed = []
+        with self._lock:
+            for filepath in self._get_filepaths(dirpath):
+                try:
+                    stat = os.stat(filepath)
+                except OSError:
+                    continue
+                stat_key = (stat.st_mtime_ns, stat.st_size)
+                if self._can_skip(filepath, stat_key, superclass):
+                    continue
+
+                mod_name = os.path.splitext(os.path.basename(filepath))[0]
+                try:
+                    code = self._get_code(filepath, mod_name, stat_key)
+                    # Same as 'import_filepath' but with cached code
+                    module = types.ModuleType(mod_name)
+                    module.__file__ = filepath
+                    exec(code, module.__dict__)
+                except Exception:
+                    crashed.append((filepath, sys.exc_info()))
+                    continue
+                modules.append((filepath, module))
+        return modules, crashed
+
+    def store_module_plugins(self, filepath, module, superclass):
+        """Store names of plugins defined in a module to manifest.
+
+        Only subclasses of 'superclass' defined in the module are stored,
+        regardless of their validity for current host. File is skipped on
+        next discovery of the plugin type if it does not define any.
+
+        Args:
+            filepath (str): Path to python file of the module.
+            module (ModuleType): Module imported from the file.
+            superclass (type): Discovered plugin type.
+
+        """
+        if not self._use_manifest:
+            return
+        superclass_key = _get_superclass_key(superclass)
+        try:
+            stat = os.stat(filepath)
+        except OSError:
+            return
+        stat_key = [stat.st_mtime_ns, stat.st_size]
+        module_names = {module.__name__, module.__file__}
+        plugin_names = sorted(
+            name
+            for name, obj in vars(module).items()
+            if (
+                inspect.isclass(obj)
+                and obj is not superclass
+                and issubclass(obj, superclass)
+                and obj.__module__ in module_names
+            )
+        )
+        with self._lock:
+            manifest = self._get_manifest()
+            item = manifest.get(filepath)
+            if item is None or item["stat"] != stat_key:
+                item = {"stat": stat_key, "plugins": {}}
+                manifest[filepath] = item
+            if item["plugins"].get(superclass_key) != plugin_names:
+                item["plugins"][superclass_key] = plugin_names
+                self._manifest_changed = True
+
+    def save_manifest(self):
+        """Store manifest to disk if it did change."""
+        with self._lock:
+            if not self._manifest_changed:
+                return
+            self._manifest_changed = False
+            filepath = self._get_manifest_path()
+            try:
+                os.makedirs(os.path.dirname(filepath), exist_ok=True)
+                # Write to temp file first to avoid reading of partial file
+                #   from other processes
+                tmp_path = "{}.{}.tmp".format(filepath, os.getpid())
+                with open(tmp_path, "w") as stream:
+                    json.dump(self._manifest, stream)
+                os.replace(tmp_path, filepath)
+            except OSError:
+                log.debug("Failed to store plugins manifest.", exc_info=True)
+
+    def _get_filepaths(self, dirpath):
+        try:
+            dir_mtime = os.stat(dirpath).st_mtime_ns
+        except OSError:
+            return []
+
+        cached = self._filenames_by_dirpath.get(dirpath)
+        if cached is not None and cached[0] == dir_mtime:
+            return cached[1]
+
+        filepaths = []
+        for filename in os.listdir(dirpath):
+            # Ignore files which start with underscore
+            if filename.startswith("_"):
+                continue
+            if os.path.splitext(filename)[1] != ".py":
+                continue
+            filepath = os.path.join(dirpath, filename)
+            if os.path.isfile(filepath):
+                filepaths.append(filepath)
+
+        if self._enabled:
+            self._filenames_by_dirpath[dirpath] = (dir_mtime, filepaths)
+        return filepaths
+
+    def _get_code(self, filepath, mod_name, stat_key):
+        cached = self._code_by_path.get(filepath)
+        if cached is not None and cached[0] == stat_key:
+            return cached[1]
+
+        loader = importlib.machinery.SourceFileLoader(mod_name, filepath)
+        code = loader.get_code(mod_name)
+        if self._enabled:
+            self._code_by_path[filepath] = (stat_key, code)
+        return code
+
+    def _can_skip(self, filepath, stat_key, superclass):
+        if not self._use_manifest or superclass is None:
+            return False
+        item = self._get_manifest().get(filepath)
+        return (
+            item is not None
+            and tuple(item["stat"]) == stat_key
+            and item["plugins"].get(_get_superclass_key(superclass)) == []
+        )
+
+    def _get_manifest_path(self):
+        return get_launcher_local_dir("plugins_manifest.json")
+
+    def _get_manifest(self):
+        if self._manifest is None:
+            manifest = {}
+            filepath = self._get_manifest_path()
+            if os.path.exists(filepath):
+                try:
+                    with open(filepath, "r") as stream:
+                        manifest = json.load(stream)
+                except (OSError, ValueError):
+                    pass
+            self._manifest = manifest
+        return self._manifest
+
+
+_plugin_modules_cache = None
+
+
+def get_plugin_modules_cache():
+    """Cache of plugin modules shared in the process.
+
+    Returns:
+        PluginModulesCache: Shared cache of plugin modules.
+
+    """
+    global _plugin_modules_cache
+    if _plugin_modules_cache is None:
+        _plugin_modules_cache = PluginModulesCache()
+    return _plugin_modules_cache
+
+
 class DiscoverResult:
     """Result of Plug-ins discovery of a single superclass type.
 
@@ -101,7 +358,8 @@ class PluginDiscoverContext(object):
 
     Keeps in memory all registered types and their paths. Paths are dynamically
     loaded on discover so different discover calls won't return the same
-    class objects even if were loaded from same file.
+    class objects even if were loaded from same file. Compiled code of
+    unchanged files is reused from 'PluginModulesCache'.
     """
 
     def __init__(self):
@@ -167,15 +425,26 @@ class PluginDiscoverContext(object):
             result.plugins.append(cls)
 
         # Include plug-ins from registered paths
+        modules_cache = get_plugin_modules_cache()
         for path in registered_paths:
-            modules, crashed = modules_from_path(path)
+            if not os.path.isdir(path):
+                log.warning("Not a directory path: {}".format(path))
+                continue
+            modules, crashed = modules_cache.get_modules(path, superclass)
             for item in crashed:
                 filepath, exc_info = item
                 result.crashed_file_paths[filepath] = exc_info
+                log.warning(
+                    "Failed to load path: \"{0}\"".format(filepath),
+                    exc_info=exc_info
+                )
 
             for item in modules:
                 filepath, module = item
                 result.add_module(module)
+                modules_cache.store_module_plugins(
+                    filepath, module, superclass
+                )
                 for cls in classes_from_module(superclass, module):
                     if cls is superclass or cls in ignore_classes:
                         result.ignored_plugins.add(cls)
@@ -194,6 +463,8 @@ class PluginDiscoverContext(object):
 
                     result.plugins.append(cls)
 
+        modules_cache.save_manifest()
+
         # Store in memory last result to keep in memory loaded modules
         self._last_discovered_results[superclass] = result
         self._last_discovered_plugins[superclass] = list(
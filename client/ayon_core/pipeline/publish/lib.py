@@ -13,13 +13,15 @@ import pyblish.api
 
 from ayon_core.lib import (
     Logger,
-    import_filepath,
     filter_profiles,
 )
 from ayon_core.settings import get_project_settings
 from ayon_core.addon import AddonsManager
 from ayon_core.pipeline import get_staging_dir_info
-from ayon_core.pipeline.plugin_discover import DiscoverResult
+from ayon_core.pipeline.plugin_discover import (
+    DiscoverResult,
+    get_plugin_modules_cache,
+)
 from .constants import (
     DEFAULT_PUBLISH_TEMPLATE,
     DEFAULT_HERO_PUBLISH_TEMPLATE,
@@ -136,16 +138,23 @@ def get_publish_template_name(
         "task_names": task_name,
         "task_types": task_type,
     }
+    if not project_name and not project_settings:
+        raise ValueError((
+            "Both project name and project settings are missing."
+            " At least one must be entered."
+        ))
+
+    # Profiles are not copied so cached profiles matcher can be reused
+    #   by 'filter_profiles'
+    if not project_settings:
+        project_settings = get_project_settings(project_name, read_only=True)
+    publish_settings = project_settings["core"]["tools"]["publish"]
     if hero:
         default_template = DEFAULT_HERO_PUBLISH_TEMPLATE
-        profiles = get_hero_template_name_profiles(
-            project_name, project_settings, logger
-        )
+        profiles = publish_settings["hero_template_name_profiles"]
 
     else:
-        profiles = get_template_name_profiles(
-            project_name, project_settings, logger
-        )
+        profiles = publish_settings["template_name_profiles"]
         default_template = DEFAULT_PUBLISH_TEMPLATE
 
     profile = filter_profiles(profiles, filter_criteria, logger=logger)
@@ -214,6 +223,8 @@ def publish_plugins_discover(paths=None):
     Overridden function from `pyblish` module to be able to collect
         crashed files and reason of their crash.
 
+    Compiled code of unchanged files is reused from 'PluginModulesCache'.
+
     Arguments:
         paths (list, optional): Paths to discover plug-ins from.
             If no paths are provided, all paths are searched.
@@ -232,39 +243,28 @@ def publish_plugins_discover(paths=None):
     if not paths:
         paths = pyblish.plugin.plugin_paths()
 
+    modules_cache = get_plugin_modules_cache()
     for path in paths:
         path = os.path.normpath(path)
         if not os.path.isdir(path):
             continue
 
-        for fname in os.listdir(path):
-            if fname.startswith("_"):
-                continue
-
-            abspath = os.path.join(path, fname)
-
-            if not os.path.isfile(abspath):
-                continue
-
-            mod_name, mod_ext = os.path.splitext(fname)
-
-            if mod_ext != ".py":
-                continue
-
-            try:
-                module = import_filepath(abspath, mod_name)
-
-                # Store reference to original module, to avoid
-                # garbage collection from collecting it's global
-                # imports, such as `import os`.
-                sys.modules[abspath] = module
-
-            except Exception as err:
-                result.crashed_file_paths[abspath] = sys.exc_info()
-
-                log.debug("Skipped: \"%s\" (%s)", mod_name, err)
-                continue
-
+        modules, crashed = modules_cache.get_modules(
+            path, pyblish.api.Plugin
+        )
+        for abspath, exc_info in crashed:
+            result.crashed_file_paths[abspath] = exc_info
+            log.debug("Skipped: \"%s\" (%s)", abspath, exc_info[1])
+
+        for abspath, module in modules:
+            # Store reference to original module, to avoid
+            # garbage collection from collecting it's global
+            # imports, such as `import os`.
+            sys.modules[abspath] = module
+
+            modules_cache.store_module_plugins(
+                abspath, module, pyblish.api.Plugin
+            )
             for plugin in pyblish.plugin.plugins_from_module(module):
                 # Ignore base plugin classes
                 # NOTE 'pyblish.api.discover' does not ignore them!
@@ -297,6 +297,8 @@ def publish_plugins_discover(paths=None):
 
         plugins[plugin.__name__] = plugin
 
+    modules_cache.save_manifest()
+
     plugins = list(plugins.values())
     pyblish.plugin.sort(plugins)  # In-place
 
@@ -1,4 +1,7 @@
+import json
+import hashlib
 import platform
+import threading
 from collections import defaultdict
 
 import ayon_api
@@ -9,14 +12,16 @@ from ayon_core.lib import (
     format_file_size,
     collect_frames,
     get_datetime_data,
+    TemplateUnsolved,
 )
+from ayon_core.lib.events import QueuedEventSystem
 from ayon_core.pipeline import load, Anatomy
-from ayon_core.pipeline.load import get_representation_path_with_anatomy
 from ayon_core.pipeline.delivery import (
     get_format_dict,
     check_destination_path,
-    deliver_single_file,
+    get_delivery_file_path,
     get_representations_delivery_template_data,
+    DeliveryJob,
 )
 
 
@@ -74,7 +79,18 @@ class DeliveryOptionsDialog(QtWidgets.QDialog):
         self.anatomy = Anatomy(project_name)
         self._representations = None
         self.log = log
-        self.currently_uploaded = 0
+        # Delivery runs in thread and reports progress with events which
+        #   are processed in main thread
+        self._event_system = QueuedEventSystem(auto_execute=False)
+        self._event_system.add_callback(
+            "delivery.job.progress", self._on_job_progress
+        )
+        self._event_system.add_callback(
+            "delivery.finished", self._on_delivery_finished
+        )
+        self._deliver_thread = None
+        self._delivery_job = None
+        self._report_items = None
 
         self._set_representations(project_name, contexts)
 
@@ -107,6 +123,13 @@ class DeliveryOptionsDialog(QtWidgets.QDialog):
 
         root_line_edit = QtWidgets.QLineEdit()
 
+        overwrite_checkbox = QtWidgets.QCheckBox()
+        overwrite_checkbox.setChecked(False)
+        overwrite_checkbox.setToolTip(
+            "Replace existing files at destination which have different"
+            " size or are older than published files."
+        )
+
         repre_checkboxes_layout = QtWidgets.QFormLayout()
         repre_checkboxes_layout.setContentsMargins(10, 5, 5, 10)
 
@@ -132,6 +155,7 @@ class DeliveryOptionsDialog(QtWidgets.QDialog):
         input_layout.addRow("Renumber Frame", renumber_frame)
         input_layout.addRow("Renumber start frame", first_frame_start)
         input_layout.addRow("Root", root_line_edit)
+        input_layout.addRow("Overwrite outdated files", overwrite_checkbox)
         input_layout.addRow("Representations", repre_checkboxes_layout)
 
         btn_delivery = QtWidgets.QPushButton("Deliver")
@@ -162,6 +186,7 @@ class DeliveryOptionsDialog(QtWidgets.QDialog):
         self.first_frame_start = first_frame_start
         self.renumber_frame = renumber_frame
         self.root_line_edit = root_line_edit
+        self.overwrite_checkbox = overwrite_checkbox
         self.progress_bar = progress_bar
         self.text_area = text_area
         self.btn_delivery = btn_delivery
@@ -172,6 +197,12 @@ class DeliveryOptionsDialog(QtWidgets.QDialog):
         self._update_selected_label()
         self._update_template_value()
 
+        events_timer = QtCore.QTimer(self)
+        events_timer.setInterval(50)
+
+        self._events_timer = events_timer
+
+        events_timer.timeout.connect(self._on_events_timer)
         btn_delivery.clicked.connect(self.deliver)
         dropdown.currentIndexChanged.connect(self._update_template_value)
 
@@ -185,37 +216,107 @@ class DeliveryOptionsDialog(QtWidgets.QDialog):
             self.log.error(error_message.replace("\n", " "))
 
     def deliver(self):
-        """Main method to loop through all selected representations"""
+        """Deliver selected representations in thread."""
+        if self._deliver_thread is not None:
+            return
+
+        self.progress_bar.setValue(0)
         self.progress_bar.setVisible(True)
         self.btn_delivery.setEnabled(False)
-        QtWidgets.QApplication.processEvents()
 
+        selected_repres = self._get_selected_repres()
+        filtered_repres = [
+            repre
+            for repre in self._representations
+            if repre["name"] in selected_repres
+        ]
+        options = {
+            "template_name": self.dropdown.currentText(),
+            "root": self.root_line_edit.text(),
+            "renumber_frame": self.renumber_frame.isChecked(),
+            "frame_offset": self.first_frame_start.value(),
+            "overwrite": self.overwrite_checkbox.isChecked(),
+        }
+        thread = threading.Thread(
+            target=self._deliver_in_thread,
+            args=(filtered_repres, options)
+        )
+        self._deliver_thread = thread
+        self._events_timer.start()
+        thread.start()
+
+    def closeEvent(self, event):
+        if self._delivery_job is not None:
+            # Stop delivery, it can be resumed by delivering the same
+            #   representations with the same options
+            self._delivery_job.stop()
+        if self._deliver_thread is not None:
+            self._deliver_thread.join()
+            self._deliver_thread = None
+        self._events_timer.stop()
+        super(DeliveryOptionsDialog, self).closeEvent(event)
+
+    def _get_job_id(self, repres, options):
+        """Job id based on delivered representations and options.
+
+        Delivery of the same representations with the same options resumes
+        previous unfinished delivery.
+        """
+        job_data = {
+            "project_name": self.anatomy.project_name,
+            "repre_ids": sorted(repre["id"] for repre in repres),
+            "options": options,
+        }
+        return hashlib.sha1(
+            json.dumps(job_data, sort_keys=True).encode("utf-8")
+        ).hexdigest()
+
+    def _deliver_in_thread(self, repres, options):
         report_items = defaultdict(list)
+        try:
+            job_id = self._get_job_id(repres, options)
+            overwrite = options["overwrite"]
+            job = DeliveryJob.load(
+                job_id,
+                event_system=self._event_system,
+                overwrite=overwrite
+            )
+            if job is None:
+                job = DeliveryJob(
+                    job_id,
+                    event_system=self._event_system,
+                    overwrite=overwrite
+                )
+            self._delivery_job = job
+            self._prepare_delivery_job(job, repres, options, report_items)
+            report_items.update(job.run())
 
-        selected_repres = self._get_selected_repres()
+        except Exception:
+            self.log.error("Failed to deliver versions.", exc_info=True)
+            report_items["Delivery failed"].append(
+                "Unexpected error happened, check log for more information."
+            )
 
+        finally:
+            self._report_items = report_items
+            self._delivery_job = None
+            self._event_system.emit("delivery.finished", {}, "delivery")
+
+    def _prepare_delivery_job(self, job, repres, options, report_items):
+        """Add files of representations to delivery job."""
         datetime_data = get_datetime_data()
-        template_name = self.dropdown.currentText()
-        format_dict = get_format_dict(self.anatomy, self.root_line_edit.text())
-        renumber_frame = self.renumber_frame.isChecked()
-        frame_offset = self.first_frame_start.value()
-        filtered_repres = []
-        repre_ids = set()
-        for repre in self._representations:
-            if repre["name"] in selected_repres:
-                filtered_repres.append(repre)
-                repre_ids.add(repre["id"])
+        template_name = options["template_name"]
+        format_dict = get_format_dict(self.anatomy, options["root"])
+        renumber_frame = options["renumber_frame"]
+        frame_offset = options["frame_offset"]
 
         template_data_by_repre_id = (
             get_representations_delivery_template_data(
-                self.anatomy.project_name, repre_ids
+                self.anatomy.project_name,
+                {repre["id"] for repre in repres}
             )
         )
-        for repre in filtered_repres:
-            repre_path = get_representation_path_with_anatomy(
-                repre, self.anatomy
-            )
-
+        for repre in repres:
             template_data = template_data_by_repre_id[repre["id"]]
             new_report_items = check_destination_path(
                 repre["id"],
@@ -229,17 +330,6 @@ class DeliveryOptionsDialog(QtWidgets.QDialog):
             if new_report_items:
                 continue
 
-            args = [
-                repre_path,
-                repre,
-                self.anatomy,
-                template_name,
-                template_data,
-                format_dict,
-                report_items,
-                self.log
-            ]
-
             # TODO: This will currently incorrectly detect 'resources'
             #  that are published along with the publish, because those should
             #  not adhere to the template directly but are ingested in a
@@ -258,7 +348,6 @@ class DeliveryOptionsDialog(QtWidgets.QDialog):
                 first_frame = min(frames)
 
             for src_path, frame in sources_and_frames.items():
-                args[0] = src_path
                 # Renumber frames
                 if renumber_frame and frame is not None:
                     # Calculate offset between
@@ -288,11 +377,38 @@ class DeliveryOptionsDialog(QtWidgets.QDialog):
                             " formatting data."
                         )
                         template_data["frame"] = frame
-                new_report_items, uploaded = deliver_single_file(*args)
-                report_items.update(new_report_items)
-                self._update_progress(uploaded)
 
-        self.text_area.setText(self._format_report(report_items))
+                try:
+                    dst_path = get_delivery_file_path(
+                        self.anatomy, template_name, template_data, format_dict
+                    )
+                except TemplateUnsolved as exc:
+                    report_items["Failed to fill delivery template"].append(
+                        "{}<br>{}".format(src_path, exc)
+                    )
+                    continue
+                job.add_file(src_path, dst_path, repre["id"])
+
+    def _on_events_timer(self):
+        while self._event_system.count():
+            self._event_system.process_next_event()
+
+    def _on_job_progress(self, event):
+        processed = event["copied"] + event["skipped"] + event["failed"]
+        total = event["total"]
+        if total:
+            self.progress_bar.setValue(
+                int(processed / total * self.progress_bar.maximum())
+            )
+
+    def _on_delivery_finished(self):
+        self._events_timer.stop()
+        if self._deliver_thread is not None:
+            self._deliver_thread.join()
+            self._deliver_thread = None
+        self.progress_bar.setValue(self.progress_bar.maximum())
+        self.btn_delivery.setEnabled(bool(self._get_selected_repres()))
+        self.text_area.setText(self._format_report(self._report_items))
         self.text_area.setVisible(True)
 
     def _get_representation_names(self):
@@ -377,13 +493,6 @@ class DeliveryOptionsDialog(QtWidgets.QDialog):
             self.template_file_label.setText(template_value["file"])
             self.btn_delivery.setEnabled(bool(self._get_selected_repres()))
 
-    def _update_progress(self, uploaded):
-        """Update progress bar after each repre copied."""
-        self.currently_uploaded += uploaded
-
-        ratio = self.currently_uploaded / self.files_selected
-        self.progress_bar.setValue(ratio * self.progress_bar.maximum())
-
     def _format_report(self, report_items):
         """Format final result and error details as html."""
         msg = "Delivery finished"
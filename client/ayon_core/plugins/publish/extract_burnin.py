@@ -1,9 +1,11 @@
 import os
 import json
 import copy
+import functools
 import tempfile
 import platform
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 
 import clique
 import pyblish.api
@@ -76,6 +78,11 @@ class ExtractBurnin(publish.Extractor):
     # Configurable by Settings
     profiles = None
     options = None
+    # Render burnins in publish process instead of AYON launcher process
+    in_process = False
+    # Maximum number of burnins rendered at the same time
+    #   - number of CPUs is used if set to 0
+    max_parallel_burnins = 1
 
     def process(self, instance):
         if not self.profiles:
@@ -211,10 +218,11 @@ class ExtractBurnin(publish.Extractor):
         _burnin_data, _temp_data = self.prepare_basic_data(instance)
 
         anatomy = instance.context.data["anatomy"]
-        scriptpath = self.burnin_script_path()
 
-        # Args that will execute the script
-        executable_args = ["run", scriptpath]
+        # Burnins of all representations are rendered at once, so they can
+        #   be processed in parallel
+        burnin_jobs = []
+        processed_repres = []
         for repre, repre_burnin_defs in burnins_per_repres:
             # Create copy of `_burnin_data` and `_temp_data` for repre.
             burnin_data = copy.deepcopy(_burnin_data)
@@ -237,8 +245,16 @@ class ExtractBurnin(publish.Extractor):
                 src_filepaths = [os.path.join(src_repre_staging_dir, filename)]
 
             first_input_path = os.path.join(src_repre_staging_dir, filename)
-            # Determine if representation requires pre conversion for ffmpeg
-            do_convert = should_convert_for_ffmpeg(first_input_path)
+            # Review was not rendered by ExtractReview, it is rendered
+            #   together with burnins from review source
+            review_ffmpeg_args = repre.get("ffmpeg_deferred_args")
+            if review_ffmpeg_args:
+                do_convert = False
+            else:
+                # Determine if representation requires pre conversion for
+                #   ffmpeg
+                do_convert = should_convert_for_ffmpeg(first_input_path)
+
             # If result is None the requirement of conversion can't be
             #   determined
             if do_convert is None:
@@ -290,6 +306,7 @@ class ExtractBurnin(publish.Extractor):
             first_output = True
 
             files_to_delete = []
+            new_repres = []
 
             repre_burnin_options = copy.deepcopy(burnin_options)
             # Use fps from representation for output in options
@@ -304,6 +321,7 @@ class ExtractBurnin(publish.Extractor):
                 filename_suffix = burnin_def["name"]
                 new_repre = copy.deepcopy(repre)
                 new_repre["stagingDir"] = src_repre_staging_dir
+                new_repre.pop("ffmpeg_deferred_args", None)
 
                 # Keep "ftrackreview" tag only on first output
                 if first_output:
@@ -359,47 +377,36 @@ class ExtractBurnin(publish.Extractor):
                     "values": burnin_values,
                     "full_input_path": temp_data["full_input_paths"][0],
                     "first_frame": temp_data["first_frame"],
-                    "ffmpeg_cmd": new_repre.get("ffmpeg_cmd", "")
+                    "ffmpeg_cmd": new_repre.get("ffmpeg_cmd", ""),
+                    "review_ffmpeg_args": review_ffmpeg_args
                 }
 
                 self.log.debug(
                     "script_data: {}".format(json.dumps(script_data, indent=4))
                 )
-
-                # Dump data to string
-                dumped_script_data = json.dumps(script_data)
-
-                # Store dumped json to temporary file
-                temporary_json_file = tempfile.NamedTemporaryFile(
-                    mode="w", suffix=".json", delete=False
-                )
-                temporary_json_file.write(dumped_script_data)
-                temporary_json_file.close()
-                temporary_json_filepath = temporary_json_file.name.replace(
-                    "\\", "/"
-                )
-
-                # Prepare subprocess arguments
-                args = list(executable_args)
-                args.append(temporary_json_filepath)
-                args.append("--headless")
-                self.log.debug("Executing: {}".format(" ".join(args)))
-
-                # Run burnin script
-                process_kwargs = {
-                    "logger": self.log
-                }
-
-                run_ayon_launcher_process(*args, **process_kwargs)
-                # Remove the temporary json
-                os.remove(temporary_json_filepath)
+                # Make sure data are not changed by next burnin definitions
+                burnin_jobs.append(copy.deepcopy(script_data))
 
                 for filepath in temp_data["full_input_paths"]:
                     filepath = filepath.replace("\\", "/")
                     if filepath not in files_to_delete:
                         files_to_delete.append(filepath)
 
-                # Add new representation to instance
+                new_repres.append(new_repre)
+
+            processed_repres.append(
+                (repre, new_repres, src_repre_staging_dir, do_convert,
+                 files_to_delete)
+            )
+
+        self._render_burnins(burnin_jobs)
+
+        for (
+            repre, new_repres, src_repre_staging_dir, do_convert,
+            files_to_delete
+        ) in processed_repres:
+            # Add new representations to instance
+            for new_repre in new_repres:
                 instance.data["representations"].append(new_repre)
 
                 add_repre_files_for_cleanup(instance, new_repre)
@@ -424,6 +431,98 @@ class ExtractBurnin(publish.Extractor):
                     os.remove(filepath)
                     self.log.debug("Removed: \"{}\"".format(filepath))
 
+    def _render_burnins(self, burnin_jobs):
+        """Render burnins using data prepared for burnin script.
+
+        Burnins are rendered in AYON launcher process by default. With
+        'in_process' enabled is burnin script called directly so AYON
+        launcher start-up is not needed for each burnin.
+
+        Args:
+            burnin_jobs (list[dict[str, Any]]): Data for burnin script.
+
+        """
+        if not burnin_jobs:
+            return
+
+        render_func = self._render_burnin_in_launcher
+        if self.in_process:
+            try:
+                from ayon_core.scripts.otio_burnin import burnins_from_data
+
+                render_func = functools.partial(
+                    self._render_burnin_in_process, burnins_from_data
+                )
+            except ImportError:
+                self.log.warning(
+                    "Failed to import burnin script. Burnins will be"
+                    " rendered in AYON launcher process.",
+                    exc_info=True
+                )
+
+        max_workers = self.max_parallel_burnins
+        if max_workers < 1:
+            max_workers = os.cpu_count() or 1
+        max_workers = min(max_workers, len(burnin_jobs))
+
+        if max_workers < 2:
+            for script_data in burnin_jobs:
+                render_func(script_data)
+            return
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(render_func, script_data)
+                for script_data in burnin_jobs
+            ]
+            # Re-raise first error
+            for future in futures:
+                future.result()
+
+    def _render_burnin_in_process(self, burnins_from_data, script_data):
+        self.log.debug(
+            "Rendering burnin in process: {}".format(script_data["output"])
+        )
+        burnins_from_data(
+            script_data["input"],
+            script_data["output"],
+            script_data["burnin_data"],
+            options=script_data.get("options"),
+            burnin_values=script_data.get("values"),
+            full_input_path=script_data.get("full_input_path"),
+            first_frame=script_data.get("first_frame"),
+            source_ffmpeg_cmd=script_data.get("ffmpeg_cmd"),
+            review_ffmpeg_args=script_data.get("review_ffmpeg_args"),
+            logger=self.log
+        )
+
+    def _render_burnin_in_launcher(self, script_data):
+        # Store dumped json to temporary file
+        temporary_json_file = tempfile.NamedTemporaryFile(
+            mode="w", suffix=".json", delete=False
+        )
+        temporary_json_file.write(json.dumps(script_data))
+        temporary_json_file.close()
+        temporary_json_filepath = temporary_json_file.name.replace(
+            "\\", "/"
+        )
+
+        # Prepare subprocess arguments
+        args = [
+            "run",
+            self.burnin_script_path(),
+            temporary_json_filepath,
+            "--headless"
+        ]
+        self.log.debug("Executing: {}".format(" ".join(args)))
+
+        try:
+            # Run burnin script
+            run_ayon_launcher_process(*args, logger=self.log)
+        finally:
+            # Remove the temporary json
+            os.remove(temporary_json_filepath)
+
     def _get_burnin_options(self):
         """Get the burnin options from `ExtractBurnin` settings.
 
@@ -1,6 +1,7 @@
 import os
 import copy
-import clique
+import math
+
 import pyblish.api
 
 from ayon_core.pipeline import (
@@ -9,9 +10,12 @@ from ayon_core.pipeline import (
 )
 from ayon_core.lib import (
     is_oiio_supported,
+    run_subprocesses,
 )
 from ayon_core.lib.transcoding import (
-    convert_colorspace,
+    get_oiio_info_for_input,
+    get_oiio_frame_sequence_paths,
+    get_convert_colorspace_args,
 )
 
 from ayon_core.lib.profiles_filtering import filter_profiles
@@ -63,6 +67,9 @@ class ExtractOIIOTranscode(publish.Extractor):
     # Configurable by Settings
     profiles = None
     options = None
+    # Maximum number of oiiotool processes running at the same time
+    #   - number of CPUs is used if set to 0
+    max_parallel_processes = 0
 
     def process(self, instance):
         if not self.profiles:
@@ -155,9 +162,15 @@ class ExtractOIIOTranscode(publish.Extractor):
                 additional_command_args = (output_def["oiiotool_args"]
                                            ["additional_command_args"])
 
+                # Information about input are loaded only from first file
+                input_info = get_oiio_info_for_input(
+                    os.path.join(original_staging_dir, files_to_convert[0]),
+                    logger=self.log
+                )
                 files_to_convert = self._translate_to_sequence(
                     files_to_convert)
                 self.log.debug("Files to convert: {}".format(files_to_convert))
+                oiio_cmds = []
                 for file_name in files_to_convert:
                     self.log.debug("Transcoding file: `{}`".format(file_name))
                     input_path = os.path.join(original_staging_dir,
@@ -166,7 +179,7 @@ class ExtractOIIOTranscode(publish.Extractor):
                                                              new_staging_dir,
                                                              output_extension)
 
-                    convert_colorspace(
+                    oiio_cmds.append(get_convert_colorspace_args(
                         input_path,
                         output_path,
                         config_path,
@@ -175,8 +188,15 @@ class ExtractOIIOTranscode(publish.Extractor):
                         view,
                         display,
                         additional_command_args,
-                        self.log
-                    )
+                        input_info=input_info,
+                        logger=self.log
+                    ))
+
+                run_subprocesses(
+                    oiio_cmds,
+                    max_workers=self.max_parallel_processes,
+                    logger=self.log
+                )
 
                 # cleanup temporary transcoded files
                 for file_name in new_repre["files"]:
@@ -256,37 +276,24 @@ class ExtractOIIOTranscode(publish.Extractor):
         new_repre["files"] = renamed_files
 
     def _translate_to_sequence(self, files_to_convert):
-        """Returns original list or list with filename formatted in single
+        """Returns original list or list with filenames formatted in
         sequence format.
 
-        Uses clique to find frame sequence, in this case it merges all frames
-        into sequence format (FRAMESTART-FRAMEEND#) and returns it.
-        If sequence not found, it returns original list
+        Contiguous frames of sequence are merged into sequence format
+        (FRAMESTART-FRAMEEND@@@@) so they're converted with single oiiotool
+        process. Frame ranges are split to chunks so multiple processes
+        can be used. Files that are not part of a sequence are kept.
 
         Args:
             files_to_convert (list): list of file names
         Returns:
-            (list) of [file.1001-1010#.exr] or [fileA.exr, fileB.exr]
+            (list) of [file.1001-1010@@@@.exr] or [fileA.exr, fileB.exr]
         """
-        pattern = [clique.PATTERNS["frames"]]
-        collections, _ = clique.assemble(
-            files_to_convert, patterns=pattern,
-            assume_padded_when_ambiguous=True)
-
-        if collections:
-            if len(collections) > 1:
-                raise ValueError(
-                    "Too many collections {}".format(collections))
-
-            collection = collections[0]
-            frames = list(collection.indexes)
-            frame_str = "{}-{}#".format(frames[0], frames[-1])
-            file_name = "{}{}{}".format(collection.head, frame_str,
-                                        collection.tail)
-
-            files_to_convert = [file_name]
-
-        return files_to_convert
+        max_workers = self.max_parallel_processes or os.cpu_count() or 1
+        frames_per_chunk = int(math.ceil(len(files_to_convert) / max_workers))
+        return get_oiio_frame_sequence_paths(
+            files_to_convert, frames_per_chunk
+        )
 
     def _get_output_file_path(self, input_path, output_dir,
                               output_extension):
@@ -7,6 +7,8 @@ import pyblish.api
 from ayon_api import slugify_string, get_folders, get_tasks
 from ayon_api.entity_hub import EntityHub
 
+from ayon_core.lib import emit_event
+from ayon_core.pipeline.entities_cache import ENTITIES_CHANGED_TOPIC
 from ayon_core.pipeline.template_data import (
     get_folder_template_data,
     get_task_template_data,
@@ -195,6 +197,8 @@ class ExtractHierarchyToAYON(pyblish.api.ContextPlugin):
                 hierarchy_match_queue.append((child_entity, child_info))
 
         entity_hub.commit_changes()
+        # Cached entities of the project may be outdated
+        emit_event(ENTITIES_CHANGED_TOPIC, {"project_name": project_name})
 
     def _filter_hierarchy(self, context):
         """Filter hierarchy context by active folder names.
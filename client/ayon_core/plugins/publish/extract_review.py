@@ -14,7 +14,8 @@ from ayon_core.lib import (
     get_ffmpeg_tool_args,
     filter_profiles,
     path_to_subprocess_arg,
-    run_subprocess,
+    create_hard_link,
+    run_subprocesses,
 )
 from ayon_core.lib.transcoding import (
     IMAGE_EXTENSIONS,
@@ -103,6 +104,19 @@ class ExtractReview(pyblish.api.InstancePlugin):
 
     # Preset attributes
     profiles = []
+    # Maximum number of output definitions rendered at the same time
+    #   - number of CPUs is used if set to 0
+    max_parallel_outputs = 1
+    # How missing frames of sequence are filled
+    #   - "link" creates hardlinks (or symlinks) to nearest existing frame
+    #   - "copy" copies nearest existing frame
+    fill_gaps_mode = "link"
+    # Skip rendering of outputs tagged with "burnin" so ExtractBurnin can
+    #   render them together with burnins in one ffmpeg pass
+    fuse_burnins = False
+    # Extract frame for ExtractThumbnail as additional output of review
+    #   encoding, so source files don't have to be read again
+    thumbnail_from_review = False
 
     def process(self, instance):
         self.log.debug(str(instance.data["representations"]))
@@ -349,6 +363,118 @@ class ExtractReview(pyblish.api.InstancePlugin):
         output_definitions,
         layer_name
     ):
+        # Fill gaps in sequence only once for all output definitions
+        files_to_clean = []
+        if self.input_is_sequence(repre):
+            self.log.debug("Checking sequence to fill gaps in sequence..")
+            files_to_clean = self.fill_sequence_gaps(
+                files=repre["files"],
+                staging_dir=repre["stagingDir"],
+                start_frame=instance.data["frameStart"],
+                end_frame=instance.data["frameEnd"]
+            )
+
+        # Rendering can be deferred only if input files are available
+        #   after review extraction
+        fuse_burnins = (
+            not files_to_clean
+            and repre["stagingDir"] == src_repre_staging_dir
+            and self._can_fuse_burnins(instance)
+        )
+
+        try:
+            jobs = self._prepare_output_definitions_jobs(
+                instance,
+                repre,
+                src_repre_staging_dir,
+                output_definitions,
+                layer_name,
+                fuse_burnins
+            )
+
+            # Output definitions are independent, so they can be rendered
+            #   at the same time
+            subprcs_cmds = []
+            for new_repre, subprcs_cmd in jobs:
+                if "ffmpeg_deferred_args" in new_repre:
+                    self.log.debug((
+                        "Rendering of \"{}\" is deferred to be fused"
+                        " with burnins."
+                    ).format(new_repre["name"]))
+                    continue
+                self.log.debug("Executing: {}".format(subprcs_cmd))
+                subprcs_cmds.append(subprcs_cmd)
+
+            run_subprocesses(
+                subprcs_cmds,
+                max_workers=self.max_parallel_outputs,
+                logger=self.log,
+                shell=True
+            )
+
+        finally:
+            # delete files added to fill gaps
+            for f in files_to_clean:
+                os.unlink(f)
+
+        for new_repre, _ in jobs:
+            # adding representation
+            self.log.debug(
+                "Adding new representation: {}".format(new_repre)
+            )
+            instance.data["representations"].append(new_repre)
+
+            add_repre_files_for_cleanup(instance, new_repre)
+
+    def _can_fuse_burnins(self, instance):
+        """Check if burnins can be rendered together with review.
+
+        Rendering of review is deferred to ExtractBurnin, so it must be
+        enabled.
+
+        Args:
+            instance (pyblish.api.Instance): Processed instance.
+
+        Returns:
+            bool: Burnins can be fused with review.
+
+        """
+        if not self.fuse_burnins:
+            return False
+
+        project_settings = instance.context.data.get("project_settings")
+        if not project_settings:
+            return False
+        burnin_settings = (
+            project_settings["core"]["publish"].get("ExtractBurnin") or {}
+        )
+        return bool(
+            burnin_settings.get("enabled")
+            and burnin_settings.get("profiles")
+        )
+
+    def _prepare_output_definitions_jobs(
+        self,
+        instance,
+        repre,
+        src_repre_staging_dir,
+        output_definitions,
+        layer_name,
+        fuse_burnins=False
+    ):
+        """Prepare new representations and ffmpeg commands to render them.
+
+        Outputs tagged with "burnin" are not rendered if 'fuse_burnins' is
+        enabled. Their ffmpeg arguments are stored to representation under
+        "ffmpeg_deferred_args" key instead.
+
+        Returns:
+            list[tuple[dict, str]]: New representation and ffmpeg command
+                for each output definition.
+
+        """
+        jobs = []
+        add_review_thumbnail = self.thumbnail_from_review
         fill_data = copy.deepcopy(instance.data["anatomyData"])
         for _output_def in output_definitions:
             output_def = copy.deepcopy(_output_def)
@@ -399,15 +525,6 @@ class ExtractReview(pyblish.api.InstancePlugin):
             )
 
             temp_data = self.prepare_temp_data(instance, repre, output_def)
-            files_to_clean = []
-            if temp_data["input_is_sequence"]:
-                self.log.debug("Checking sequence to fill gaps in sequence..")
-                files_to_clean = self.fill_sequence_gaps(
-                    files=temp_data["origin_repre"]["files"],
-                    staging_dir=new_repre["stagingDir"],
-                    start_frame=temp_data["frame_start"],
-                    end_frame=temp_data["frame_end"]
-                )
 
             # create or update outputName
             output_name = new_repre.get("outputName", "")
@@ -453,20 +570,40 @@ class ExtractReview(pyblish.api.InstancePlugin):
                         ),
                         exc_info=True
                     )
-                    return
+                    break
                 raise NotImplementedError
 
-            subprcs_cmd = " ".join(ffmpeg_args)
-
-            # run subprocess
-            self.log.debug("Executing: {}".format(subprcs_cmd))
+            subprcs_cmd = run_cmd = " ".join(ffmpeg_args)
 
-            run_subprocess(subprcs_cmd, shell=True, logger=self.log)
+            if (
+                fuse_burnins
+                and "burnin" in new_repre["tags"]
+                and not temp_data["output_ext_is_image"]
+            ):
+                new_repre["ffmpeg_deferred_args"] = dict(
+                    temp_data["ffmpeg_args_parts"],
+                    probe_path=temp_data["full_input_path_single_file"],
+                    width=new_repre["resolutionWidth"],
+                    height=new_repre["resolutionHeight"],
+                    fps=temp_data["fps"],
+                )
 
-            # delete files added to fill gaps
-            if files_to_clean:
-                for f in files_to_clean:
-                    os.unlink(f)
+            elif add_review_thumbnail:
+                # Only one thumbnail is needed per representation
+                add_review_thumbnail = False
+                thumbnail_path = os.path.join(
+                    new_repre["stagingDir"],
+                    "{}_review_thumb.jpg".format(output_name)
+                )
+                thumbnail_args = self._thumbnail_output_args(
+                    instance, temp_data, thumbnail_path
+                )
+                run_cmd = " ".join([subprcs_cmd] + thumbnail_args)
+                instance.context.data["cleanupFullPaths"].append(
+                    thumbnail_path
+                )
+                repre["reviewThumbnail"] = thumbnail_path
+                new_repre["reviewThumbnail"] = thumbnail_path
 
             new_repre.update({
                 "fps": temp_data["fps"],
@@ -483,13 +620,47 @@ class ExtractReview(pyblish.api.InstancePlugin):
             if "clean_name" in new_repre.get("tags", []):
                 new_repre.pop("outputName")
 
-            # adding representation
-            self.log.debug(
-                "Adding new representation: {}".format(new_repre)
-            )
-            instance.data["representations"].append(new_repre)
+            jobs.append((new_repre, run_cmd))
+        return jobs
 
-            add_repre_files_for_cleanup(instance, new_repre)
+    def _thumbnail_output_args(self, instance, temp_data, thumbnail_path):
+        """Ffmpeg arguments of additional output with frame for thumbnail.
+
+        Frame is picked the same way as in ExtractThumbnail and review video
+        filters are applied to it.
+
+        Args:
+            instance (pyblish.api.Instance): Processed instance.
+            temp_data (dict): Data of processed output definition.
+            thumbnail_path (str): Path to thumbnail image.
+
+        Returns:
+            list[str]: Ffmpeg output arguments.
+        """
+        thumbnail_settings = (
+            instance.context.data["project_settings"]["core"]["publish"]
+            .get("ExtractThumbnail") or {}
+        )
+        duration_split = thumbnail_settings.get("duration_split", 0.5)
+
+        frames_len = (
+            temp_data["output_frame_end"]
+            - temp_data["output_frame_start"]
+            + 1
+        )
+        frame_index = min(
+            max(int(frames_len * duration_split), 0),
+            max(frames_len - 1, 0)
+        )
+
+        video_filters = list(temp_data["ffmpeg_args_parts"]["video_filters"])
+        video_filters.append("select=eq(n\\,{})".format(frame_index))
+        return [
+            "-filter:v", "\"{}\"".format(",".join(video_filters)),
+            "-frames:v", "1",
+            "-update", "1",
+            "-y", path_to_subprocess_arg(thumbnail_path)
+        ]
 
     def input_is_sequence(self, repre):
         """Deduce from representation data if input is sequence."""
@@ -791,6 +962,18 @@ class ExtractReview(pyblish.api.InstancePlugin):
                 for arg in reversed(color_args):
                     ffmpeg_video_filters.insert(0, arg)
 
+        # Keep arguments without output path so output can be rendered
+        #   later with additional filters
+        ffmpeg_output_args = self._separate_filters_from_output_args(
+            ffmpeg_output_args, ffmpeg_video_filters, ffmpeg_audio_filters
+        )
+        temp_data["ffmpeg_args_parts"] = {
+            "input_args": list(ffmpeg_input_args),
+            "video_filters": list(ffmpeg_video_filters),
+            "audio_filters": list(ffmpeg_audio_filters),
+            "output_args": list(ffmpeg_output_args),
+        }
+
         # Add argument to override output file
         ffmpeg_output_args.append("-y")
 
@@ -847,22 +1030,9 @@ class ExtractReview(pyblish.api.InstancePlugin):
         Returns:
             list: Containing all arguments ready to run in subprocess.
         """
-        output_args = self.split_ffmpeg_args(output_args)
-
-        video_args_dentifiers = ["-vf", "-filter:v"]
-        audio_args_dentifiers = ["-af", "-filter:a"]
-        for arg in tuple(output_args):
-            for identifier in video_args_dentifiers:
-                if arg.startswith("{} ".format(identifier)):
-                    output_args.remove(arg)
-                    arg = arg.replace(identifier, "").strip()
-                    video_filters.append(arg)
-
-            for identifier in audio_args_dentifiers:
-                if arg.startswith("{} ".format(identifier)):
-                    output_args.remove(arg)
-                    arg = arg.replace(identifier, "").strip()
-                    audio_filters.append(arg)
+        output_args = self._separate_filters_from_output_args(
+            output_args, video_filters, audio_filters
+        )
 
         all_args = [
             subprocess.list2cmdline(get_ffmpeg_tool_args("ffmpeg"))
@@ -880,13 +1050,47 @@ class ExtractReview(pyblish.api.InstancePlugin):
 
         return all_args
 
+    def _separate_filters_from_output_args(
+        self, output_args, video_filters, audio_filters
+    ):
+        """Move filters from output arguments to filters they belong to.
+
+        Args:
+            output_args (list): Ffmpeg output arguments.
+            video_filters (list): Video filters where found video filters
+                are added.
+            audio_filters (list): Audio filters where found audio filters
+                are added.
+
+        Returns:
+            list: Output arguments without filters.
+        """
+        output_args = self.split_ffmpeg_args(output_args)
+
+        video_args_dentifiers = ["-vf", "-filter:v"]
+        audio_args_dentifiers = ["-af", "-filter:a"]
+        for arg in tuple(output_args):
+            for identifier in video_args_dentifiers:
+                if arg.startswith("{} ".format(identifier)):
+                    output_args.remove(arg)
+                    arg = arg.replace(identifier, "").strip()
+                    video_filters.append(arg)
+
+            for identifier in audio_args_dentifiers:
+                if arg.startswith("{} ".format(identifier)):
+                    output_args.remove(arg)
+                    arg = arg.replace(identifier, "").strip()
+                    audio_filters.append(arg)
+        return output_args
+
     def fill_sequence_gaps(self, files, staging_dir, start_frame, end_frame):
         # type: (list, str, int, int) -> list
         """Fill missing files in sequence by duplicating existing ones.
 
-        This will take nearest frame file and copy it with so as to fill
-        gaps in sequence. Last existing file there is is used to for the
-        hole ahead.
+        This will take nearest frame file and link or copy it with so as to
+        fill gaps in sequence. Last existing file there is is used to for the
+        hole ahead. Links are used when 'fill_gaps_mode' is set to "link",
+        so no data are duplicated.
 
         Args:
             files (list): List of representation files.
@@ -930,11 +1134,41 @@ class ExtractReview(pyblish.api.InstancePlugin):
                 raise KnownPublishError(
                     "Missing previously detected file: {}".format(src_fpath))
 
-            speedcopy.copyfile(src_fpath, hole_fpath)
+            self._fill_gap_file(src_fpath, hole_fpath)
             added_files.append(hole_fpath)
 
         return added_files
 
+    def _fill_gap_file(self, src_fpath, hole_fpath):
+        """Create file filling a gap in sequence.
+
+        Hardlink is created in "link" mode, symlink is used if hardlink
+        can't be created. File is copied if linking is not possible at all.
+
+        Args:
+            src_fpath (str): Path to existing frame.
+            hole_fpath (str): Path to missing frame.
+
+        """
+        if self.fill_gaps_mode == "link":
+            try:
+                create_hard_link(src_fpath, hole_fpath)
+                return
+            except OSError:
+                pass
+
+            try:
+                os.symlink(src_fpath, hole_fpath)
+                return
+            except (OSError, NotImplementedError):
+                self.log.debug(
+                    "Failed to link '{}' to '{}'. Copying file.".format(
+                        src_fpath, hole_fpath
+                    )
+                )
+
+        speedcopy.copyfile(src_fpath, hole_fpath)
+
     def input_output_paths(self, new_repre, output_def, temp_data):
         """Deduce input nad output file paths based on entered data.
 
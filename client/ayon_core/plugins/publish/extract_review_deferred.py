@@ -0,0 +1,26 @@
+import pyblish.api
+
+from ayon_core.lib import run_subprocess
+
+
+class ExtractReviewDeferred(pyblish.api.InstancePlugin):
+    """Render review outputs which were not fused with burnins.
+
+    ExtractReview does not render outputs tagged with "burnin" when burnins
+    should be fused with review, so ExtractBurnin can render them in one
+    ffmpeg pass. Outputs which did not get any burnin are rendered here.
+    """
+
+    label = "Extract Deferred Review"
+    # Must be processed after ExtractBurnin and before ExtractReviewSlate
+    order = pyblish.api.ExtractorOrder + 0.0305
+    families = ["review"]
+
+    def process(self, instance):
+        for repre in instance.data.get("representations") or []:
+            if repre.pop("ffmpeg_deferred_args", None) is None:
+                continue
+
+            subprcs_cmd = repre["ffmpeg_cmd"]
+            self.log.debug("Executing: {}".format(subprcs_cmd))
+            run_subprocess(subprcs_cmd, shell=True, logger=self.log)
@@ -166,7 +166,20 @@ class ExtractThumbnail(pyblish.api.InstancePlugin):
         for repre in filtered_repres:
             repre_files = repre["files"]
             src_staging = os.path.normpath(repre["stagingDir"])
-            if not isinstance(repre_files, (list, tuple)):
+            colorspace_data = repre.get("colorspaceData")
+            review_thumbnail = repre.get("reviewThumbnail")
+            if review_thumbnail and os.path.exists(review_thumbnail):
+                # Frame was extracted by ExtractReview during review encoding
+                #   and has applied review filters
+                self.log.debug(
+                    "Using frame extracted during review encoding: {}".format(
+                        review_thumbnail
+                    )
+                )
+                src_staging, input_file = os.path.split(review_thumbnail)
+                colorspace_data = None
+
+            elif not isinstance(repre_files, (list, tuple)):
                 # convert any video file to frame so oiio doesn't need to
                 # read video file (it is slow) and also we are having control
                 # over which frame is used for thumbnail
@@ -201,7 +214,6 @@ class ExtractThumbnail(pyblish.api.InstancePlugin):
             filename = os.path.splitext(input_file)[0]
             jpeg_file = filename + "_thumb.jpg"
             full_output_path = os.path.join(dst_staging, jpeg_file)
-            colorspace_data = repre.get("colorspaceData")
 
             # only use OIIO if it is supported and representation has
             # colorspace data
@@ -19,7 +19,7 @@ from ayon_api.operations import (
 )
 from ayon_api.utils import create_entity_id
 
-from ayon_core.lib import source_hash
+from ayon_core.lib import format_file_size, source_hash, stat_files
 from ayon_core.lib.file_transaction import (
     FileTransaction,
     DuplicateDestinationError
@@ -129,6 +129,23 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
         "family",  # product[type]
     ]
 
+    # Transfer mode of representation files
+    # - 'copy', 'hardlink', 'reflink' or 'auto'
+    # - links are created only if staging and publish directories are on
+    #   the same volume, files are copied otherwise
+    transfer_mode = "copy"
+    # Leave existing published files with identical content untouched
+    #   when publishing to existing version
+    skip_identical_files = False
+    # Leave existing published files with same size and modification time
+    #   untouched when publishing to existing version
+    incremental_transfers = False
+    # Parallel file transfers - files are transferred serially if
+    #   'transfer_max_workers' is lower than 2
+    transfer_max_workers = 0
+    # Limit concurrent file operations per destination volume (0 = no limit)
+    transfer_max_workers_per_volume = 0
+
     def process(self, instance):
         # Instance should be integrated on a farm
         if instance.data.get("farm"):
@@ -151,9 +168,15 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
             ).format(instance.data["productType"]))
             return
 
-        file_transactions = FileTransaction(log=self.log,
-                                            # Enforce unique transfers
-                                            allow_queue_replacements=False)
+        file_transactions = FileTransaction(
+            log=self.log,
+            # Enforce unique transfers
+            allow_queue_replacements=False,
+            max_workers=self.transfer_max_workers,
+            max_workers_per_volume=self.transfer_max_workers_per_volume,
+            skip_identical=self.skip_identical_files,
+            incremental=self.incremental_transfers,
+        )
         try:
             self.register(instance, file_transactions, filtered_repres)
         except DuplicateDestinationError as exc:
@@ -218,6 +241,7 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
             )
 
         template_name = self.get_template_name(instance)
+        transfer_mode = self.get_transfer_mode()
 
         op_session = OperationsSession()
         product_entity = self.prepare_product(
@@ -252,8 +276,9 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
                 instance)
 
             for src, dst in prepared["transfers"]:
-                # todo: add support for hardlink transfers
-                file_transactions.add(src, dst)
+                file_transactions.add(
+                    src, dst, mode=transfer_mode, fallback_to_copy=True
+                )
 
             prepared_representations.append(prepared)
 
@@ -292,13 +317,29 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
             "Backed up existing files: {}".format(file_transactions.backups))
         self.log.debug(
             "Transferred files: {}".format(file_transactions.transferred))
+        if file_transactions.skipped:
+            self.log.debug(
+                "Skipped unchanged files ({}): {}".format(
+                    format_file_size(file_transactions.skipped_size),
+                    file_transactions.skipped))
         self.log.debug("Retrieving Representation Site Sync information ...")
 
+        # Stat all published files at once, files of a sequence share
+        #   directory which can be listed instead of stat per file
+        all_destinations = set(resource_destinations)
+        for prepared in prepared_representations:
+            all_destinations.update(
+                dst for _, dst in prepared["transfers"]
+            )
+        stat_by_path = stat_files(
+            all_destinations, max_workers=self.transfer_max_workers
+        )
+
         # Compute the resource file infos once (files belonging to the
         # version instance instead of an individual representation) so
         # we can reuse those file infos per representation
         resource_file_infos = self.get_files_info(
-            resource_destinations, anatomy
+            resource_destinations, anatomy, stat_by_path
         )
 
         # Finalize the representations now the published files are integrated
@@ -310,7 +351,7 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
             transfers = prepared["transfers"]
             destinations = [dst for src, dst in transfers]
             repre_files = self.get_files_info(
-                destinations, anatomy
+                destinations, anatomy, stat_by_path
             )
             # Add the version resource file infos to each representation
             repre_files += resource_file_infos
@@ -906,6 +947,27 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
 
         return version_data
 
+    def get_transfer_mode(self):
+        """Return file transaction mode used for representation files.
+
+        Returns:
+            int: File transaction mode based on 'transfer_mode' attribute.
+
+        """
+        modes_by_name = {
+            "copy": FileTransaction.MODE_COPY,
+            "hardlink": FileTransaction.MODE_HARDLINK,
+            "reflink": FileTransaction.MODE_REFLINK,
+            "auto": FileTransaction.MODE_AUTO,
+        }
+        mode = modes_by_name.get(self.transfer_mode)
+        if mode is None:
+            self.log.warning(
+                "Unknown transfer mode '{}'. Using 'copy'.".format(
+                    self.transfer_mode))
+            mode = FileTransaction.MODE_COPY
+        return mode
+
     def get_template_name(self, instance):
         """Return anatomy template name to use for integration"""
 
@@ -956,40 +1018,62 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
             ).format(path))
         return path
 
-    def get_files_info(self, filepaths, anatomy):
+    def get_files_info(self, filepaths, anatomy, stat_by_path=None):
         """Prepare 'files' info portion for representations.
 
         Arguments:
             filepaths (Iterable[str]): List of transferred file paths.
             anatomy (Anatomy): Project anatomy.
+            stat_by_path (Optional[dict[str, os.stat_result]]): Already
+                collected stat of files by normalized path. Missing files
+                are collected.
 
         Returns:
             list[dict[str, Any]]: Representation 'files' information.
 
         """
+        filepaths = list(filepaths)
+        if stat_by_path is None:
+            stat_by_path = {}
+
+        missing_paths = [
+            filepath
+            for filepath in filepaths
+            if os.path.normpath(filepath) not in stat_by_path
+        ]
+        if missing_paths:
+            stat_by_path = dict(stat_by_path)
+            stat_by_path.update(stat_files(missing_paths))
+
         file_infos = []
         for filepath in filepaths:
-            file_info = self.prepare_file_info(filepath, anatomy)
+            file_info = self.prepare_file_info(
+                filepath, anatomy, stat_by_path[os.path.normpath(filepath)]
+            )
             file_infos.append(file_info)
         return file_infos
 
-    def prepare_file_info(self, path, anatomy):
+    def prepare_file_info(self, path, anatomy, stat_result=None):
         """ Prepare information for one file (asset or resource)
 
         Arguments:
             path (str): Destination url of published file.
             anatomy (Anatomy): Project anatomy part from instance.
+            stat_result (Optional[os.stat_result]): Already collected stat
+                of the file.
 
         Returns:
             dict[str, Any]: Representation file info dictionary.
 
         """
+        if stat_result is None:
+            stat_result = os.stat(path)
         return {
             "id": create_entity_id(),
             "name": os.path.basename(path),
             "path": self.get_rootless_path(anatomy, path),
-            "size": os.path.getsize(path),
-            "hash": source_hash(path),
+            "size": stat_result.st_size,
+            "hash": source_hash(path, stat_result=stat_result),
             "hash_type": "op3",
         }
 
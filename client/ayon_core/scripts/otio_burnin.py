@@ -1,14 +1,17 @@
 import os
 import sys
+import copy
 import subprocess
-import platform
 import json
 import tempfile
+import logging
+from fractions import Fraction
 from string import Formatter
 
 import opentimelineio_contrib.adapters.ffmpeg_burnins as ffmpeg_burnins
 from ayon_core.lib import (
     get_ffmpeg_tool_args,
+    get_ffprobe_data,
     get_ffmpeg_codec_args,
     get_ffmpeg_format_args,
     convert_ffprobe_fps_value,
@@ -36,33 +39,82 @@ TIMECODE_KEY = "{timecode}"
 SOURCE_TIMECODE_KEY = "{source_timecode}"
 
 
+_USE_SHELL = None
+
+
+def _use_shell():
+    """Check if ffmpeg can be launched using shell.
+
+    Result is cached so the check is not done for each rendered burnin
+    when burnins are rendered in one process.
+    """
+    global _USE_SHELL
+    if _USE_SHELL is None:
+        use_shell = True
+        try:
+            test_proc = subprocess.Popen(
+                f"{FFMPEG_EXE_COMMAND} --help", shell=True
+            )
+            test_proc.wait()
+        except BaseException:
+            use_shell = False
+        _USE_SHELL = use_shell
+    return _USE_SHELL
+
+
 def _get_ffprobe_data(source):
     """Reimplemented from otio burnins to be able use full path to ffprobe
+
+    Uses cached 'get_ffprobe_data' so the source is not probed again if
+    was already probed in this process (or in other process if media
+    information cache directory is set).
+
     :param str source: source media file
     :rtype: [{}, ...]
     """
-    command = get_ffmpeg_tool_args(
-        "ffprobe",
-        "-v", "quiet",
-        "-print_format", "json",
-        "-show_format",
-        "-show_streams",
-        source
+    data = get_ffprobe_data(source)
+    if "error" in data or "streams" not in data:
+        raise RuntimeError("Failed to run ffprobe on: %s" % source)
+    return data
+
+
+def _get_review_ffprobe_data(review_ffmpeg_args):
+    """Prepare ffprobe data of review which was not rendered yet.
+
+    Data are based on review source with resolution and frame rate
+    of review output.
+
+    Args:
+        review_ffmpeg_args (dict[str, Any]): Arguments of deferred review.
+
+    Returns:
+        dict[str, Any]: Ffprobe data.
+    """
+    ffprobe_data = copy.deepcopy(
+        _get_ffprobe_data(review_ffmpeg_args["probe_path"])
     )
-    kwargs = {
-        "stdout": subprocess.PIPE,
-    }
-    if platform.system().lower() == "windows":
-        kwargs["creationflags"] = (
-            subprocess.CREATE_NEW_PROCESS_GROUP
-            | getattr(subprocess, "DETACHED_PROCESS", 0)
-            | getattr(subprocess, "CREATE_NO_WINDOW", 0)
-        )
-    proc = subprocess.Popen(command, **kwargs)
-    out = proc.communicate()[0]
-    if proc.returncode != 0:
-        raise RuntimeError("Failed to run: %s" % command)
-    return json.loads(out)
+    fps = Fraction(review_ffmpeg_args["fps"]).limit_denominator(1001)
+    for stream in ffprobe_data["streams"]:
+        if stream.get("codec_type") == "video":
+            stream["width"] = review_ffmpeg_args["width"]
+            stream["height"] = review_ffmpeg_args["height"]
+            stream["r_frame_rate"] = "{}/{}".format(
+                fps.numerator, fps.denominator
+            )
+            break
+    return ffprobe_data
+
+
+def _log_message(logger, message, level=logging.INFO):
+    """Log message with logger, or print it when logger is not set.
+
+    Output of burnin script running in separated process is printed, so
+    it is captured by process which started the script.
+    """
+    if logger is None:
+        print(message)
+    else:
+        logger.log(level, message)
 
 
 class ModifiedBurnins(ffmpeg_burnins.Burnins):
@@ -122,7 +174,12 @@ class ModifiedBurnins(ffmpeg_burnins.Burnins):
     }
 
     def __init__(
-        self, source, ffprobe_data=None, options_init=None, first_frame=None
+        self,
+        source,
+        ffprobe_data=None,
+        options_init=None,
+        first_frame=None,
+        logger=None,
     ):
         if not ffprobe_data:
             ffprobe_data = _get_ffprobe_data(source)
@@ -138,6 +195,7 @@ class ModifiedBurnins(ffmpeg_burnins.Burnins):
 
         self.ffprobe_data = ffprobe_data
         self.first_frame = first_frame
+        self.logger = logger
         self.input_args = []
         self.cleanup_paths = []
 
@@ -422,13 +480,17 @@ class ModifiedBurnins(ffmpeg_burnins.Burnins):
             }
             self.filters['drawtext'][-1] += ':%s' % box
 
-    def command(self, output=None, args=None, overwrite=False):
+    def command(
+        self, output=None, args=None, overwrite=False, review_ffmpeg_args=None
+    ):
         """
         Generate the entire FFMPEG command.
 
         :param str output: output file
         :param str args: additional FFMPEG arguments
         :param bool overwrite: overwrite the output if it exists
+        :param dict review_ffmpeg_args: arguments of review which was not
+            rendered yet, burnins are added to the review command
         :returns: completed command
         :rtype: str
         """
@@ -438,14 +500,34 @@ class ModifiedBurnins(ffmpeg_burnins.Burnins):
 
         filters = ""
         filter_string = self.filter_string
+        if review_ffmpeg_args:
+            # Burnins are applied after review filters
+            filter_string = ",".join(
+                review_ffmpeg_args["video_filters"]
+                + ([filter_string] if filter_string else [])
+            )
+
         if filter_string:
             with tempfile.NamedTemporaryFile(mode="w", delete=False) as temp:
                 temp.write(filter_string)
                 filters_path = temp.name
             filters = '-filter_script:v "{}"'.format(filters_path)
-            print("Filters:", filter_string)
+            _log_message(self.logger, "Filters: {}".format(filter_string))
             self.cleanup_paths.append(filters_path)
 
+        if review_ffmpeg_args:
+            command_args = [FFMPEG_EXE_COMMAND]
+            command_args.extend(review_ffmpeg_args["input_args"])
+            if filters:
+                command_args.append(filters)
+            if review_ffmpeg_args["audio_filters"]:
+                command_args.append('-filter:a "{}"'.format(
+                    ",".join(review_ffmpeg_args["audio_filters"])
+                ))
+            command_args.extend(review_ffmpeg_args["output_args"])
+            command_args.append(output)
+            return " ".join(command_args)
+
         if self.first_frame is not None:
             start_number_arg = "-start_number {}".format(self.first_frame)
             self.input_args.append(start_number_arg)
@@ -467,13 +549,22 @@ class ModifiedBurnins(ffmpeg_burnins.Burnins):
             'filters': filters
         }).strip()
 
-    def render(self, output, args=None, overwrite=False, **kwargs):
+    def render(
+        self,
+        output,
+        args=None,
+        overwrite=False,
+        review_ffmpeg_args=None,
+        **kwargs
+    ):
         """
         Render the media to a specified destination.
 
         :param str output: output file
         :param str args: additional FFMPEG arguments
         :param bool overwrite: overwrite the output if it exists
+        :param dict review_ffmpeg_args: arguments of review which was not
+            rendered yet, burnins are added to the review command
         """
         if not overwrite and os.path.exists(output):
             raise RuntimeError("Destination '%s' exists, please "
@@ -484,38 +575,33 @@ class ModifiedBurnins(ffmpeg_burnins.Burnins):
         command = self.command(
             output=output,
             args=args,
-            overwrite=overwrite
+            overwrite=overwrite,
+            review_ffmpeg_args=review_ffmpeg_args
         )
-        print("Launching command: {}".format(command))
-
-        use_shell = True
-        try:
-            test_proc = subprocess.Popen(
-                f"{FFMPEG_EXE_COMMAND} --help", shell=True
-            )
-            test_proc.wait()
-        except BaseException:
-            use_shell = False
+        _log_message(self.logger, "Launching command: {}".format(command))
 
         kwargs = {
             "stdout": subprocess.PIPE,
             "stderr": subprocess.PIPE,
-            "shell": use_shell,
+            "shell": _use_shell(),
         }
         proc = subprocess.Popen(command, **kwargs)
 
         _stdout, _stderr = proc.communicate()
         if _stdout:
-            print(_stdout.decode("utf-8", errors="backslashreplace"))
+            _stdout = _stdout.decode("utf-8", errors="backslashreplace")
+            _log_message(self.logger, _stdout, logging.DEBUG)
 
         # This will probably never happen as ffmpeg use stdout
         if _stderr:
-            print(_stderr.decode("utf-8", errors="backslashreplace"))
+            _stderr = _stderr.decode("utf-8", errors="backslashreplace")
+            _log_message(self.logger, _stderr)
 
         if proc.returncode != 0:
-            raise RuntimeError(
-                "Failed to render '{}': {}'".format(output, command)
-            )
+            exc_msg = "Failed to render '{}': {}'".format(output, command)
+            if _stderr:
+                exc_msg += "\n\nError:\n{}".format(_stderr)
+            raise RuntimeError(exc_msg)
         if is_sequence:
             output = output % kwargs.get("duration")
 
@@ -596,7 +682,8 @@ def prepare_fill_values(burnin_template, data):
 def burnins_from_data(
     input_path, output_path, data,
     codec_data=None, options=None, burnin_values=None, overwrite=True,
-    full_input_path=None, first_frame=None, source_ffmpeg_cmd=None
+    full_input_path=None, first_frame=None, source_ffmpeg_cmd=None,
+    review_ffmpeg_args=None, logger=None
 ):
     """This method adds burnins to video/image file based on presets setting.
 
@@ -612,6 +699,10 @@ def burnins_from_data(
         burnin_values (dict): Contain positioned values.
         overwrite (bool): Output will be overwritten if already exists,
             True by default.
+        review_ffmpeg_args (dict): Arguments of review which was not rendered
+            yet. Review is rendered with burnins in one ffmpeg process.
+        logger (logging.Logger): Logger used for output of ffmpeg. Output
+            is printed if not passed.
 
     Presets must be set separately. Should be dict with 2 keys:
     - "options" - sets look of burnins - colors, opacity,...
@@ -656,10 +747,14 @@ def burnins_from_data(
     }
     """
     ffprobe_data = None
-    if full_input_path:
+    if review_ffmpeg_args:
+        ffprobe_data = _get_review_ffprobe_data(review_ffmpeg_args)
+    elif full_input_path:
         ffprobe_data = _get_ffprobe_data(full_input_path)
 
-    burnin = ModifiedBurnins(input_path, ffprobe_data, options, first_frame)
+    burnin = ModifiedBurnins(
+        input_path, ffprobe_data, options, first_frame, logger
+    )
 
     frame_start = data.get("frame_start")
     frame_end = data.get("frame_end")
@@ -739,7 +834,8 @@ def burnins_from_data(
         # Replace with missing key value if frame_start_tc is not set
         if frame_start_tc is None and has_timecode:
             has_timecode = False
-            print(
+            _log_message(
+                logger,
                 "`frame_start` and `frame_start_tc`"
                 " are not set in entered data."
             )
@@ -748,7 +844,9 @@ def burnins_from_data(
         has_source_timecode = SOURCE_TIMECODE_KEY in value
         if source_timecode is None and has_source_timecode:
             has_source_timecode = False
-            print("Source does not have set timecode value.")
+            _log_message(
+                logger, "Source does not have set timecode value."
+            )
             value = value.replace(SOURCE_TIMECODE_KEY, MISSING_KEY_VALUE)
 
         # Failsafe for missing keys.
@@ -795,7 +893,11 @@ def burnins_from_data(
         burnin.add_text(text, align, frame_start, frame_end)
 
     ffmpeg_args = []
-    if codec_data:
+    if review_ffmpeg_args:
+        # Codec arguments are already in review output arguments
+        pass
+
+    elif codec_data:
         # Use codec definition from method arguments
         ffmpeg_args = codec_data
         ffmpeg_args.append("-g 1")
@@ -821,7 +923,11 @@ def burnins_from_data(
     # Use group one (same as `-intra` argument, which is deprecated)
     ffmpeg_args_str = " ".join(ffmpeg_args)
     burnin.render(
-        output_path, args=ffmpeg_args_str, overwrite=overwrite, **data
+        output_path,
+        args=ffmpeg_args_str,
+        overwrite=overwrite,
+        review_ffmpeg_args=review_ffmpeg_args,
+        **data
     )
     for path in clean_up_paths:
         os.remove(path)
@@ -842,6 +948,7 @@ if __name__ == "__main__":
         burnin_values=in_data.get("values"),
         full_input_path=in_data.get("full_input_path"),
         first_frame=in_data.get("first_frame"),
-        source_ffmpeg_cmd=in_data.get("ffmpeg_cmd")
+        source_ffmpeg_cmd=in_data.get("ffmpeg_cmd"),
+        review_ffmpeg_args=in_data.get("review_ffmpeg_args")
     )
     print("* Burnin script has finished")
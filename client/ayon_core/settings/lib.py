@@ -1,33 +1,69 @@
 import os
 import json
+import types
+import hashlib
 import logging
 import collections
 import copy
 import time
+from datetime import datetime, timedelta
 
 import ayon_api
 
 log = logging.getLogger(__name__)
 
 
+def _freeze_value(value):
+    """Convert value to read-only structure.
+
+    Dictionaries are converted to 'MappingProxyType' and lists to tuples.
+
+    Args:
+        value (Any): Value to freeze.
+
+    Returns:
+        Any: Read-only value.
+
+    """
+    if isinstance(value, dict):
+        return types.MappingProxyType({
+            key: _freeze_value(sub_value)
+            for key, sub_value in value.items()
+        })
+    if isinstance(value, list):
+        return tuple(_freeze_value(item) for item in value)
+    return value
+
+
 class CacheItem:
     lifetime = 10
 
     def __init__(self, value, outdate_time=None):
         self._value = value
+        self._frozen_value = None
         if outdate_time is None:
             outdate_time = time.time() + self.lifetime
         self._outdate_time = outdate_time
+        self.cached_at = None
 
     @classmethod
     def create_outdated(cls):
         return cls({}, 0)
 
-    def get_value(self):
-        return copy.deepcopy(self._value)
+    def get_value(self, read_only=False):
+        if not read_only:
+            return copy.deepcopy(self._value)
+        if self._frozen_value is None:
+            self._frozen_value = _freeze_value(self._value)
+        return self._frozen_value
 
-    def update_value(self, value):
+    def update_value(self, value, cached_at=None):
         self._value = value
+        self._frozen_value = None
+        self.cached_at = cached_at
+        self.extend_lifetime()
+
+    def extend_lifetime(self):
         self._outdate_time = time.time() + self.lifetime
 
     @property
@@ -35,6 +71,145 @@ class CacheItem:
         return time.time() > self._outdate_time
 
 
+class _SettingsDiskCache:
+    """Settings cache stored on disk shared across processes.
+
+    Settings are stored per server url, user name, bundle name, variant,
+    site id and project name in launcher local directory. Cached settings
+    are used only if server did not emit any settings or bundle change
+    event since they were cached, which is much cheaper than querying
+    the settings. Events are compared with time on server, and cached
+    settings older than 'max_age' are not used even without any event,
+    so a missed event can't keep outdated settings forever.
+
+    Settings may contain secrets and are stored as plain text, cache files
+    are readable only by the user who created them.
+
+    Cache can be disabled by setting 'AYON_SETTINGS_CACHE_DISABLED'
+    environment variable to '1'.
+    """
+    invalidation_topics = {
+        "settings.changed",
+        "bundle.created",
+        "bundle.updated",
+    }
+    # Margin for delay between server response and the query
+    time_margin = 10
+    # Maximum age of cached settings in seconds
+    max_age = 60 * 60
+
+    @classmethod
+    def is_enabled(cls):
+        return os.getenv("AYON_SETTINGS_CACHE_DISABLED") != "1"
+
+    @classmethod
+    def get_cache_time(cls):
+        """Time on server used as time of settings query.
+
+        Returns:
+            str: Time in iso format.
+
+        """
+        from ayon_core.lib import get_server_time
+
+        return (
+            get_server_time() - timedelta(seconds=cls.time_margin)
+        ).isoformat()
+
+    @classmethod
+    def is_valid(cls, cached_at):
+        """Check if settings cached at given time are still valid.
+
+        Args:
+            cached_at (str): Time when settings were cached in iso format.
+
+        Returns:
+            bool: Settings did not change since then and are not too old.
+
+        """
+        from ayon_core.lib import get_server_time
+
+        if not cached_at:
+            return False
+        try:
+            age = get_server_time() - datetime.fromisoformat(cached_at)
+        except (TypeError, ValueError):
+            return False
+        if age.total_seconds() > cls.max_age:
+            return False
+
+        try:
+            events = ayon_api.get_events(
+                topics=cls.invalidation_topics,
+                newer_than=cached_at,
+                fields={"id"},
+                limit=1,
+            )
+            return next(iter(events), None) is None
+        except Exception:
+            log.debug("Failed to check settings events.", exc_info=True)
+        return False
+
+    @classmethod
+    def load(cls, key):
+        """Load cached settings.
+
+        Args:
+            key (tuple[str, ...]): Key of cached settings.
+
+        Returns:
+            Union[tuple[dict[str, Any], str], None]: Settings and time when
+                they were cached, or None if are not cached.
+
+        """
+        filepath = cls._get_filepath(key)
+        if not os.path.exists(filepath):
+            return None
+        try:
+            with open(filepath, "r", encoding="utf-8") as stream:
+                data = json.load(stream)
+            return data["value"], data["cached_at"]
+        except (OSError, ValueError, KeyError):
+            log.debug("Failed to load cached settings.", exc_info=True)
+        return None
+
+    @classmethod
+    def save(cls, key, value, cached_at):
+        """Store settings to disk.
+
+        Args:
+            key (tuple[str, ...]): Key of cached settings.
+            value (dict[str, Any]): Settings.
+            cached_at (str): Time when settings were queried in iso format.
+
+        """
+        filepath = cls._get_filepath(key)
+        try:
+            os.makedirs(
+                os.path.dirname(filepath), mode=0o700, exist_ok=True
+            )
+            # Write to temp file first to avoid reading of partial file
+            #   from other processes
+            tmp_path = "{}.{}.tmp".format(filepath, os.getpid())
+            fd = os.open(
+                tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600
+            )
+            with os.fdopen(fd, "w", encoding="utf-8") as stream:
+                json.dump({"cached_at": cached_at, "value": value}, stream)
+            os.replace(tmp_path, filepath)
+        except (OSError, TypeError):
+            log.debug("Failed to store settings cache.", exc_info=True)
+
+    @classmethod
+    def _get_filepath(cls, key):
+        from ayon_core.lib import get_launcher_local_dir
+
+        key_hash = hashlib.sha1(repr(key).encode("utf-8")).hexdigest()
+        return get_launcher_local_dir(
+            "settings_cache", "{}.json".format(key_hash)
+        )
+
+
 class _AyonSettingsCache:
     use_bundles = None
     variant = None
@@ -76,19 +251,58 @@ class _AyonSettingsCache:
         return os.environ["AYON_BUNDLE_NAME"]
 
     @classmethod
-    def get_value_by_project(cls, project_name):
+    def get_value_by_project(cls, project_name, read_only=False):
         cache_item = _AyonSettingsCache.cache_by_project_name[project_name]
         if cache_item.is_outdated:
-            if cls._use_bundles():
-                value = ayon_api.get_addons_settings(
-                    bundle_name=cls._get_bundle_name(),
-                    project_name=project_name,
-                    variant=cls._get_variant()
-                )
-            else:
-                value = ayon_api.get_addons_settings(project_name)
+            cls._update_project_cache(project_name, cache_item)
+        return cache_item.get_value(read_only)
+
+    @classmethod
+    def _update_project_cache(cls, project_name, cache_item):
+        if not cls._use_bundles():
+            value = ayon_api.get_addons_settings(project_name)
             cache_item.update_value(value)
-        return cache_item.get_value()
+            return
+
+        # Settings did not change on server since last query
+        if (
+            cache_item.cached_at
+            and _SettingsDiskCache.is_valid(cache_item.cached_at)
+        ):
+            cache_item.extend_lifetime()
+            return
+
+        use_disk_cache = _SettingsDiskCache.is_enabled()
+        bundle_name = cls._get_bundle_name()
+        variant = cls._get_variant()
+        key = None
+        if use_disk_cache:
+            key = (
+                ayon_api.get_base_url(),
+                ayon_api.get_user()["name"],
+                bundle_name,
+                variant,
+                ayon_api.get_site_id(),
+                project_name,
+            )
+        if use_disk_cache and cache_item.cached_at is None:
+            cached = _SettingsDiskCache.load(key)
+            if (
+                cached is not None
+                and _SettingsDiskCache.is_valid(cached[1])
+            ):
+                cache_item.update_value(*cached)
+                return
+
+        cached_at = _SettingsDiskCache.get_cache_time()
+        value = ayon_api.get_addons_settings(
+            bundle_name=bundle_name,
+            project_name=project_name,
+            variant=variant
+        )
+        if use_disk_cache:
+            _SettingsDiskCache.save(key, value, cached_at)
+        cache_item.update_value(value, cached_at)
 
     @classmethod
     def _get_addon_versions_from_bundle(cls):
@@ -123,27 +337,30 @@ class _AyonSettingsCache:
         return cache_item.get_value()
 
 
-def get_ayon_settings(project_name=None):
+def get_ayon_settings(project_name=None, read_only=False):
     """AYON studio settings.
 
     Raw AYON settings values.
 
     Args:
         project_name (Optional[str]): Project name.
+        read_only (Optional[bool]): Return read-only settings shared
+            with other callers instead of a copy. Dictionaries are
+            'MappingProxyType' and lists are tuples in read-only settings.
 
     Returns:
         dict[str, Any]: AYON settings.
     """
 
-    return _AyonSettingsCache.get_value_by_project(project_name)
+    return _AyonSettingsCache.get_value_by_project(project_name, read_only)
 
 
-def get_studio_settings(*args, **kwargs):
-    return _AyonSettingsCache.get_value_by_project(None)
+def get_studio_settings(*args, read_only=False, **kwargs):
+    return _AyonSettingsCache.get_value_by_project(None, read_only)
 
 
-def get_project_settings(project_name, *args, **kwargs):
-    return _AyonSettingsCache.get_value_by_project(project_name)
+def get_project_settings(project_name, *args, read_only=False, **kwargs):
+    return _AyonSettingsCache.get_value_by_project(project_name, read_only)
 
 
 def get_general_environments(studio_settings=None):
@@ -157,7 +374,7 @@ def get_general_environments(studio_settings=None):
 
     """
     if studio_settings is None:
-        studio_settings = get_ayon_settings()
+        studio_settings = get_ayon_settings(read_only=True)
     return json.loads(studio_settings["core"]["environments"])
 
 
@@ -173,7 +390,7 @@ def get_project_environments(project_name, project_settings=None):
 
     """
     if project_settings is None:
-        project_settings = get_project_settings(project_name)
+        project_settings = get_project_settings(project_name, read_only=True)
     return json.loads(
         project_settings["core"]["project_environments"]
     )
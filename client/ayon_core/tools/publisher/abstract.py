@@ -126,11 +126,15 @@ class AbstractPublisherCommon(ABC):
         pass
 
     @abstractmethod
-    def reset(self):
+    def reset(self, incremental=False):
         """Reset whole controller.
 
         This should reset create context, publish context and all variables
         that are related to it.
+
+        Args:
+            incremental (bool): Keep create plugins and collect again only
+                changed instances.
         """
 
         pass
@@ -349,8 +349,13 @@ class PublisherController(
             for product_entity in product_entities
         }
 
-    def reset(self):
-        """Reset everything related to creation and publishing."""
+    def reset(self, incremental=False):
+        """Reset everything related to creation and publishing.
+
+        Args:
+            incremental (bool): Keep create plugins and collect again only
+                changed instances.
+        """
         self.stop_publish()
 
         self._emit_event("controller.reset.started")
@@ -358,7 +363,7 @@ class PublisherController(
         self._hierarchy_model.reset()
 
         # Publish part must be reset after plugins
-        self._create_model.reset()
+        self._create_model.reset(incremental)
         self._publish_model.reset()
 
         self._emit_event("controller.reset.finished")
@@ -444,17 +444,31 @@ class CreateModel:
     def host_context_has_changed(self) -> bool:
         return self._create_context.context_has_changed
 
-    def reset(self):
+    def reset(self, incremental: bool = False):
+        """Reset create context.
+
+        Args:
+            incremental (bool): Keep plugins and collect again only
+                changed instances. See 'CreateContext.reset'.
+
+        """
+        project_name = self._create_context.get_current_project_name()
         self._create_context.reset_preparation()
 
         # Reset current context
         self._create_context.reset_current_context()
 
-        self._create_context.reset_plugins()
-        # Reset creator items
-        self._creator_items = None
+        incremental = self._create_context.can_reset_incrementally(
+            project_name, incremental
+        )
+        if incremental:
+            self._create_context.reregister_plugins_callbacks()
+        else:
+            self._create_context.reset_plugins()
+            # Reset creator items
+            self._creator_items = None
 
-        self._reset_instances()
+        self._reset_instances(incremental)
 
         self._emit_event("create.model.reset")
 
@@ -955,13 +969,13 @@ class CreateModel:
             for instance_id in instance_ids
         }
 
-    def _reset_instances(self):
+    def _reset_instances(self, incremental: bool = False):
         """Reset create instances."""
 
         self._create_context.reset_context_data()
         with self._create_context.bulk_add_instances():
             try:
-                self._create_context.reset_instances()
+                self._create_context.reset_instances(incremental)
             except CreatorsOperationFailed as exc:
                 self._emit_event(
                     "instances.collection.failed",
@@ -573,9 +573,11 @@ class PublisherWindow(QtWidgets.QDialog):
             self._install_app_event_listener()
 
         # Reset if requested
+        # - plugins are kept when window is shown again, explicit reset
+        #   discovers them again
         if self._reset_on_show:
             self._reset_on_show = False
-            self.reset()
+            self.reset(incremental=True)
 
     def _checks_before_save(self, explicit_save):
         """Save of changes may trigger some issues.
@@ -637,8 +639,8 @@ class PublisherWindow(QtWidgets.QDialog):
             return False
         return self._controller.save_changes()
 
-    def reset(self):
-        self._controller.reset()
+    def reset(self, incremental=False):
+        self._controller.reset(incremental)
 
     def set_context_label(self, label):
         self._context_label.setText(label)
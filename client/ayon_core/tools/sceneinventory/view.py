@@ -8,7 +8,7 @@ import qtawesome
 from ayon_core import style
 from ayon_core.pipeline import (
     HeroVersionType,
-    update_container,
+    update_containers,
     remove_container,
     discover_inventory_actions,
 )
@@ -1101,15 +1101,27 @@ class SceneInventoryView(QtWidgets.QTreeView):
             item_ids
         )
         try:
-            for item_id, item_version in zip(item_ids, versions):
-                container = containers_by_id[item_id]
-                try:
-                    update_container(container, item_version)
-                except AssertionError:
-                    log.warning("Update failed", exc_info=True)
-                    self._show_version_error_dialog(
-                        item_version, [item_id]
-                    )
+            containers = [
+                containers_by_id[item_id]
+                for item_id in item_ids
+            ]
+            results = update_containers(containers, list(versions))
+            error = None
+            for item_id, item_version, result in zip(
+                item_ids, versions, results
+            ):
+                if result.error is None:
+                    continue
+                if not isinstance(result.error, AssertionError):
+                    if error is None:
+                        error = result.error
+                    continue
+                log.warning("Update failed", exc_info=result.error)
+                self._show_version_error_dialog(
+                    item_version, [item_id]
+                )
+            if error is not None:
+                raise error
         finally:
             # Always update the scene inventory view, even if errors occurred
             self.data_changed.emit()
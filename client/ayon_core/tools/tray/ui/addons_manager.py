@@ -22,7 +22,8 @@ class TrayAddonsManager(AddonsManager):
     )
 
     def __init__(self, tray_manager):
-        super().__init__(initialize=False)
+        # Tray needs all addons to build its menu
+        super().__init__(initialize=False, lazy=False)
 
         self._tray_manager = tray_manager
 
@@ -410,6 +410,15 @@ class ExtractOIIOTranscodeProfileModel(BaseSettingsModel):
 
 class ExtractOIIOTranscodeModel(BaseSettingsModel):
     enabled: bool = SettingsField(True)
+    max_parallel_processes: int = SettingsField(
+        0,
+        title="Max parallel processes",
+        ge=0,
+        description=(
+            "Maximum number of oiiotool processes running at the same time."
+            " Number of CPUs is used when set to 0."
+        )
+    )
     profiles: list[ExtractOIIOTranscodeProfileModel] = SettingsField(
         default_factory=list, title="Profiles"
     )
@@ -595,9 +604,50 @@ class ExtractReviewProfileModel(BaseSettingsModel):
         return value
 
 
+def _extract_review_fill_gaps_mode_enum():
+    return [
+        {"value": "link", "label": "Link nearest frame"},
+        {"value": "copy", "label": "Copy nearest frame"},
+    ]
+
+
 class ExtractReviewModel(BaseSettingsModel):
     _isGroup = True
     enabled: bool = SettingsField(True)
+    max_parallel_outputs: int = SettingsField(
+        1,
+        title="Max parallel outputs",
+        ge=0,
+        description=(
+            "Maximum number of output definitions rendered at the same time."
+            " Number of CPUs is used when set to 0."
+        )
+    )
+    fill_gaps_mode: str = SettingsField(
+        "link",
+        title="Fill sequence gaps mode",
+        enum_resolver=_extract_review_fill_gaps_mode_enum,
+        description=(
+            "How missing frames of input sequence are filled. Links don't"
+            " duplicate data of existing frames."
+        )
+    )
+    fuse_burnins: bool = SettingsField(
+        False,
+        title="Fuse burnins with review",
+        description=(
+            "Outputs with burnins are rendered by Extract Burnin in one ffmpeg"
+            " pass from review source instead of encoding review twice."
+        )
+    )
+    thumbnail_from_review: bool = SettingsField(
+        False,
+        title="Extract thumbnail frame with review",
+        description=(
+            "Frame used by Extract Thumbnail is rendered as additional output"
+            " of review encoding, so source files are not read again."
+        )
+    )
     profiles: list[ExtractReviewProfileModel] = SettingsField(
         default_factory=list,
         title="Profiles"
@@ -695,6 +745,23 @@ class ExtractBurninProfile(BaseSettingsModel):
 class ExtractBurninModel(BaseSettingsModel):
     _isGroup = True
     enabled: bool = SettingsField(True)
+    in_process: bool = SettingsField(
+        False,
+        title="Render in publish process",
+        description=(
+            "Render burnins directly in publish process instead of starting"
+            " AYON launcher process for each burnin."
+        )
+    )
+    max_parallel_burnins: int = SettingsField(
+        1,
+        title="Max parallel burnins",
+        ge=0,
+        description=(
+            "Maximum number of burnins rendered at the same time."
+            " Number of CPUs is used when set to 0."
+        )
+    )
     options: ExtractBurninOptionsModel = SettingsField(
         default_factory=ExtractBurninOptionsModel,
         title="Burnin formatting options"
@@ -819,6 +886,67 @@ class IntegrateANTemplateNameProfileModel(BaseSettingsModel):
     template_name: str = SettingsField("", title="Template name")
 
 
+def _integrate_transfer_mode_enum():
+    return [
+        {"value": "copy", "label": "Copy"},
+        {"value": "hardlink", "label": "Hardlink"},
+        {"value": "reflink", "label": "Reflink (copy-on-write)"},
+        {"value": "auto", "label": "Auto (reflink > hardlink > copy)"},
+    ]
+
+
+class IntegrateAssetModel(BaseSettingsModel):
+    _isGroup = True
+    transfer_mode: str = SettingsField(
+        "copy",
+        title="Transfer mode",
+        enum_resolver=_integrate_transfer_mode_enum,
+        description=(
+            "How representation files are transferred to publish"
+            " directory. Links are created only when staging and publish"
+            " directories are on the same volume, files are copied"
+            " otherwise or when link creation fails."
+        )
+    )
+    skip_identical_files: bool = SettingsField(
+        False,
+        title="Skip identical files",
+        description=(
+            "Leave existing files in publish directory untouched when"
+            " their content is identical to the published file. Content"
+            " is compared using content hashes cached on local machine."
+        )
+    )
+    incremental_transfers: bool = SettingsField(
+        False,
+        title="Incremental transfers",
+        description=(
+            "Leave existing files in publish directory untouched when"
+            " they have the same size and modification time as the"
+            " published file. Only changed files are replaced when"
+            " publishing to an existing version."
+        )
+    )
+    transfer_max_workers: int = SettingsField(
+        0,
+        title="Max parallel transfers",
+        ge=0,
+        description=(
+            "Number of files backed up and transferred at the same time."
+            " Files are transferred one by one when set to 0 or 1."
+        )
+    )
+    transfer_max_workers_per_volume: int = SettingsField(
+        0,
+        title="Max parallel transfers per volume",
+        ge=0,
+        description=(
+            "Limit of concurrent file operations on a single destination"
+            " volume. No limit when set to 0."
+        )
+    )
+
+
 class IntegrateHeroTemplateNameProfileModel(BaseSettingsModel):
     product_types: list[str] = SettingsField(
         default_factory=list,
@@ -953,6 +1081,10 @@ class PublishPuginsModel(BaseSettingsModel):
         default_factory=IntegrateProductGroupModel,
         title="Integrate Product Group"
     )
+    IntegrateAsset: IntegrateAssetModel = SettingsField(
+        default_factory=IntegrateAssetModel,
+        title="Integrate Asset"
+    )
     IntegrateHeroVersion: IntegrateHeroVersionModel = SettingsField(
         default_factory=IntegrateHeroVersionModel,
         title="Integrate Hero Version"
@@ -1086,10 +1218,15 @@ DEFAULT_PUBLISH_VALUES = {
     },
     "ExtractOIIOTranscode": {
         "enabled": True,
+        "max_parallel_processes": 0,
         "profiles": []
     },
     "ExtractReview": {
         "enabled": True,
+        "max_parallel_outputs": 1,
+        "fill_gaps_mode": "link",
+        "fuse_burnins": False,
+        "thumbnail_from_review": False,
         "profiles": [
             {
                 "product_types": [],
@@ -1191,6 +1328,8 @@ DEFAULT_PUBLISH_VALUES = {
     },
     "ExtractBurnin": {
         "enabled": True,
+        "in_process": False,
+        "max_parallel_burnins": 1,
         "options": {
             "font_size": 42,
             "font_color": [255, 255, 255, 1.0],
@@ -1280,6 +1419,13 @@ DEFAULT_PUBLISH_VALUES = {
             }
         ]
     },
+    "IntegrateAsset": {
+        "transfer_mode": "copy",
+        "skip_identical_files": False,
+        "incremental_transfers": False,
+        "transfer_max_workers": 0,
+        "transfer_max_workers_per_volume": 0
+    },
     "IntegrateHeroVersion": {
         "enabled": True,
         "optional": True,
@@ -0,0 +1,139 @@
+import os
+import hashlib
+
+import pytest
+
+from ayon_core.lib import file_hash
+from ayon_core.lib.file_hash import (
+    FileHashCache,
+    compute_file_hash,
+    get_file_hash,
+    get_files_hash,
+)
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = FileHashCache(str(tmp_path / "cache" / "hashes.db"))
+    yield cache
+    if cache._connection is not None:
+        cache._connection.close()
+
+
+def _create_file(dirpath, filename, content):
+    filepath = dirpath / filename
+    filepath.write_bytes(content)
+    return str(filepath)
+
+
+def _stat_with_inode(filepath, inode):
+    stat_result = os.stat(filepath)
+    values = list(stat_result)
+    values[1] = inode
+    # Nanosecond times are only in extra fields of 'os.stat_result'
+    return os.stat_result(
+        values,
+        {"st_mtime_ns": stat_result.st_mtime_ns}
+    )
+
+
+def test_compute_file_hash(tmp_path):
+    filepath = _create_file(tmp_path, "file.bin", b"content" * 100)
+
+    assert (
+        compute_file_hash(filepath, "sha256", chunk_size=16)
+        == hashlib.sha256(b"content" * 100).hexdigest()
+    )
+    with pytest.raises(ValueError):
+        compute_file_hash(filepath, "unknown")
+
+
+def test_cache_round_trip(tmp_path, cache):
+    filepath = _create_file(tmp_path, "file.bin", b"content")
+
+    assert cache.get(filepath, "sha256") is None
+    cache.set(filepath, "sha256", "digest")
+    assert cache.get(filepath, "sha256") == "digest"
+    # Hash types are cached separately
+    assert cache.get(filepath, "blake2b") is None
+
+    # Cache is persistent
+    new_cache = FileHashCache(cache.filepath)
+    assert new_cache.get(filepath, "sha256") == "digest"
+    new_cache._connection.close()
+
+    cache.clear()
+    assert cache.get(filepath, "sha256") is None
+
+
+def test_cache_invalidated_by_change(tmp_path, cache):
+    filepath = _create_file(tmp_path, "file.bin", b"content")
+    cache.set(filepath, "sha256", "digest")
+
+    # Changed modification time
+    stat_result = os.stat(filepath)
+    os.utime(
+        filepath,
+        ns=(stat_result.st_atime_ns, stat_result.st_mtime_ns + 1000)
+    )
+    assert cache.get(filepath, "sha256") is None
+
+    # Changed size with the same modification time
+    cache.set(filepath, "sha256", "digest")
+    stat_result = os.stat(filepath)
+    with open(filepath, "ab") as stream:
+        stream.write(b"more")
+    os.utime(
+        filepath,
+        ns=(stat_result.st_atime_ns, stat_result.st_mtime_ns)
+    )
+    assert cache.get(filepath, "sha256") is None
+
+
+def test_files_without_inode_are_not_cached(tmp_path, cache):
+    filepath = _create_file(tmp_path, "file.bin", b"content")
+    stat_result = _stat_with_inode(filepath, 0)
+
+    cache.set(filepath, "sha256", "digest", stat_result)
+    assert cache.get(filepath, "sha256", stat_result) is None
+    # Database is not created for files which are not cached
+    assert cache._connection is None
+
+    # Other file without inode with same size and time
+    other_path = _create_file(tmp_path, "other.bin", b"content")
+    os.utime(other_path, ns=(stat_result.st_mtime_ns, ) * 2)
+    other_stat = _stat_with_inode(other_path, 0)
+    assert (
+        get_file_hash(other_path, "sha256", cache, other_stat)
+        == hashlib.sha256(b"content").hexdigest()
+    )
+
+
+def test_get_file_hash_uses_cache(tmp_path, cache, monkeypatch):
+    filepaths = [
+        _create_file(tmp_path, "file.{}.bin".format(idx), b"content")
+        for idx in range(4)
+    ]
+    computed_paths = []
+    compute_hash = file_hash.compute_file_hash
+
+    def _compute_file_hash(filepath, *args, **kwargs):
+        computed_paths.append(filepath)
+        return compute_hash(filepath, *args, **kwargs)
+
+    monkeypatch.setattr(file_hash, "compute_file_hash", _compute_file_hash)
+
+    digest = hashlib.sha256(b"content").hexdigest()
+    result = get_files_hash(filepaths, "sha256", cache, max_workers=2)
+    assert result == {filepath: digest for filepath in filepaths}
+    assert sorted(computed_paths) == sorted(filepaths)
+
+    computed_paths.clear()
+    with open(filepaths[0], "wb") as stream:
+        stream.write(b"changed content")
+
+    result = get_files_hash(filepaths, "sha256", cache, max_workers=2)
+    assert computed_paths == [filepaths[0]]
+    assert result[filepaths[0]] == hashlib.sha256(
+        b"changed content"
+    ).hexdigest()
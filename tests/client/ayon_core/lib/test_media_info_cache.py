@@ -0,0 +1,199 @@
+import os
+import json
+
+import pytest
+
+from ayon_core.lib import transcoding
+from ayon_core.lib.transcoding import (
+    MEDIA_INFO_CACHE_SIZE,
+    get_oiio_info_for_input,
+    get_ffprobe_data,
+    clear_media_info_cache,
+)
+
+_OIIO_OUTPUT = """Reading {filepath}
+<ImageSpec version="30">
+<width>1920</width>
+<height>1080</height>
+<nchannels>3</nchannels>
+<channelnames><channelname>R</channelname><channelname>G</channelname>\
+<channelname>B</channelname></channelnames>
+<attrib name="compression" type="string">zip</attrib>
+</ImageSpec>
+"""
+
+
+@pytest.fixture
+def tool_calls(monkeypatch):
+    """Fake oiiotool and ffprobe with fresh media info cache."""
+    calls = []
+
+    def _run_subprocess(args, logger=None):
+        calls.append(("oiiotool", args[-1]))
+        return _OIIO_OUTPUT.format(filepath=args[-1])
+
+    def _run_ffprobe(path_to_file, logger):
+        calls.append(("ffprobe", path_to_file))
+        return json.dumps({
+            "streams": [{"codec_type": "video", "width": 1920}],
+            "format": {"filename": path_to_file},
+        })
+
+    monkeypatch.setattr(
+        transcoding, "get_oiio_tool_args", lambda *args: list(args)
+    )
+    monkeypatch.setattr(transcoding, "run_subprocess", _run_subprocess)
+    monkeypatch.setattr(transcoding, "_run_ffprobe", _run_ffprobe)
+    monkeypatch.setattr(
+        transcoding,
+        "_media_info_cache",
+        transcoding._MediaInfoCache(MEDIA_INFO_CACHE_SIZE)
+    )
+    monkeypatch.delenv("AYON_MEDIA_INFO_CACHE_DIR", raising=False)
+    return calls
+
+
+def _create_file(dirpath, filename, content=b"content"):
+    filepath = dirpath / filename
+    filepath.write_bytes(content)
+    return str(filepath)
+
+
+def test_tools_run_once_per_file(tmp_path, tool_calls):
+    filepath = _create_file(tmp_path, "image.exr")
+
+    for _ in range(3):
+        oiio_info = get_oiio_info_for_input(filepath)
+        ffprobe_data = get_ffprobe_data(filepath)
+
+    assert oiio_info["width"] == 1920
+    assert oiio_info["channelnames"] == ["R", "G", "B"]
+    assert ffprobe_data["streams"][0]["width"] == 1920
+    assert tool_calls == [("oiiotool", filepath), ("ffprobe", filepath)]
+
+    # Different options are cached separately
+    subimages = get_oiio_info_for_input(filepath, subimages=True)
+    assert subimages == [oiio_info]
+    assert len(tool_calls) == 3
+
+    clear_media_info_cache()
+    get_ffprobe_data(filepath)
+    assert len(tool_calls) == 4
+
+
+def test_changed_file_is_loaded_again(tmp_path, tool_calls):
+    filepath = _create_file(tmp_path, "image.exr")
+    get_ffprobe_data(filepath)
+
+    # Changed modification time
+    stat_result = os.stat(filepath)
+    os.utime(
+        filepath,
+        ns=(stat_result.st_atime_ns, stat_result.st_mtime_ns + 1000)
+    )
+    get_ffprobe_data(filepath)
+    assert len(tool_calls) == 2
+
+    # Changed size with the same modification time
+    stat_result = os.stat(filepath)
+    with open(filepath, "ab") as stream:
+        stream.write(b"more")
+    os.utime(
+        filepath,
+        ns=(stat_result.st_atime_ns, stat_result.st_mtime_ns)
+    )
+    get_ffprobe_data(filepath)
+    assert len(tool_calls) == 3
+
+
+def test_missing_file_is_not_cached(tmp_path, tool_calls):
+    filepath = str(tmp_path / "image.%04d.exr")
+
+    get_ffprobe_data(filepath)
+    get_ffprobe_data(filepath)
+
+    assert len(tool_calls) == 2
+
+
+def test_least_recently_used_items_are_removed(
+    tmp_path, tool_calls, monkeypatch
+):
+    monkeypatch.setattr(
+        transcoding, "_media_info_cache", transcoding._MediaInfoCache(2)
+    )
+    filepaths = [
+        _create_file(tmp_path, "image.{}.exr".format(idx))
+        for idx in range(3)
+    ]
+    get_ffprobe_data(filepaths[0])
+    get_ffprobe_data(filepaths[1])
+    # Mark first file as recently used
+    get_ffprobe_data(filepaths[0])
+    get_ffprobe_data(filepaths[2])
+    assert len(tool_calls) == 3
+
+    # Second file was removed from cache
+    get_ffprobe_data(filepaths[0])
+    get_ffprobe_data(filepaths[2])
+    assert len(tool_calls) == 3
+    get_ffprobe_data(filepaths[1])
+    assert tool_calls[-1] == ("ffprobe", filepaths[1])
+
+
+def test_default_cache_size(tmp_path, tool_calls):
+    filepaths = [
+        _create_file(tmp_path, "image.{}.exr".format(idx))
+        for idx in range(MEDIA_INFO_CACHE_SIZE + 1)
+    ]
+    for filepath in filepaths:
+        get_ffprobe_data(filepath)
+
+    get_ffprobe_data(filepaths[-1])
+    assert len(tool_calls) == MEDIA_INFO_CACHE_SIZE + 1
+    get_ffprobe_data(filepaths[0])
+    assert len(tool_calls) == MEDIA_INFO_CACHE_SIZE + 2
+
+
+def test_output_is_shared_through_disk(tmp_path, tool_calls, monkeypatch):
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setenv("AYON_MEDIA_INFO_CACHE_DIR", str(cache_dir))
+    filepath = _create_file(tmp_path, "image.exr")
+
+    oiio_info = get_oiio_info_for_input(filepath)
+    ffprobe_data = get_ffprobe_data(filepath)
+    assert sorted(os.listdir(cache_dir)) == ["ffprobe", "oiiotool"]
+
+    # Other process with empty cache in memory
+    clear_media_info_cache()
+    assert get_oiio_info_for_input(filepath) == oiio_info
+    assert get_ffprobe_data(filepath) == ffprobe_data
+    assert len(tool_calls) == 2
+
+    # Output stored on disk is not used for changed file
+    with open(filepath, "ab") as stream:
+        stream.write(b"more")
+    clear_media_info_cache()
+    get_ffprobe_data(filepath)
+    assert len(tool_calls) == 3
+
+
+def test_modified_output_does_not_change_cache(tmp_path, tool_calls):
+    filepath = _create_file(tmp_path, "image.exr")
+
+    oiio_info = get_oiio_info_for_input(filepath)
+    oiio_info["width"] = 10
+    oiio_info["channelnames"].append("A")
+    oiio_info["attribs"].clear()
+    ffprobe_data = get_ffprobe_data(filepath)
+    ffprobe_data["streams"][0]["width"] = 10
+    ffprobe_data["streams"].append({})
+
+    oiio_info = get_oiio_info_for_input(filepath)
+    ffprobe_data = get_ffprobe_data(filepath)
+    assert oiio_info["width"] == 1920
+    assert oiio_info["channelnames"] == ["R", "G", "B"]
+    assert oiio_info["attribs"] == {"compression": "zip"}
+    assert ffprobe_data["streams"] == [
+        {"codec_type": "video", "width": 1920}
+    ]
+    assert len(tool_calls) == 2
@@ -0,0 +1,163 @@
+import random
+
+import pytest
+
+from ayon_core.lib.path_templates import (
+    StringTemplate,
+    FormatObject,
+    TemplateUnsolved,
+)
+
+_PUBLISH_TEMPLATE = (
+    "{root[work]}/{project[name]}/{hierarchy}/{folder[name]}/publish"
+    "/{product[type]}/{product[name]}/v{version:0>3}"
+    "/{project[code]}_{folder[name]}_{product[name]}_v{version:0>3}"
+    "<_{output}><.{frame:0>4}><_{udim}>.{ext}"
+)
+_TEMPLATES = [
+    _PUBLISH_TEMPLATE,
+    "{a}_{a}",
+    "{a:0>3}_{a}",
+    "{a}_{a:0>3}",
+    "{a}<_{a}>",
+    "<{a}_>{a}",
+    "<{a}<_{b}>>_{b}",
+    "{a!r}_{a}",
+    "{a[b]}_{a[b][c]}",
+    "{a}_{b:0>3}<.{c}>",
+    "<<{a}>_{b}>",
+]
+_PUBLISH_DATA = {
+    "root": {"work": "/work"},
+    "project": {"name": "demo", "code": "dm"},
+    "hierarchy": "shots/sq01",
+    "folder": {"name": "sh010"},
+    "product": {"type": "render", "name": "renderMain"},
+    "version": 3,
+    "output": "review",
+    "frame": 1001,
+    "ext": "exr",
+}
+
+
+def _format_full(template, data):
+    """Format template without compiled fast path."""
+    template_obj = StringTemplate(template)
+    template_obj._compiled = None
+    return template_obj.format(data)
+
+
+def _assert_same_result(template, data):
+    try:
+        expected = _format_full(template, data)
+    except Exception as exc:
+        # Full formatting does not support some values of repeated keys
+        with pytest.raises(type(exc)):
+            StringTemplate(template).format(data)
+        return None
+
+    result = StringTemplate(template).format(data)
+
+    assert str(result) == str(expected)
+    assert result.solved == expected.solved
+    assert result.template == expected.template
+    assert result.used_values == expected.used_values
+    assert sorted(result.missing_keys) == sorted(expected.missing_keys)
+    assert result.invalid_types == expected.invalid_types
+    return result
+
+
+def _format_object(value):
+    format_object = FormatObject()
+    format_object.value = value
+    return format_object
+
+
+def test_templates_are_compiled():
+    for template in _TEMPLATES:
+        assert StringTemplate(template)._compiled is not None
+
+
+def test_publish_template():
+    result = _assert_same_result(_PUBLISH_TEMPLATE, _PUBLISH_DATA)
+    assert result.solved
+    assert str(result) == (
+        "/work/demo/shots/sq01/sh010/publish/render/renderMain/v003"
+        "/dm_sh010_renderMain_v003_review.1001.exr"
+    )
+
+
+def test_publish_template_optional_parts():
+    data = dict(_PUBLISH_DATA)
+    data.pop("output")
+    data.pop("frame")
+    data["udim"] = 1001
+    result = _assert_same_result(_PUBLISH_TEMPLATE, data)
+    assert result.solved
+    assert str(result).endswith("/dm_sh010_renderMain_v003_1001.exr")
+
+    # Missing required key
+    data.pop("ext")
+    result = _assert_same_result(_PUBLISH_TEMPLATE, data)
+    assert not result.solved
+    with pytest.raises(TemplateUnsolved):
+        StringTemplate(_PUBLISH_TEMPLATE).format_strict(data)
+
+
+@pytest.mark.parametrize(
+    "template,data,expected",
+    [
+        ("{a}_{a}", {"a": "x"}, "x_x"),
+        ("{a:0>3}_{a}", {"a": "1"}, None),
+        ("{a}_{a:0>3}", {"a": 1}, "1_001"),
+        ("{a}<_{a}>", {"a": "x"}, "x_x"),
+        ("<{a}_>{a}", {"a": "x"}, "x_x"),
+        ("<{a}<_{b}>>_{b}", {"a": "x", "b": "y"}, "x_y_y"),
+        ("{a!r}_{a}", {"a": "x"}, None),
+        ("{a[b]}_{a[b][c]}", {"a": {"b": {"c": "x"}}}, None),
+    ]
+)
+def test_repeated_keys(template, data, expected):
+    result = _assert_same_result(template, data)
+    if expected is not None:
+        assert str(result) == expected
+
+
+def test_repeated_keys_with_invalid_values():
+    for value in (1, {"b": 1}, [1, 2], None, _format_object("fo")):
+        for template in ("{a}_{a}", "{a}<_{a}>", "<{a}_>{a}"):
+            _assert_same_result(template, {"a": value})
+
+
+def test_format_objects():
+    data = {"a": _format_object("value"), "b": _format_object(3)}
+    result = _assert_same_result("{a}_{b:0>3}<.{c}>", data)
+    assert str(result) == "value_003"
+
+
+def test_random_data():
+    rand = random.Random(3)
+    values = [
+        1, 2.5, "str", "", None, True, [1, 2], {"b": "x", "c": 3},
+        {"b": {"c": "d"}},
+    ]
+    keys = (
+        "a", "b", "c", "output", "frame", "udim", "ext", "hierarchy",
+        "version",
+    )
+    for template in _TEMPLATES:
+        for _ in range(100):
+            data = {
+                key: rand.choice(values)
+                for key in keys
+                if rand.random() < 0.85
+            }
+            for key in ("root", "project", "folder", "product"):
+                if rand.random() < 0.9:
+                    data[key] = {
+                        "work": "/work",
+                        "name": rand.choice(["name", 1, None]),
+                        "code": "dm",
+                        "type": "render",
+                    }
+            _assert_same_result(template, data)
@@ -0,0 +1,168 @@
+import random
+from types import MappingProxyType
+
+from ayon_core.lib.profiles_filtering import (
+    ProfileMatcher,
+    filter_profiles,
+    validate_value_by_regexes,
+    _profile_exclusion,
+    _get_profile_matcher,
+)
+
+_VALUES_BY_KEY = {
+    "hosts": ["maya", "nuke", "houdini", "ma.*", "*", ""],
+    "task_types": ["Compositing", "Modeling", "Anim.*", "*"],
+    "product_types": ["render", "review", "ren.*", "model"],
+}
+_TESTED_VALUES = [
+    "maya", "nuke", "mari", "Compositing", "Animation", "render",
+    "model", "", None,
+]
+
+
+def _reference_filter_profiles(profiles_data, key_values, keys_order=None):
+    """Filtering of profiles before 'ProfileMatcher' was used."""
+    if not profiles_data:
+        return None
+
+    keys_order = list(keys_order or [])
+    for key in key_values.keys():
+        if key not in keys_order:
+            keys_order.append(key)
+
+    matching_profiles = None
+    highest_profile_points = -1
+    for profile in profiles_data:
+        profile_points = 0
+        profile_scores = []
+        for key in keys_order:
+            match = validate_value_by_regexes(
+                key_values[key], profile.get(key)
+            )
+            if match == -1:
+                profile_points = -1
+                break
+            profile_points += match
+            profile_scores.append(bool(match))
+
+        if (
+            profile_points < 0
+            or profile_points < highest_profile_points
+        ):
+            continue
+
+        if profile_points > highest_profile_points:
+            matching_profiles = []
+            highest_profile_points = profile_points
+        matching_profiles.append((profile, profile_scores))
+
+    if not matching_profiles:
+        return None
+    return _profile_exclusion(matching_profiles, None)
+
+
+def _random_profiles(rand):
+    profiles = []
+    for idx in range(rand.randint(0, 8)):
+        profile = {"id": idx}
+        for key, values in _VALUES_BY_KEY.items():
+            if rand.random() < 0.3:
+                continue
+            profile[key] = rand.sample(values, rand.randint(0, 3))
+        profiles.append(profile)
+    return profiles
+
+
+def _random_key_values(rand):
+    return {
+        key: rand.choice(_TESTED_VALUES)
+        for key in _VALUES_BY_KEY
+        if rand.random() < 0.9
+    }
+
+
+def _freeze_profiles(profiles):
+    return tuple(
+        MappingProxyType({
+            key: tuple(value) if isinstance(value, list) else value
+            for key, value in profile.items()
+        })
+        for profile in profiles
+    )
+
+
+def _profile_id(profile):
+    if profile is None:
+        return None
+    return profile["id"]
+
+
+def test_matcher_matches_reference():
+    rand = random.Random(1)
+    for _ in range(300):
+        profiles = _random_profiles(rand)
+        keys_order = rand.choice(
+            [None, ["product_types"], ["task_types", "hosts"]]
+        )
+        matcher = ProfileMatcher(profiles, keys_order)
+        for _ in range(10):
+            key_values = _random_key_values(rand)
+            if keys_order and any(
+                key not in key_values for key in keys_order
+            ):
+                continue
+            expected = _reference_filter_profiles(
+                profiles, key_values, keys_order
+            )
+            assert matcher.match(key_values) is expected
+
+
+def test_filter_profiles_matches_reference():
+    rand = random.Random(2)
+    for _ in range(300):
+        profiles = _random_profiles(rand)
+        frozen_profiles = _freeze_profiles(profiles)
+        for _ in range(5):
+            key_values = _random_key_values(rand)
+            expected = _reference_filter_profiles(profiles, key_values)
+            assert filter_profiles(profiles, key_values) is expected
+            assert (
+                _profile_id(filter_profiles(frozen_profiles, key_values))
+                == _profile_id(expected)
+            )
+
+
+def test_cached_matcher_reused_for_same_profiles():
+    profiles = [{"hosts": ["maya"], "id": 0}, {"hosts": [], "id": 1}]
+    key_values = {"hosts": "maya"}
+
+    # Matcher is cached when the same profiles are used repeatedly
+    filter_profiles(profiles, key_values)
+    matcher = _get_profile_matcher(profiles, ())
+    assert _get_profile_matcher(profiles, ()) is matcher
+
+    frozen_profiles = _freeze_profiles(profiles)
+    filter_profiles(frozen_profiles, key_values)
+    matcher = _get_profile_matcher(frozen_profiles, ())
+    assert _get_profile_matcher(frozen_profiles, ()) is matcher
+
+
+def test_cached_matcher_of_modified_profiles():
+    profiles = [{"hosts": ["maya"], "id": 0}, {"hosts": [], "id": 1}]
+    key_values = {"hosts": "maya"}
+    for _ in range(3):
+        assert filter_profiles(profiles, key_values)["id"] == 0
+
+    # Modified in place
+    profiles[0]["hosts"].append("nuke")
+    profiles[0]["hosts"].remove("maya")
+    assert filter_profiles(profiles, key_values)["id"] == 1
+
+    # Profile replaced by equal profile
+    new_profile = {"hosts": [], "id": 1}
+    profiles[1] = new_profile
+    assert filter_profiles(profiles, key_values) is new_profile
+
+    # Profile added
+    profiles.insert(0, {"hosts": ["maya"], "id": 2})
+    assert filter_profiles(profiles, key_values)["id"] == 2
@@ -0,0 +1,98 @@
+from datetime import datetime, timezone, timedelta
+import email.utils
+
+import pytest
+
+from ayon_core.lib import ayon_connection
+from ayon_core.lib.ayon_connection import (
+    get_server_time,
+    update_server_time,
+)
+from ayon_core.pipeline.load import utils
+
+
+class _Response:
+    def __init__(self, server_time=None):
+        self.headers = {}
+        if server_time is not None:
+            self.headers["Date"] = email.utils.format_datetime(
+                server_time, usegmt=True
+            )
+
+
+@pytest.fixture
+def server_requests(monkeypatch):
+    """Fake server with clock one hour ahead of this machine."""
+    requests = []
+
+    def _get(endpoint):
+        requests.append(endpoint)
+        return _Response(_server_now())
+
+    monkeypatch.setattr(ayon_connection.ayon_api, "get", _get)
+    monkeypatch.setattr(
+        ayon_connection.ayon_api, "get_base_url", lambda: "http://server"
+    )
+    monkeypatch.setattr(
+        ayon_connection, "_ServerTimeCache", type(
+            "_ServerTimeCache",
+            (ayon_connection._ServerTimeCache, ),
+            {"base_url": None, "offset": None, "updated_at": 0}
+        )
+    )
+    return requests
+
+
+def _server_now():
+    return (
+        datetime.now(timezone.utc) + timedelta(hours=1)
+    ).replace(microsecond=0)
+
+
+def _assert_server_time(value):
+    assert abs((value - _server_now()).total_seconds()) < 3
+
+
+def test_server_time_is_cached(server_requests):
+    _assert_server_time(get_server_time())
+    _assert_server_time(get_server_time())
+
+    assert len(server_requests) == 1
+
+
+def test_server_time_from_response(server_requests):
+    assert update_server_time(_Response()) is None
+
+    server_time = update_server_time(_Response(_server_now()))
+    _assert_server_time(server_time)
+    _assert_server_time(get_server_time())
+    assert not server_requests
+
+
+def test_server_time_from_graphql_response(server_requests):
+    class _GraphQlResponse:
+        data = _Response(_server_now())
+
+    class _Connection:
+        def query_graphql(self, query, variables=None):
+            return _GraphQlResponse()
+
+    con = utils._ServerTimeConnection(_Connection())
+    con.query_graphql("query")
+
+    _assert_server_time(get_server_time())
+    assert not server_requests
+
+
+def test_local_time_used_on_failure(server_requests, monkeypatch):
+    def _get(endpoint):
+        server_requests.append(endpoint)
+        raise ConnectionError("Server is not available")
+
+    monkeypatch.setattr(ayon_connection.ayon_api, "get", _get)
+
+    local_time = datetime.now(timezone.utc)
+    assert abs((get_server_time() - local_time).total_seconds()) < 3
+    get_server_time()
+    # Server is not asked again for some time
+    assert len(server_requests) == 1
@@ -0,0 +1,78 @@
+import pytest
+
+from ayon_core.lib.transcoding import get_oiio_frame_sequence_paths
+
+
+def _frame_paths(frames, template="/renders/img.{:04}.exr"):
+    return [template.format(frame) for frame in frames]
+
+
+def test_contiguous_sequence():
+    filepaths = _frame_paths(range(1001, 1011))
+
+    assert get_oiio_frame_sequence_paths(filepaths) == [
+        "/renders/img.1001-1010@@@@.exr"
+    ]
+
+
+def test_sequence_with_gaps():
+    filepaths = _frame_paths([1001, 1002, 1003, 1005, 1006, 1008])
+
+    assert get_oiio_frame_sequence_paths(filepaths) == [
+        "/renders/img.1001-1003@@@@.exr",
+        "/renders/img.1005-1006@@@@.exr",
+        "/renders/img.1008.exr",
+    ]
+
+
+@pytest.mark.parametrize(
+    "frames_per_chunk,expected",
+    [
+        (2, [
+            "/renders/img.1001-1002@@@@.exr",
+            "/renders/img.1003-1004@@@@.exr",
+            "/renders/img.1005.exr",
+        ]),
+        (3, [
+            "/renders/img.1001-1003@@@@.exr",
+            "/renders/img.1004-1005@@@@.exr",
+        ]),
+        (10, ["/renders/img.1001-1005@@@@.exr"]),
+    ]
+)
+def test_frames_per_chunk(frames_per_chunk, expected):
+    filepaths = _frame_paths(range(1001, 1006))
+
+    assert get_oiio_frame_sequence_paths(
+        filepaths, frames_per_chunk
+    ) == expected
+
+
+def test_remainders_are_kept():
+    filepaths = _frame_paths(range(1, 4)) + [
+        "/renders/slate.exr",
+        "/renders/single.0001.png",
+    ]
+
+    assert sorted(get_oiio_frame_sequence_paths(filepaths)) == [
+        "/renders/img.1-3@@@@.exr",
+        "/renders/single.0001.png",
+        "/renders/slate.exr",
+    ]
+
+
+def test_unpadded_frames():
+    filepaths = _frame_paths(
+        [1, 2, 3, 10, 11], "/renders/img.{}.exr"
+    )
+
+    assert get_oiio_frame_sequence_paths(filepaths) == [
+        "/renders/img.1-3@.exr",
+        "/renders/img.10-11@@.exr",
+    ]
+
+
+def test_frame_range_characters_in_filename():
+    filepaths = _frame_paths(range(1001, 1004), "/renders/img#.{}.exr")
+
+    assert get_oiio_frame_sequence_paths(filepaths) == filepaths
@@ -0,0 +1,130 @@
+from ayon_core.pipeline.create.changes import TrackChangesItem
+from ayon_core.pipeline.create.structures import CreatedInstance
+
+
+class _FakeCreateContext:
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: None
+
+
+class _FakeCreator:
+    identifier = "test.creator"
+    label = "Test"
+    create_context = _FakeCreateContext()
+
+    def get_group_label(self):
+        return "Test"
+
+    def get_attr_defs_for_instance(self, instance):
+        return []
+
+
+def _create_instance(data=None):
+    instance_data = {
+        "folderPath": "/shots/sh010",
+        "task": "comp",
+        "tags": ["review"],
+        "creator_attributes": {"farm": False},
+    }
+    if data:
+        instance_data.update(data)
+    return CreatedInstance(
+        "render", "renderMain", instance_data, _FakeCreator()
+    )
+
+
+def test_track_changes_copies_passed_values():
+    old_value = {"key": {"sub": [1]}}
+    new_value = {"key": {"sub": [1, 2]}}
+    changes = TrackChangesItem(old_value, new_value)
+
+    old_value["key"]["sub"].append(3)
+    new_value["key"]["sub"].append(3)
+
+    assert changes["key"]["sub"].old_value == [1]
+    assert changes["key"]["sub"].new_value == [1, 2]
+
+
+def test_track_changes_unchanged_values_share_copy():
+    value = {"key": {"sub": 1}}
+    changes = TrackChangesItem(value, {"key": {"sub": 1}})
+
+    assert not changes.changed
+    assert changes._old_value is changes._new_value
+    assert changes._old_value is not value
+
+
+def test_track_changes_sub_items_share_values():
+    changes = TrackChangesItem(
+        {"key": {"sub": 1}, "other": 1},
+        {"key": {"sub": 2}, "other": 1},
+    )
+
+    assert changes.changed_keys == {"key"}
+    assert changes["key"]._old_value is changes._old_value["key"]
+    assert changes["key"]._new_value is changes._new_value["key"]
+    # Returned values are copies
+    assert changes["key"].new_value is not changes._new_value["key"]
+
+
+def test_track_changes_without_copy():
+    old_value = {"key": 1}
+    new_value = {"key": 2, "added": 3}
+    changes = TrackChangesItem(old_value, new_value, copy_values=False)
+
+    assert changes._old_value is old_value
+    assert changes._new_value is new_value
+    assert changes.changed_keys == {"key", "added"}
+    assert changes.changes == {"key": (1, 2), "added": (None, 3)}
+
+
+def test_instance_changes_after_store():
+    instance = _create_instance()
+    instance.mark_as_stored()
+
+    assert not instance.changes().changed
+
+    instance["task"] = "anim"
+    changes = instance.changes()
+    assert changes.changed_keys == {"task"}
+    assert changes["task"].old_value == "comp"
+    assert changes["task"].new_value == "anim"
+
+    instance.mark_as_stored()
+    assert not instance.changes().changed
+
+
+def test_instance_changes_of_popped_key():
+    instance = _create_instance({"custom": "value"})
+    instance.mark_as_stored()
+
+    instance.pop("custom")
+    changes = instance.changes()
+    assert changes.changed_keys == {"custom"}
+    assert changes.removed_keys == {"custom"}
+
+
+def test_instance_changes_of_values_changed_in_place():
+    instance = _create_instance()
+    instance.mark_as_stored()
+
+    # Mutable values are compared even if were not set
+    instance["tags"].append("burnin")
+    changes = instance.changes()
+    assert changes.changed_keys == {"tags"}
+    assert changes["tags"].old_value == ["review"]
+    assert changes["tags"].new_value == ["review", "burnin"]
+
+
+def test_instance_changes_share_unchanged_values():
+    instance = _create_instance()
+    instance.mark_as_stored()
+    instance["task"] = "anim"
+
+    changes = instance.changes()
+    new_value = changes._new_value
+    # Unchanged values are shared with origin data
+    assert new_value["tags"] is changes._old_value["tags"]
+    # Shared values are not current instance data
+    instance["tags"].append("burnin")
+    assert new_value["tags"] == ["review"]
@@ -0,0 +1,147 @@
+import pytest
+
+from ayon_core.pipeline.load import utils
+
+# Version entities by id
+_VERSIONS = {
+    "v1": {"productId": "p1", "version": 1, "active": True},
+    "v2": {"productId": "p1", "version": 2, "active": True},
+    "hero": {"productId": "p1", "version": -2, "active": True},
+    "v3": {"productId": "p2", "version": 1, "active": True},
+    "v4": {"productId": "p2", "version": 2, "active": False},
+    "v5": {"productId": "p3", "version": 1, "active": False},
+}
+# Representation entities by id
+_REPRESENTATIONS = {
+    "outdated": {"versionId": "v1", "active": True},
+    "latest": {"versionId": "v2", "active": True},
+    "hero": {"versionId": "hero", "active": True},
+    "inactive_last_version": {"versionId": "v3", "active": True},
+    "inactive": {"versionId": "v2", "active": False},
+    "inactive_version": {"versionId": "v5", "active": True},
+    "missing_version": {"versionId": "v6", "active": True},
+}
+_EXPECTED = {
+    "outdated": ("v1", True),
+    "latest": ("v2", False),
+    "hero": ("hero", False),
+    "inactive_last_version": ("v3", False),
+    "inactive_version": (None, False),
+    "missing_version": (None, False),
+}
+
+
+def _last_version_id(product_id):
+    versions = [
+        (version["version"], version_id)
+        for version_id, version in _VERSIONS.items()
+        if version["productId"] == product_id and version["version"] >= 0
+    ]
+    return max(versions)[1]
+
+
+def _version_data(version_id):
+    version = _VERSIONS.get(version_id)
+    if version is None:
+        return None
+    last_version_id = _last_version_id(version["productId"])
+    return {
+        "id": version_id,
+        "version": version["version"],
+        "active": version["active"],
+        "product": {
+            "id": version["productId"],
+            "latestVersion": {
+                "id": last_version_id,
+                "active": _VERSIONS[last_version_id]["active"],
+            },
+        },
+    }
+
+
+class _FakeQuery:
+    def set_variable_value(self, key, value):
+        pass
+
+    def query(self, con):
+        return {"project": {"representations": [
+            {
+                "id": repre_id,
+                "active": repre["active"],
+                "version": _version_data(repre["versionId"]),
+            }
+            for repre_id, repre in _REPRESENTATIONS.items()
+        ]}}
+
+
+class _FakeApi:
+    """Functions of 'ayon_api' used by separated queries.
+
+    Inactive entities are filtered out when 'active' is 'True', same as
+    in 'ayon_api'.
+    """
+    @staticmethod
+    def get_representations(
+        project_name, representation_ids, active=True, fields=None
+    ):
+        for repre_id in representation_ids:
+            repre = _REPRESENTATIONS.get(repre_id)
+            if repre and (active is None or repre["active"] is active):
+                yield {"id": repre_id, "versionId": repre["versionId"]}
+
+    @staticmethod
+    def get_versions(
+        project_name, version_ids, hero=True, active=True, fields=None
+    ):
+        for version_id in version_ids:
+            version = _VERSIONS.get(version_id)
+            if version and (active is None or version["active"] is active):
+                yield dict(version, id=version_id)
+
+    @staticmethod
+    def get_last_versions(
+        project_name, product_ids, active=True, fields=None
+    ):
+        output = {}
+        for product_id in product_ids:
+            version_id = _last_version_id(product_id)
+            version = _VERSIONS[version_id]
+            if active is not None and version["active"] is not active:
+                version = None
+            else:
+                version = dict(version, id=version_id)
+            output[product_id] = version
+        return output
+
+
+@pytest.fixture
+def fake_api(monkeypatch):
+    for name in (
+        "get_representations", "get_versions", "get_last_versions"
+    ):
+        monkeypatch.setattr(
+            utils.ayon_api, name, getattr(_FakeApi, name)
+        )
+    monkeypatch.setattr(
+        utils.ayon_api, "get_server_api_connection", lambda: None
+    )
+    monkeypatch.setattr(
+        utils, "_representations_versions_graphql_query", _FakeQuery
+    )
+
+
+def test_graphql_query_skips_inactive_entities(fake_api):
+    result = utils._query_representations_versions_info(
+        "project", list(_REPRESENTATIONS)
+    )
+
+    assert result == _EXPECTED
+
+
+def test_separated_queries_skip_inactive_entities(fake_api):
+    result = utils._query_representations_versions_info_separated(
+        "project", list(_REPRESENTATIONS)
+    )
+
+    assert result == _EXPECTED
+
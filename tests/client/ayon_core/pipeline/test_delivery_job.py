@@ -0,0 +1,232 @@
+import os
+import json
+
+import pytest
+
+from ayon_core.pipeline import delivery
+from ayon_core.pipeline.delivery import DeliveryJob, DeliveryFileItem
+
+
+@pytest.fixture
+def local_dir(tmp_path, monkeypatch):
+    dirpath = tmp_path / "local"
+    monkeypatch.setenv("AYON_LAUNCHER_LOCAL_DIR", str(dirpath))
+    return dirpath
+
+
+def _create_files(dirpath, count):
+    dirpath.mkdir(parents=True, exist_ok=True)
+    filepaths = []
+    for idx in range(count):
+        filepath = dirpath / "file.{:04}.exr".format(idx)
+        filepath.write_bytes("content {}".format(idx).encode())
+        filepaths.append(str(filepath))
+    return filepaths
+
+
+def _create_job(src_paths, dst_dir, job_id="job", **kwargs):
+    job = DeliveryJob(job_id, max_workers=2, **kwargs)
+    for src_path in src_paths:
+        job.add_file(
+            src_path,
+            str(dst_dir / os.path.basename(src_path)),
+            "repre_id"
+        )
+    return job
+
+
+class _FinishedEvents(list):
+    """Collect data of finished events.
+
+    Event system keeps only weak reference to callbacks so the object
+    must be kept alive by the test.
+    """
+    def __init__(self, job):
+        super().__init__()
+        job.add_event_callback("delivery.job.finished", self._on_finished)
+
+    def _on_finished(self, event):
+        self.append(event.data)
+
+
+def test_add_file_is_not_duplicated(local_dir):
+    job = DeliveryJob("job")
+    job.add_file("/src/a.exr", "/dst/a.exr")
+    job.add_file("/src/a.exr", "/dst/a.exr", "repre_id")
+    job.add_file("/src/a.exr", "/dst/b.exr")
+
+    assert len(job.items) == 2
+    assert job.items[0].repre_id is None
+
+
+def test_file_item_data_round_trip():
+    item = DeliveryFileItem(
+        "/src/a.exr", "/dst/a.exr", "repre_id",
+        DeliveryFileItem.failed_status, "error"
+    )
+    new_item = DeliveryFileItem.from_data(
+        json.loads(json.dumps(item.to_data()))
+    )
+
+    assert new_item.to_data() == item.to_data()
+    assert not new_item.finished
+
+
+def test_job_delivers_files(local_dir, tmp_path):
+    src_paths = _create_files(tmp_path / "src", 5)
+    job = _create_job(src_paths, tmp_path / "dst")
+    events = _FinishedEvents(job)
+
+    report_items = job.run()
+
+    assert not report_items
+    assert events[-1]["copied"] == 5
+    assert not events[-1]["stopped"]
+    # Manifest is removed when everything was delivered
+    assert not os.path.exists(job.manifest_path)
+    assert DeliveryJob.get_unfinished_job_ids() == []
+    for src_path in src_paths:
+        dst_path = tmp_path / "dst" / os.path.basename(src_path)
+        assert dst_path.read_bytes() == open(src_path, "rb").read()
+
+
+def test_stopped_job_is_resumed(local_dir, tmp_path):
+    src_paths = _create_files(tmp_path / "src", 5)
+    job = _create_job(src_paths, tmp_path / "dst")
+    events = _FinishedEvents(job)
+    job.add_event_callback("delivery.job.started", job.stop)
+
+    job.run()
+
+    assert events[-1]["stopped"]
+    assert events[-1]["copied"] == 0
+    assert os.path.exists(job.manifest_path)
+    assert DeliveryJob.get_unfinished_job_ids() == ["job"]
+
+    loaded_job = DeliveryJob.load("job")
+    assert (
+        [item.to_data() for item in loaded_job.items]
+        == [item.to_data() for item in job.items]
+    )
+    events = _FinishedEvents(loaded_job)
+    loaded_job.run()
+
+    assert events[-1]["copied"] == 5
+    assert not events[-1]["stopped"]
+    assert not os.path.exists(loaded_job.manifest_path)
+    assert DeliveryJob.load("job") is None
+
+
+def test_failed_job_resume_skips_finished_files(
+    local_dir, tmp_path, monkeypatch
+):
+    src_paths = _create_files(tmp_path / "src", 3)
+    missing_path = str(tmp_path / "src" / "missing.exr")
+    job = _create_job(src_paths + [missing_path], tmp_path / "dst")
+
+    report_items = job.run()
+
+    assert len(report_items["Failed to deliver file"]) == 1
+    # Job with failed files can be resumed
+    loaded_job = DeliveryJob.load("job")
+    statuses = {
+        os.path.basename(item.src_path): item.status
+        for item in loaded_job.items
+    }
+    assert statuses == {
+        "file.0000.exr": DeliveryFileItem.copied_status,
+        "file.0001.exr": DeliveryFileItem.copied_status,
+        "file.0002.exr": DeliveryFileItem.copied_status,
+        "missing.exr": DeliveryFileItem.failed_status,
+    }
+
+    copied_paths = []
+    copy_file = delivery._copy_file
+
+    def _copy_file(src_path, *args, **kwargs):
+        copied_paths.append(src_path)
+        return copy_file(src_path, *args, **kwargs)
+
+    monkeypatch.setattr(delivery, "_copy_file", _copy_file)
+    with open(missing_path, "wb") as stream:
+        stream.write(b"content")
+
+    events = _FinishedEvents(loaded_job)
+    report_items = loaded_job.run()
+
+    assert not report_items
+    # Only the file which was not delivered is processed
+    assert copied_paths == [missing_path]
+    assert events[-1]["copied"] == 4
+    assert DeliveryJob.get_unfinished_job_ids() == []
+
+
+def test_new_job_skips_delivered_files(local_dir, tmp_path):
+    src_paths = _create_files(tmp_path / "src", 3)
+    dst_dir = tmp_path / "dst"
+    _create_job(src_paths, dst_dir).run()
+
+    # Outdated destination file is replaced with 'overwrite'
+    outdated_path = dst_dir / "file.0001.exr"
+    outdated_path.unlink()
+    outdated_path.write_bytes(b"outdated")
+
+    job = _create_job(src_paths, dst_dir, "other_job", overwrite=True)
+    events = _FinishedEvents(job)
+    job.run()
+
+    assert events[-1]["skipped"] == 2
+    assert events[-1]["copied"] == 1
+    assert outdated_path.read_bytes() == b"content 1"
+
+
+def test_job_keeps_existing_files_by_default(local_dir, tmp_path):
+    src_paths = _create_files(tmp_path / "src", 3)
+    dst_dir = tmp_path / "dst"
+    dst_dir.mkdir()
+    existing_path = dst_dir / "file.0001.exr"
+    existing_path.write_bytes(b"changed at destination")
+
+    job = _create_job(src_paths, dst_dir)
+    events = _FinishedEvents(job)
+    job.run()
+
+    assert events[-1]["copied"] == 2
+    assert events[-1]["skipped"] == 1
+    assert existing_path.read_bytes() == b"changed at destination"
+
+    # Loaded job does not overwrite files either
+    existing_path.unlink()
+    existing_path.write_bytes(b"changed again")
+    job = _create_job(src_paths, dst_dir, "other_job")
+    job.add_event_callback("delivery.job.started", job.stop)
+    job.run()
+    loaded_job = DeliveryJob.load("other_job")
+    events = _FinishedEvents(loaded_job)
+    loaded_job.run()
+
+    assert events[-1]["skipped"] == 3
+    assert existing_path.read_bytes() == b"changed again"
+
+
+def test_copy_file_overwrite(tmp_path, monkeypatch):
+    def _create_hard_link(src_path, dst_path):
+        raise OSError("Hardlinks are not supported")
+
+    monkeypatch.setattr(delivery, "create_hard_link", _create_hard_link)
+    src_path = tmp_path / "src.exr"
+    dst_path = tmp_path / "dst.exr"
+    src_path.write_bytes(b"content")
+
+    assert delivery._copy_file(str(src_path), str(dst_path))
+    assert dst_path.read_bytes() == b"content"
+    # Already delivered file is skipped
+    assert not delivery._copy_file(str(src_path), str(dst_path), True)
+
+    dst_path.write_bytes(b"other")
+    assert not delivery._copy_file(str(src_path), str(dst_path))
+    assert dst_path.read_bytes() == b"other"
+    assert delivery._copy_file(str(src_path), str(dst_path), True)
+    assert dst_path.read_bytes() == b"content"
+    # Temporary files are not left behind
+    assert sorted(os.listdir(tmp_path)) == ["dst.exr", "src.exr"]
@@ -0,0 +1,117 @@
+import sys
+import logging
+import importlib
+
+import pytest
+
+import ayon_core.lib
+from ayon_core.plugins.publish import extract_burnin
+
+_FFPROBE_DATA = {
+    "streams": [{
+        "codec_type": "video",
+        "width": 1920,
+        "height": 1080,
+        "r_frame_rate": "25/1",
+    }],
+    "format": {},
+}
+
+
+@pytest.fixture
+def otio_burnin(monkeypatch):
+    """Burnin script module which does not need ffmpeg executable."""
+    monkeypatch.setattr(
+        ayon_core.lib, "get_ffmpeg_tool_args", lambda *args: list(args)
+    )
+    monkeypatch.delitem(
+        sys.modules, "ayon_core.scripts.otio_burnin", raising=False
+    )
+    module = importlib.import_module("ayon_core.scripts.otio_burnin")
+    yield module
+    sys.modules.pop("ayon_core.scripts.otio_burnin", None)
+
+
+class _Process:
+    def __init__(self, returncode, stdout, stderr):
+        self.returncode = returncode
+        self._output = (stdout, stderr)
+
+    def communicate(self):
+        return self._output
+
+
+def _fake_ffmpeg(monkeypatch, module, returncode, stdout, stderr):
+    monkeypatch.setattr(
+        module.subprocess,
+        "Popen",
+        lambda *args, **kwargs: _Process(returncode, stdout, stderr)
+    )
+
+
+def _render(module, tmp_path, logger=None):
+    module.burnins_from_data(
+        "input.mov",
+        str(tmp_path / "output.mov"),
+        {"frame_start": 1001, "frame_end": 1010},
+        options={"font": __file__, "font_size": 42},
+        burnin_values={"TOP_LEFT": "static"},
+        codec_data=["-codec:v", "prores"],
+        logger=logger,
+    )
+
+
+def test_output_is_logged_with_logger(
+    otio_burnin, monkeypatch, tmp_path, caplog, capsys
+):
+    monkeypatch.setattr(
+        otio_burnin, "_get_ffprobe_data", lambda path: _FFPROBE_DATA
+    )
+    _fake_ffmpeg(monkeypatch, otio_burnin, 1, b"", b"Invalid argument")
+    logger = logging.getLogger("test_burnin")
+
+    with caplog.at_level(logging.DEBUG, logger="test_burnin"):
+        with pytest.raises(RuntimeError) as exc_info:
+            _render(otio_burnin, tmp_path, logger)
+
+    messages = [record.getMessage() for record in caplog.records]
+    assert any(msg.startswith("Launching command:") for msg in messages)
+    assert "Invalid argument" in messages
+    # Error contains output of ffmpeg
+    assert "Invalid argument" in str(exc_info.value)
+    assert not capsys.readouterr().out
+
+
+def test_output_is_printed_without_logger(
+    otio_burnin, monkeypatch, tmp_path, capsys
+):
+    monkeypatch.setattr(
+        otio_burnin, "_get_ffprobe_data", lambda path: _FFPROBE_DATA
+    )
+    _fake_ffmpeg(monkeypatch, otio_burnin, 1, b"", b"Invalid argument")
+
+    with pytest.raises(RuntimeError):
+        _render(otio_burnin, tmp_path)
+
+    output = capsys.readouterr().out
+    assert "Launching command:" in output
+    assert "Invalid argument" in output
+
+
+def test_plugin_passes_logger_in_process(otio_burnin, monkeypatch):
+    loggers = []
+
+    def _burnins_from_data(*args, **kwargs):
+        loggers.append(kwargs["logger"])
+
+    monkeypatch.setattr(otio_burnin, "burnins_from_data", _burnins_from_data)
+    plugin = extract_burnin.ExtractBurnin()
+    plugin.in_process = True
+    plugin.max_parallel_burnins = 2
+    plugin._render_burnins([
+        {"input": "input.mov", "output": "output.{}.mov".format(idx),
+         "burnin_data": {}}
+        for idx in range(2)
+    ])
+
+    assert loggers == [plugin.log, plugin.log]
@@ -0,0 +1,76 @@
+from datetime import datetime, timezone, timedelta
+
+import pytest
+
+import ayon_core.lib
+from ayon_core.settings import lib as settings_lib
+from ayon_core.settings.lib import _SettingsDiskCache
+
+# Server clock is behind clock of this machine
+_SERVER_TIME = datetime.now(timezone.utc) - timedelta(minutes=5)
+
+
+@pytest.fixture
+def server(monkeypatch, tmp_path):
+    monkeypatch.setenv("AYON_LAUNCHER_LOCAL_DIR", str(tmp_path))
+    events_filters = []
+    server_events = []
+
+    def _get_events(topics, newer_than, fields, limit):
+        events_filters.append(newer_than)
+        return [
+            {"id": event_id}
+            for event_id, created_at in server_events
+            if created_at > newer_than
+        ]
+
+    monkeypatch.setattr(settings_lib.ayon_api, "get_events", _get_events)
+    monkeypatch.setattr(
+        ayon_core.lib, "get_server_time", lambda: _SERVER_TIME
+    )
+    return events_filters, server_events
+
+
+def test_cache_time_is_server_time(server):
+    cached_at = datetime.fromisoformat(_SettingsDiskCache.get_cache_time())
+
+    assert cached_at == _SERVER_TIME - timedelta(
+        seconds=_SettingsDiskCache.time_margin
+    )
+
+
+def test_event_created_after_cache_invalidates(server):
+    events_filters, server_events = server
+    cached_at = _SettingsDiskCache.get_cache_time()
+
+    assert _SettingsDiskCache.is_valid(cached_at)
+    assert events_filters == [cached_at]
+
+    # Event created on server right after settings were queried
+    server_events.append(("event", _SERVER_TIME.isoformat()))
+    assert not _SettingsDiskCache.is_valid(cached_at)
+
+
+def test_old_cache_is_invalid(server):
+    events_filters, _ = server
+    cached_at = (
+        _SERVER_TIME - timedelta(seconds=_SettingsDiskCache.max_age + 1)
+    ).isoformat()
+
+    assert not _SettingsDiskCache.is_valid(cached_at)
+    assert not _SettingsDiskCache.is_valid(None)
+    assert not _SettingsDiskCache.is_valid("invalid")
+    # Server is not asked for events
+    assert not events_filters
+
+
+def test_disk_cache_round_trip(server):
+    key = ("http://server", "user", "bundle", "production", "site", None)
+    value = {"core": {"key": "value"}}
+    cached_at = _SettingsDiskCache.get_cache_time()
+
+    assert _SettingsDiskCache.load(key) is None
+    _SettingsDiskCache.save(key, value, cached_at)
+
+    assert _SettingsDiskCache.load(key) == (value, cached_at)
+    assert _SettingsDiskCache.load(key[:-1] + ("project", )) is None